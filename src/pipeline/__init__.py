@@ -0,0 +1 @@
+"""Dependency-aware scheduler for the stage A/B/C pipeline."""
@@ -0,0 +1,47 @@
+"""Configuration management for the pipeline scheduler."""
+
+from __future__ import annotations
+
+import dataclasses
+from pathlib import Path
+
+import yaml
+
+
+@dataclasses.dataclass
+class PipelineConfig:
+    """Configuration for the pipeline scheduler."""
+
+    # Fingerprints of completed tasks (what makes reruns incremental)
+    state_path: Path
+
+    # Stage A source: "wrds", "alpaca" or "csv" (reads the matching stage_a* section)
+    source: str = "wrds"
+
+    # Stages to run by default
+    stages: list[str] = dataclasses.field(default_factory=lambda: ["a", "b", "c"])
+
+    # Max concurrent tasks per resource
+    resources: dict[str, int] = dataclasses.field(
+        default_factory=lambda: {"wrds": 1, "alpaca": 2, "cpu": 4}
+    )
+
+
+def load_config(config_path: str) -> PipelineConfig:
+    """Load configuration from YAML file."""
+    with open(config_path, "r", encoding="utf-8") as f:
+        raw = yaml.safe_load(f)
+
+    pipeline = raw.get("pipeline", {})
+    stage_b = raw.get("stage_b", {})
+    derived_root = Path(stage_b.get("parquet_derived_root", "/Volumes/Data/parquet_derived"))
+
+    resources = {"wrds": 1, "alpaca": 2, "cpu": 4}
+    resources.update(pipeline.get("resources") or {})
+
+    return PipelineConfig(
+        state_path=Path(pipeline.get("state_path", derived_root / "_pipeline_state.json")),
+        source=pipeline.get("source", "wrds"),
+        stages=pipeline.get("stages", ["a", "b", "c"]),
+        resources=resources,
+    )
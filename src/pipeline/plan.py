@@ -0,0 +1,310 @@
+"""Build the task graph for stages A, B and C over a set of trade dates."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+from ..stage_a.manifest import update_manifest
+from ..stage_a.partitions import (
+    date_partition_dir,
+    list_symbol_partitions,
+    symbol_dir_name,
+    symbol_partition_dir,
+)
+from ..stage_a_alpaca.checkpoint import CHECKPOINT_FILE, SUCCESS_FILE
+from ..stage_b.config import StageBConfig
+from ..stage_b.config import load_config as load_stage_b_config
+from ..stage_b.stage_b import DATASET as ENRICHED_DATASET
+from ..stage_b.stage_b import STAGE_B_VERSION, EnrichTask, enrich_partition
+from ..stage_c.config import StageCConfig
+from ..stage_c.config import load_config as load_stage_c_config
+from ..stage_c.stage_c import STAGE_C_VERSION, build_stage_c, dataset_for
+from .tasks import Task, TaskKey, TaskResult
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("a", "b", "c")
+SOURCES = ("wrds", "alpaca", "csv")
+
+# Concurrency pool each stage A source draws from
+SOURCE_RESOURCES = {"wrds": "wrds", "alpaca": "alpaca", "csv": "cpu"}
+
+# Per-symbol stage B tasks run on scheduler threads; manifest merges are read-modify-write
+_MANIFEST_LOCK = threading.Lock()
+
+
+def _raw_files(raw_root: Path, trade_date: date, symbol: Optional[str] = None) -> list[Path]:
+    """Raw trades + NBBO parquet files for a date (optionally one symbol)."""
+    files = []
+    for data_type in ("trades", "nbbo"):
+        parts = list_symbol_partitions(date_partition_dir(raw_root, data_type, trade_date))
+        for sym, part_dir in sorted(parts.items()):
+            if symbol is None or sym == symbol:
+                files.extend(sorted(part_dir.glob("*.parquet")))
+    return files
+
+
+def _partition_complete(part_dir: Path) -> bool:
+    """True if a raw symbol partition was finished (legacy ones predate _SUCCESS)."""
+    if (part_dir / SUCCESS_FILE).exists():
+        return True
+    return not (part_dir / CHECKPOINT_FILE).exists() and any(part_dir.glob("*.parquet"))
+
+
+def _has_raw_partitions(
+    raw_root: Path,
+    trade_date: date,
+    data_types: list[str],
+    symbols: Optional[list[str]] = None,
+) -> bool:
+    """
+    True if stage A's output for a date is complete on disk.
+
+    Every partition present must be finished, and each requested symbol must
+    have one for every data type. Without a symbol list (the source picks the
+    universe) only the first condition can be checked; failed symbols are then
+    caught by the task failing, which stops it being recorded as done.
+    """
+    for data_type in data_types:
+        parts = list_symbol_partitions(date_partition_dir(raw_root, data_type, trade_date))
+        if not parts or not all(_partition_complete(d) for d in parts.values()):
+            return False
+        if symbols is not None and not set(symbols) <= parts.keys():
+            return False
+    return True
+
+
+def _stage_a_task(
+    config_path: str,
+    source: str,
+    trade_date: date,
+    symbols: Optional[list[str]],
+    data_types: list[str],
+) -> Task:
+    """Stage A extraction for one date from the configured source."""
+    key = TaskKey("a", trade_date)
+
+    # Source modules are imported lazily so e.g. the wrds package is only
+    # needed when WRDS is actually the source
+    if source == "wrds":
+        from ..stage_a.config import load_config
+
+        config = load_config(config_path)
+
+        def run() -> TaskResult:
+            from ..stage_a.stage_a import extract_stage_a
+            from ..stage_a.wrds_extractor import WRDSExtractor
+
+            run_symbols = symbols
+            # One connection for the availability check, symbol lookup and extraction
+            with WRDSExtractor(config) as extractor:
+                if not extractor.check_tables_available(trade_date, data_types):
+                    return TaskResult(skipped_reason="TAQ tables not available on WRDS")
+                if run_symbols is None:
+                    run_symbols = extractor.get_default_symbols(trade_date)
+                results = extract_stage_a(
+                    config, trade_date, run_symbols, data_types=data_types, resume=True, extractor=extractor
+                )
+            return TaskResult(rows=sum(results.values()))
+
+    elif source == "alpaca":
+        from ..stage_a_alpaca.config import load_config
+
+        config = load_config(config_path)
+
+        def run() -> TaskResult:
+            from ..stage_a_alpaca.stage_a_alpaca import extract_stage_a_alpaca
+            from ..stage_a_alpaca.symbol_discovery import discover_symbols_from_taq
+
+            run_symbols = symbols
+            if run_symbols is None:
+                if config.taq_parquet_root is None:
+                    return TaskResult(skipped_reason="no symbols given and taq_parquet_root not configured")
+                run_symbols = discover_symbols_from_taq(
+                    config.taq_parquet_root, trade_date, write_manifest_on_scan=config.taq_manifest_writes
+                )
+                if not run_symbols:
+                    return TaskResult(skipped_reason="no TAQ symbols to discover from")
+            # Raise on failed symbols so the day is retried rather than recorded as done
+            results = extract_stage_a_alpaca(
+                config, trade_date, run_symbols, data_types=data_types, resume=True, raise_on_error=True
+            )
+            return TaskResult(rows=sum(results.values()))
+
+    elif source == "csv":
+        from ..stage_a_csv.config import load_config
+
+        config = load_config(config_path)
+
+        def run() -> TaskResult:
+            from ..stage_a_csv.stage_a_csv import extract_stage_a_csv
+
+            results = extract_stage_a_csv(config, trade_date, symbols, data_types=data_types, resume=True)
+            return TaskResult(rows=sum(results.values()))
+
+    else:
+        raise ValueError(f"Unknown stage A source: {source}. Valid sources: {SOURCES}")
+
+    return Task(
+        key=key,
+        run=run,
+        resource=SOURCE_RESOURCES[source],
+        outputs_exist=lambda: _has_raw_partitions(config.parquet_raw_root, trade_date, data_types, symbols),
+        params={"source": source, "symbols": sorted(symbols) if symbols else None, "data_types": sorted(data_types)},
+    )
+
+
+def _stage_b_symbol_task(config: StageBConfig, trade_date: date, symbol: str, deps: list[TaskKey]) -> Task:
+    """Stage B enrichment of one (date, symbol) partition."""
+    trades_dir = symbol_partition_dir(config.parquet_raw_root, "trades", trade_date, symbol)
+    nbbo_dir = symbol_partition_dir(config.parquet_raw_root, "nbbo", trade_date, symbol)
+    output_dir = symbol_partition_dir(config.parquet_derived_root, ENRICHED_DATASET, trade_date, symbol)
+
+    def run() -> TaskResult:
+        # Raw directories may use the legacy tuple naming; resolve them now that stage A is done
+        trades_parts = list_symbol_partitions(trades_dir.parent)
+        nbbo_parts = list_symbol_partitions(nbbo_dir.parent)
+        if symbol not in trades_parts or symbol not in nbbo_parts:
+            return TaskResult(skipped_reason="missing raw trades or NBBO")
+        output_dir.parent.mkdir(parents=True, exist_ok=True)
+        # The scheduler has already decided the partition is stale
+        _, rows = enrich_partition(EnrichTask(
+            trade_date=trade_date,
+            symbol=symbol,
+            trades_dir=trades_parts[symbol],
+            nbbo_dir=nbbo_parts[symbol],
+            output_dir=output_dir,
+            compression=config.compression,
+            drop_invalid_nbbo=config.drop_invalid_nbbo,
+            overwrite=True,
+        ))
+        with _MANIFEST_LOCK:
+            update_manifest(config.parquet_derived_root, ENRICHED_DATASET, trade_date, {symbol: rows})
+        return TaskResult(rows=rows)
+
+    return Task(
+        key=TaskKey("b", trade_date, symbol),
+        run=run,
+        deps=deps,
+        inputs=lambda: _raw_files(config.parquet_raw_root, trade_date, symbol),
+        outputs_exist=lambda: (output_dir / "_SUCCESS").exists(),
+        params={"version": STAGE_B_VERSION, "drop_invalid_nbbo": config.drop_invalid_nbbo},
+    )
+
+
+def _stage_b_expand_task(
+    config: StageBConfig,
+    trade_date: date,
+    symbols: Optional[list[str]],
+    deps: list[TaskKey],
+) -> Task:
+    """
+    Emit one stage B task per symbol once stage A has written the day.
+
+    The symbol set is only known after extraction, so this task lists the raw
+    partitions and adds the per-symbol tasks to the running graph.
+    """
+    output_date_dir = date_partition_dir(config.parquet_derived_root, ENRICHED_DATASET, trade_date)
+
+    def day_symbols() -> list[str]:
+        trades_parts = list_symbol_partitions(date_partition_dir(config.parquet_raw_root, "trades", trade_date))
+        nbbo_parts = list_symbol_partitions(date_partition_dir(config.parquet_raw_root, "nbbo", trade_date))
+        available = set(trades_parts) & set(nbbo_parts)
+        return sorted(available if symbols is None else available & set(symbols))
+
+    def run() -> TaskResult:
+        new_tasks = [_stage_b_symbol_task(config, trade_date, s, deps) for s in day_symbols()]
+        if not new_tasks:
+            return TaskResult(skipped_reason="no partitions with both trades and NBBO")
+        return TaskResult(new_tasks=new_tasks)
+
+    def outputs_exist() -> bool:
+        return all((output_date_dir / symbol_dir_name(s) / "_SUCCESS").exists() for s in day_symbols())
+
+    return Task(
+        key=TaskKey("b", trade_date),
+        run=run,
+        deps=deps,
+        inputs=lambda: _raw_files(config.parquet_raw_root, trade_date),
+        outputs_exist=outputs_exist,
+        params={"symbols": sorted(symbols) if symbols else None},
+    )
+
+
+def _stage_c_task(config: StageCConfig, trade_date: date, deps: list[TaskKey]) -> Task:
+    """Stage C bars (all configured levels) for one date."""
+
+    def run() -> TaskResult:
+        results = build_stage_c(config, trade_date, overwrite=True)
+        if not results:
+            return TaskResult(skipped_reason="no bars built")
+        return TaskResult(rows=sum(results.values()))
+
+    def outputs_exist() -> bool:
+        return all(
+            (date_partition_dir(config.parquet_derived_root, dataset_for(level), trade_date) / "_SUCCESS").exists()
+            for level in config.bar_sizes
+        )
+
+    return Task(
+        key=TaskKey("c", trade_date),
+        run=run,
+        deps=deps,
+        inputs=lambda: _raw_files(config.parquet_raw_root, trade_date),
+        outputs_exist=outputs_exist,
+        params={"version": STAGE_C_VERSION, "bar_sizes": sorted(config.bar_sizes), "timezone": config.timezone},
+    )
+
+
+def build_tasks(
+    config_path: str,
+    trade_dates: list[date],
+    stages: list[str],
+    source: str = "wrds",
+    symbols: Optional[list[str]] = None,
+    data_types: Optional[list[str]] = None,
+) -> list[Task]:
+    """
+    Build the task graph for a set of trade dates.
+
+    Per date: stage A extraction -> stage B enrichment (one task per symbol,
+    emitted once the day's symbols are known) and stage C bars, both depending
+    only on that date's stage A, so different days progress independently.
+
+    Args:
+        config_path: Path to config YAML file (stage sections are read from it)
+        trade_dates: Trade dates to process
+        stages: Stages to include ("a", "b", "c")
+        source: Stage A source ("wrds", "alpaca" or "csv")
+        symbols: Symbols to process (None = source default / everything on disk)
+        data_types: Stage A data types (default: ["trades", "nbbo"])
+
+    Returns:
+        List of tasks
+    """
+    invalid = set(stages) - set(STAGES)
+    if invalid:
+        raise ValueError(f"Invalid stages: {invalid}. Valid stages: {STAGES}")
+    if data_types is None:
+        data_types = ["trades", "nbbo"]
+
+    stage_b_config = load_stage_b_config(config_path) if "b" in stages else None
+    stage_c_config = load_stage_c_config(config_path) if "c" in stages else None
+
+    tasks = []
+    for trade_date in trade_dates:
+        # Without a stage A task in the run, the dependency is treated as satisfied
+        deps = [TaskKey("a", trade_date)]
+        if "a" in stages:
+            tasks.append(_stage_a_task(config_path, source, trade_date, symbols, data_types))
+        if stage_b_config is not None:
+            tasks.append(_stage_b_expand_task(stage_b_config, trade_date, symbols, deps))
+        if stage_c_config is not None:
+            tasks.append(_stage_c_task(stage_c_config, trade_date, deps))
+
+    logger.info(f"Planned {len(tasks)} tasks for {len(trade_dates)} days (stages {', '.join(stages)})")
+    return tasks
@@ -0,0 +1,145 @@
+"""CLI entry point for the dependency-aware pipeline (stages A -> B, C)."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from ..stage_a.date_utils import filter_trading_days, get_date_range
+from .config import load_config
+from .plan import SOURCES, STAGES, build_tasks
+from .scheduler import FAILED, Scheduler
+from .state import PipelineState
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
+    handlers=[
+        logging.StreamHandler(),
+    ],
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_symbols(symbols_str: str) -> list[str]:
+    """Parse comma-separated symbols or read from file."""
+    if Path(symbols_str).exists():
+        # Read from file (one symbol per line)
+        with open(symbols_str, "r") as f:
+            return [line.strip().upper() for line in f if line.strip()]
+    else:
+        # Comma-separated list
+        return [s.strip().upper() for s in symbols_str.split(",") if s.strip()]
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Run stages A, B and C as one dependency-aware, incremental pipeline",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Extract, enrich and build bars for a week
+  python -m src.pipeline.run --start-date 2024-06-10 --end-date 2024-06-14 --config config.yaml
+
+  # Only rebuild derived data (B and C) for days already extracted
+  python -m src.pipeline.run --start-date 2024-06-10 --end-date 2024-06-14 --stages b,c --config config.yaml
+
+  # Use Alpaca as the stage A source for two symbols
+  python -m src.pipeline.run --date 2024-06-10 --source alpaca --symbols AAPL,MSFT --config config.yaml
+        """,
+    )
+
+    parser.add_argument(
+        "--date",
+        help="Single trade date in YYYY-MM-DD format (mutually exclusive with --start-date/--end-date)",
+    )
+    parser.add_argument(
+        "--start-date",
+        help="Start date for date range (YYYY-MM-DD, inclusive). Requires --end-date",
+    )
+    parser.add_argument(
+        "--end-date",
+        help="End date for date range (YYYY-MM-DD, inclusive). Requires --start-date",
+    )
+    parser.add_argument(
+        "--symbols",
+        default=None,
+        help="Comma-separated symbols or path to file with one symbol per line. "
+             "If not provided, the stage A source picks its default universe",
+    )
+    parser.add_argument(
+        "--stages",
+        default=None,
+        help="Comma-separated stages to run, from a, b, c (overrides pipeline.stages)",
+    )
+    parser.add_argument(
+        "--source",
+        choices=SOURCES,
+        default=None,
+        help="Stage A source (overrides pipeline.source)",
+    )
+    parser.add_argument(
+        "--config",
+        required=True,
+        help="Path to config YAML file",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rerun every task even if its inputs are unchanged",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable verbose logging",
+    )
+
+    args = parser.parse_args()
+
+    if args.date is None and not (args.start_date and args.end_date):
+        parser.error("Must provide either --date OR both --start-date and --end-date")
+    if args.date is not None and (args.start_date or args.end_date):
+        parser.error("--date cannot be used with --start-date or --end-date")
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    try:
+        config = load_config(args.config)
+        logger.info(f"Loaded config from {args.config}")
+        logger.info(f"  State: {config.state_path}")
+    except Exception as e:
+        logger.error(f"Error loading config: {e}")
+        sys.exit(1)
+
+    stages = [s.strip().lower() for s in args.stages.split(",")] if args.stages else config.stages
+    if set(stages) - set(STAGES):
+        parser.error(f"--stages must be a subset of {','.join(STAGES)}")
+    source = args.source or config.source
+    symbols = parse_symbols(args.symbols) if args.symbols else None
+
+    if args.date:
+        trade_dates = filter_trading_days([datetime.fromisoformat(args.date).date()])
+    else:
+        start_date = datetime.fromisoformat(args.start_date).date()
+        end_date = datetime.fromisoformat(args.end_date).date()
+        trade_dates = filter_trading_days(get_date_range(start_date, end_date))
+
+    try:
+        tasks = build_tasks(args.config, trade_dates, stages, source=source, symbols=symbols)
+        scheduler = Scheduler(PipelineState(config.state_path), config.resources, force=args.force)
+        status = scheduler.run(tasks)
+    except Exception as e:
+        logger.error(f"Pipeline failed: {e}", exc_info=True)
+        sys.exit(1)
+
+    if any(outcome == FAILED for outcome in status.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""Run a DAG of pipeline tasks in parallel with per-resource concurrency limits."""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Optional
+
+from ..stage_b.fingerprint import compute_fingerprint
+from .state import PipelineState
+from .tasks import Task, TaskKey, TaskResult
+
+logger = logging.getLogger(__name__)
+
+# Task outcomes
+SUCCEEDED = "succeeded"  # Ran and finished
+UP_TO_DATE = "up_to_date"  # Inputs unchanged since the last success, not rerun
+SKIPPED = "skipped"  # Ran but found nothing to do (dependents are not run)
+FAILED = "failed"  # Raised an exception
+BLOCKED = "blocked"  # A dependency failed or was skipped
+
+_SATISFIED = {SUCCEEDED, UP_TO_DATE}
+
+
+class Scheduler:
+    """
+    Execute tasks once their dependencies are satisfied.
+
+    Ready tasks run on a thread pool (the heavy work inside stages already runs
+    in Polars' native threads or in process pools), but no more than
+    ``limits[resource]`` tasks per resource run at once, so e.g. a single WRDS
+    connection, two Alpaca streams and four CPU-bound builds can overlap.
+
+    Before running, a task's input files and params are fingerprinted; if the
+    fingerprint matches the last success recorded in the state and the output
+    still exists, the task is considered up to date. Upstream tasks that rerun
+    rewrite their outputs, which changes the downstream fingerprints, so only
+    invalidated partitions are recomputed.
+
+    Dependencies on keys that are not part of the run are treated as satisfied
+    (e.g. running only stage B/C on raw data that already exists).
+    """
+
+    def __init__(
+        self,
+        state: PipelineState,
+        limits: dict[str, int],
+        force: bool = False,
+    ):
+        self.state = state
+        self.limits = dict(limits)
+        self.force = force
+
+    def _limit(self, resource: str) -> int:
+        return max(1, self.limits.get(resource, 1))
+
+    def _fingerprint(self, task: Task) -> Optional[str]:
+        try:
+            inputs = task.inputs() if task.inputs else []
+            return compute_fingerprint(inputs, {"task": str(task.key), **task.params})
+        except OSError as e:
+            logger.debug(f"  {task.key}: cannot fingerprint inputs ({e}), will run")
+            return None
+
+    def _execute(self, task: Task) -> tuple[str, Optional[TaskResult], float]:
+        """Run one task in a worker thread; returns (status, result, seconds)."""
+        start = time.perf_counter()
+        fingerprint = self._fingerprint(task)
+        if (
+            not self.force
+            and fingerprint is not None
+            and self.state.fingerprint(task.key) == fingerprint
+            and (task.outputs_exist is None or task.outputs_exist())
+        ):
+            return UP_TO_DATE, None, time.perf_counter() - start
+
+        self.state.invalidate(task.key)
+        result = task.run() or TaskResult()
+        if result.skipped_reason is not None:
+            return SKIPPED, result, time.perf_counter() - start
+        if fingerprint is not None:
+            self.state.record_success(task.key, fingerprint, result.rows)
+        return SUCCEEDED, result, time.perf_counter() - start
+
+    def run(self, tasks: list[Task]) -> dict[TaskKey, str]:
+        """
+        Run tasks (and any tasks they add) to completion.
+
+        Args:
+            tasks: Tasks to schedule
+
+        Returns:
+            Dictionary mapping each task key to its outcome
+        """
+        graph: dict[TaskKey, Task] = {}
+        for task in tasks:
+            graph[task.key] = task
+        status: dict[TaskKey, str] = {}
+        pending: list[TaskKey] = list(graph)
+        running: dict[Future, TaskKey] = {}
+        in_use: dict[str, int] = {}
+        start = time.perf_counter()
+
+        def dep_state(key: TaskKey) -> str:
+            if key not in graph:
+                return UP_TO_DATE
+            return status.get(key, "")
+
+        logger.info(f"Pipeline: {len(graph)} tasks, limits {self.limits}")
+
+        with ThreadPoolExecutor(max_workers=sum(self._limit(r) for r in self.limits) or 1) as pool:
+            while pending or running:
+                still_pending = []
+                for key in pending:
+                    task = graph[key]
+                    dep_states = [dep_state(d) for d in task.deps]
+                    if any(s in (FAILED, BLOCKED, SKIPPED) for s in dep_states):
+                        status[key] = BLOCKED
+                        logger.warning(f"  ⊘ {key}: blocked by an upstream task")
+                    elif all(s in _SATISFIED for s in dep_states) and in_use.get(task.resource, 0) < self._limit(task.resource):
+                        in_use[task.resource] = in_use.get(task.resource, 0) + 1
+                        running[pool.submit(self._execute, task)] = key
+                    else:
+                        still_pending.append(key)
+                pending = still_pending
+
+                if not running:
+                    if pending:
+                        # Dependencies that can never be satisfied (e.g. a cycle)
+                        for key in pending:
+                            status[key] = BLOCKED
+                            logger.error(f"  ✗ {key}: unsatisfiable dependencies")
+                        pending = []
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = running.pop(future)
+                    task = graph[key]
+                    in_use[task.resource] -= 1
+                    try:
+                        outcome, result, seconds = future.result()
+                    except Exception as e:
+                        status[key] = FAILED
+                        logger.error(f"  ✗ {key}: {e}", exc_info=True)
+                        continue
+
+                    status[key] = outcome
+                    if outcome == UP_TO_DATE:
+                        logger.info(f"  = {key}: up to date")
+                    elif outcome == SKIPPED:
+                        logger.info(f"  ⊘ {key}: {result.skipped_reason}")
+                    elif result.new_tasks:
+                        logger.info(f"  ✓ {key}: added {len(result.new_tasks)} tasks")
+                    else:
+                        logger.info(f"  ✓ {key}: {result.rows:,} rows in {seconds:.1f}s")
+
+                    for new_task in (result.new_tasks if result else []):
+                        if new_task.key not in graph:
+                            graph[new_task.key] = new_task
+                            pending.append(new_task.key)
+
+        counts: dict[str, int] = {}
+        for outcome in status.values():
+            counts[outcome] = counts.get(outcome, 0) + 1
+        logger.info(f"Pipeline finished in {time.perf_counter() - start:.1f}s: "
+                    + ", ".join(f"{n} {outcome}" for outcome, n in sorted(counts.items())))
+        return status
@@ -0,0 +1,64 @@
+"""Persisted pipeline state: the fingerprint each task last succeeded with."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from .tasks import TaskKey
+
+logger = logging.getLogger(__name__)
+
+
+class PipelineState:
+    """
+    JSON-backed record of completed tasks, keyed by str(TaskKey).
+
+    Saved atomically (temp file + rename) after every change so an interrupted
+    run keeps everything that finished.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._tasks: dict[str, dict] = {}
+        if self.path.exists():
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._tasks = json.load(f).get("tasks", {})
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable pipeline state {self.path}: {e}")
+
+    def fingerprint(self, key: TaskKey) -> Optional[str]:
+        """Fingerprint of the last successful run of a task, if any."""
+        with self._lock:
+            entry = self._tasks.get(str(key))
+        return entry.get("fingerprint") if entry else None
+
+    def record_success(self, key: TaskKey, fingerprint: str, rows: int) -> None:
+        """Record a successful run and persist the state."""
+        with self._lock:
+            self._tasks[str(key)] = {
+                "fingerprint": fingerprint,
+                "rows": rows,
+                "finished_at": datetime.now(tz=timezone.utc).isoformat(),
+            }
+            self._save()
+
+    def invalidate(self, key: TaskKey) -> None:
+        """Forget a task so it reruns (e.g. after a failure)."""
+        with self._lock:
+            if self._tasks.pop(str(key), None) is not None:
+                self._save()
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"tasks": self._tasks}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,57 @@
+"""Task model for the pipeline DAG."""
+
+from __future__ import annotations
+
+import dataclasses
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, Optional
+
+
+class TaskKey(NamedTuple):
+    """Identity of a unit of work: (stage, trade_date, symbol); symbol is None for whole-day tasks."""
+
+    stage: str
+    trade_date: date
+    symbol: Optional[str] = None
+
+    def __str__(self) -> str:
+        parts = [self.stage, self.trade_date.isoformat()]
+        if self.symbol is not None:
+            parts.append(self.symbol)
+        return "/".join(parts)
+
+
+@dataclasses.dataclass
+class TaskResult:
+    """What a task run produced."""
+
+    rows: int = 0
+    # Tasks discovered while running (e.g. per-symbol work once the symbols are known)
+    new_tasks: list["Task"] = dataclasses.field(default_factory=list)
+    # Set if the task decided there was nothing to do (e.g. source data not published yet)
+    skipped_reason: Optional[str] = None
+
+
+@dataclasses.dataclass
+class Task:
+    """
+    One node in the pipeline DAG.
+
+    Attributes:
+        key: Task identity
+        run: Does the work; returns a TaskResult (or None)
+        deps: Keys of tasks that must succeed first
+        resource: Concurrency pool the task draws from ("wrds", "alpaca", "cpu", ...)
+        inputs: Returns the input files to fingerprint, evaluated after deps finish
+        outputs_exist: Returns True if the task's output is present on disk
+        params: Parameters that change the output (part of the fingerprint)
+    """
+
+    key: TaskKey
+    run: Callable[[], Optional[TaskResult]]
+    deps: list[TaskKey] = dataclasses.field(default_factory=list)
+    resource: str = "cpu"
+    inputs: Optional[Callable[[], list[Path]]] = None
+    outputs_exist: Optional[Callable[[], bool]] = None
+    params: dict[str, Any] = dataclasses.field(default_factory=dict)
@@ -0,0 +1 @@
+"""SQL queries over the partitioned Parquet datasets."""
@@ -0,0 +1,55 @@
+"""Configuration management for the query layer."""
+
+from __future__ import annotations
+
+import dataclasses
+from pathlib import Path
+from typing import Optional
+
+import yaml
+
+# Stage A config section -> source name (as in {data_root}/{source}/parquet_raw)
+SOURCE_SECTIONS = {
+    "stage_a": "taq",
+    "stage_a_alpaca": "alpaca",
+    "stage_a_alpaca_iex": "alpaca_iex",
+    "stage_a_csv": "csv",
+}
+
+
+@dataclasses.dataclass
+class QueryConfig:
+    """Configuration for the query layer."""
+
+    # Source name -> parquet_raw root; tables are {source}_{dataset}
+    sources: dict[str, Path] = dataclasses.field(default_factory=dict)
+
+    # Stage B/C output; tables are named after the dataset (enriched_trades, bars_1m, ...)
+    parquet_derived_root: Optional[Path] = None
+
+
+def load_config(config_path: str) -> QueryConfig:
+    """
+    Load configuration from YAML file.
+
+    Sources default to the parquet_raw_root of each stage A section present in
+    the file; a ``query.sources`` mapping overrides or adds to them.
+    """
+    with open(config_path, "r", encoding="utf-8") as f:
+        raw = yaml.safe_load(f)
+
+    query = raw.get("query", {}) or {}
+
+    sources = {
+        source: Path(raw[section]["parquet_raw_root"])
+        for section, source in SOURCE_SECTIONS.items()
+        if (raw.get(section) or {}).get("parquet_raw_root")
+    }
+    sources.update({name: Path(path) for name, path in (query.get("sources") or {}).items()})
+
+    derived_root = query.get("parquet_derived_root", (raw.get("stage_b") or {}).get("parquet_derived_root"))
+
+    return QueryConfig(
+        sources=sources,
+        parquet_derived_root=Path(derived_root) if derived_root else None,
+    )
@@ -0,0 +1,281 @@
+"""Polars SQL over the hive-partitioned Parquet trees, with partition pruning."""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+import polars as pl
+
+from ..stage_a.partitions import SYMBOL_DIR_PREFIX, list_symbol_partitions, symbol_dir_name
+from ..stage_a.schemas import RAW_SCHEMAS
+from .config import QueryConfig
+
+logger = logging.getLogger(__name__)
+
+_DATE_DIR_PREFIX = "trade_date="
+
+
+def _list_dates(dataset_dir: Path) -> dict[date, Path]:
+    """Map each trade date to its directory under a dataset (one scandir)."""
+    dates: dict[date, Path] = {}
+    try:
+        entries = os.scandir(dataset_dir)
+    except FileNotFoundError:
+        return dates
+    with entries:
+        for entry in entries:
+            if not entry.name.startswith(_DATE_DIR_PREFIX) or not entry.is_dir():
+                continue
+            try:
+                dates[date.fromisoformat(entry.name[len(_DATE_DIR_PREFIX):])] = Path(entry.path)
+            except ValueError:
+                continue
+    return dates
+
+
+def _list_datasets(root: Path) -> list[str]:
+    """Dataset directories under a root (trades, nbbo, bars_1m, ...)."""
+    try:
+        with os.scandir(root) as entries:
+            return sorted(e.name for e in entries if e.is_dir() and not e.name.startswith(("_", ".")))
+    except FileNotFoundError:
+        return []
+
+
+class MarketDataQuery:
+    """
+    Query the Parquet datasets of every source with SQL.
+
+    Raw datasets are exposed as ``{source}_{dataset}`` tables (``taq_trades``,
+    ``alpaca_nbbo``, ...) and derived ones under their dataset name
+    (``enriched_trades``, ``bars_1m``, ...).
+
+    Tables are scanned as hive-partitioned datasets, so ``trade_date`` and
+    ``symbol`` predicates in the SQL prune partitions before their files are
+    opened. The ``start``/``end``/``symbols`` arguments are a shortcut for the
+    same filters. Other filters, e.g. on ts_event, are pushed down into the
+    Parquet scans, where row group statistics skip data outside the window.
+
+    Example:
+        >>> q = MarketDataQuery.from_config("config.yaml")
+        >>> q.sql(
+        ...     "SELECT symbol, count(*) AS n FROM taq_trades GROUP BY symbol",
+        ...     start=date(2024, 6, 10), end=date(2024, 6, 14), symbols=["AAPL", "MSFT"],
+        ... )
+    """
+
+    def __init__(self, sources: dict[str, Path], parquet_derived_root: Optional[Path] = None):
+        """
+        Args:
+            sources: Source name -> parquet_raw root
+            parquet_derived_root: Root of the derived datasets (optional)
+        """
+        self._roots: dict[str, tuple[Path, str]] = {}
+        # date dir -> (mtime_ns, file glob, schema); new or rewritten symbol dirs change the mtime
+        self._layouts: dict[Path, tuple[int, str, dict[str, pl.DataType]]] = {}
+        for source, root in sources.items():
+            for dataset in _list_datasets(Path(root)):
+                self._roots[f"{source}_{dataset}"] = (Path(root), dataset)
+        if parquet_derived_root is not None:
+            for dataset in _list_datasets(Path(parquet_derived_root)):
+                self._roots.setdefault(dataset, (Path(parquet_derived_root), dataset))
+
+    @classmethod
+    def from_config(cls, config_path: str) -> MarketDataQuery:
+        """Build from the stage sections (and optional query section) of a config file."""
+        from .config import load_config
+
+        config: QueryConfig = load_config(config_path)
+        return cls(config.sources, config.parquet_derived_root)
+
+    def tables(self) -> list[str]:
+        """Names of the queryable tables."""
+        return sorted(self._roots)
+
+    def files(
+        self,
+        table: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        symbols: Optional[list[str]] = None,
+    ) -> list[Path]:
+        """
+        Parquet files of a table after partition pruning.
+
+        Args:
+            table: Table name (see tables())
+            start: First trade date (inclusive, None = unbounded)
+            end: Last trade date (inclusive, None = unbounded)
+            symbols: Symbols to include (None = all)
+
+        Returns:
+            Sorted list of parquet files
+        """
+        if table not in self._roots:
+            raise ValueError(f"Unknown table: {table}. Available tables: {self.tables()}")
+        root, dataset = self._roots[table]
+        wanted = set(symbols) if symbols else None
+
+        files: list[Path] = []
+        for trade_date, date_dir in sorted(_list_dates(root / dataset).items()):
+            if (start is not None and trade_date < start) or (end is not None and trade_date > end):
+                continue
+            if wanted is not None:
+                # Symbol directories are always symbol=SYM, so no listing is needed
+                for symbol in sorted(wanted):
+                    files.extend(sorted((date_dir / symbol_dir_name(symbol)).glob("*.parquet")))
+                continue
+            partitions = list_symbol_partitions(date_dir)
+            if not partitions:
+                # Dataset not partitioned by symbol
+                files.extend(sorted(date_dir.glob("*.parquet")))
+                continue
+            for symbol, part_dir in sorted(partitions.items()):
+                files.extend(sorted(part_dir.glob("*.parquet")))
+        return files
+
+    def _date_layout(self, date_dir: Path) -> Optional[tuple[str, dict[str, pl.DataType]]]:
+        """
+        Glob for a date's parquet files, relative to the date directory, and
+        their schema, read from one file.
+
+        Symbol-partitioned dates get ``symbol=*/*.parquet``, which leaves out
+        hidden temporary directories; others (e.g. bars) ``*.parquet``.
+
+        Returns:
+            (glob, schema), or None if the date has no parquet files
+        """
+        try:
+            mtime_ns = date_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        cached = self._layouts.get(date_dir)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+        for pattern in (f"{SYMBOL_DIR_PREFIX}*/*.parquet", "*.parquet"):
+            sample = next(date_dir.glob(pattern), None)
+            if sample is not None:
+                lf = pl.scan_parquet(str(sample))
+                schema = dict(lf.collect_schema() if hasattr(lf, "collect_schema") else lf.schema)
+                self._layouts[date_dir] = (mtime_ns, pattern, schema)
+                return pattern, schema
+        return None
+
+    def schema(self, table: str) -> dict[str, pl.DataType]:
+        """
+        Columns of a table: from one of its files (latest date first), else
+        the canonical raw schema of its dataset.
+
+        Args:
+            table: Table name
+
+        Returns:
+            Mapping of column name to dtype (empty if unknown)
+        """
+        if table not in self._roots:
+            raise ValueError(f"Unknown table: {table}. Available tables: {self.tables()}")
+        root, dataset = self._roots[table]
+        for _, date_dir in sorted(_list_dates(root / dataset).items(), reverse=True):
+            layout = self._date_layout(date_dir)
+            if layout is not None:
+                return layout[1]
+        return dict(RAW_SCHEMAS.get(dataset, {}))
+
+    def scan(
+        self,
+        table: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        symbols: Optional[list[str]] = None,
+    ) -> pl.LazyFrame:
+        """
+        Lazy scan of a table as a hive-partitioned dataset.
+
+        Filters on trade_date and symbol, whether from SQL or from the
+        start/end/symbols shortcut, prune partitions before their files are
+        opened. Dates written with a different schema (e.g. String codes
+        before they became Categorical) are scanned separately and combined
+        with relaxed types; files within one date are expected to share one.
+
+        Args:
+            table: Table name
+            start: First trade date (inclusive)
+            end: Last trade date (inclusive)
+            symbols: Symbols to include
+
+        Returns:
+            LazyFrame (empty if no partition matches)
+        """
+        if table not in self._roots:
+            raise ValueError(f"Unknown table: {table}. Available tables: {self.tables()}")
+        root, dataset = self._roots[table]
+
+        # One hive scan per (file glob, schema); staging siblings (.trade_date=...) are never listed
+        groups: list[tuple[str, dict[str, pl.DataType], list[str]]] = []
+        for trade_date, date_dir in sorted(_list_dates(root / dataset).items()):
+            if (start is not None and trade_date < start) or (end is not None and trade_date > end):
+                continue
+            layout = self._date_layout(date_dir)
+            if layout is None:
+                continue
+            pattern, schema = layout
+            for group_pattern, group_schema, paths in groups:
+                if group_pattern == pattern and group_schema == schema:
+                    paths.append(str(date_dir / pattern))
+                    break
+            else:
+                groups.append((pattern, schema, [str(date_dir / pattern)]))
+
+        logger.debug(f"  {table}: {sum(len(g[2]) for g in groups)} dates in {len(groups)} scan(s)")
+        if not groups:
+            # Keep the table's columns so queries over an empty selection still resolve
+            return pl.LazyFrame(schema=self.schema(table))
+        scans = [pl.scan_parquet(paths, hive_partitioning=True) for _, _, paths in groups]
+        lf = scans[0] if len(scans) == 1 else pl.concat(scans, how="diagonal_relaxed")
+        if symbols:
+            lf = lf.filter(pl.col("symbol").cast(pl.Utf8).is_in(list(symbols)))
+        return lf
+
+    def sql(
+        self,
+        query: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        symbols: Optional[list[str]] = None,
+        lazy: bool = False,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """
+        Run a SQL query over the tables it names.
+
+        Only the tables named in the query are listed and registered.
+        trade_date/symbol predicates in the SQL prune partitions; the date
+        range and symbols arguments apply the same filters to every table
+        read. A selection with no files yields an empty table with the
+        dataset's columns.
+
+        Args:
+            query: SQL query (Polars SQL dialect)
+            start: First trade date (inclusive)
+            end: Last trade date (inclusive)
+            symbols: Symbols to include
+            lazy: Return the LazyFrame instead of collecting
+
+        Returns:
+            Query result
+        """
+        referenced = [t for t in self.tables() if re.search(rf"\b{re.escape(t)}\b", query)]
+        if not referenced:
+            raise ValueError(f"Query references no known table. Available tables: {self.tables()}")
+
+        context = pl.SQLContext()
+        for table in referenced:
+            context.register(table, self.scan(table, start, end, symbols))
+        result = context.execute(query, eager=False)
+        if lazy:
+            return result
+        return result.collect()
@@ -0,0 +1,158 @@
+"""CLI entry point for SQL queries over the Parquet datasets."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import polars as pl
+
+from .engine import MarketDataQuery
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
+    handlers=[
+        logging.StreamHandler(),
+    ],
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_symbols(symbols_str: str) -> list[str]:
+    """Parse comma-separated symbols or read from file."""
+    if Path(symbols_str).exists():
+        # Read from file (one symbol per line)
+        with open(symbols_str, "r") as f:
+            return [line.strip().upper() for line in f if line.strip()]
+    else:
+        # Comma-separated list
+        return [s.strip().upper() for s in symbols_str.split(",") if s.strip()]
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Run SQL over the partitioned Parquet datasets of every source",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # List tables ({source}_{dataset} for raw data, dataset name for derived data)
+  python -m src.query.run --config config.yaml --list-tables
+
+  # Daily trade counts for two symbols over a week
+  python -m src.query.run --config config.yaml --start-date 2024-06-10 --end-date 2024-06-14 \\
+      --symbols AAPL,MSFT \\
+      "SELECT trade_date, symbol, count(*) AS trades, sum(size) AS volume FROM taq_trades GROUP BY trade_date, symbol ORDER BY trade_date, symbol"
+
+  # Opening minute NBBO across sources, saved to a file
+  python -m src.query.run --config config.yaml --date 2024-06-10 --symbols SPY --output open.parquet \\
+      "SELECT * FROM taq_nbbo WHERE ts_event < '2024-06-10 13:31:00'"
+        """,
+    )
+
+    parser.add_argument(
+        "query",
+        nargs="?",
+        help="SQL query (Polars SQL dialect)",
+    )
+    parser.add_argument(
+        "--config",
+        required=True,
+        help="Path to config YAML file",
+    )
+    parser.add_argument(
+        "--date",
+        help="Single trade date in YYYY-MM-DD format (mutually exclusive with --start-date/--end-date)",
+    )
+    parser.add_argument(
+        "--start-date",
+        help="First trade date to read (YYYY-MM-DD, inclusive)",
+    )
+    parser.add_argument(
+        "--end-date",
+        help="Last trade date to read (YYYY-MM-DD, inclusive)",
+    )
+    parser.add_argument(
+        "--symbols",
+        default=None,
+        help="Comma-separated symbols or path to file with one symbol per line (default: all)",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Write the result to a .parquet or .csv file instead of printing it",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=50,
+        help="Rows to print (default: 50)",
+    )
+    parser.add_argument(
+        "--list-tables",
+        action="store_true",
+        help="List the available tables and exit",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable verbose logging",
+    )
+
+    args = parser.parse_args()
+
+    if args.date is not None and (args.start_date or args.end_date):
+        parser.error("--date cannot be used with --start-date or --end-date")
+    if args.query is None and not args.list_tables:
+        parser.error("a query is required (or --list-tables)")
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    try:
+        engine = MarketDataQuery.from_config(args.config)
+    except Exception as e:
+        logger.error(f"Error loading config: {e}")
+        sys.exit(1)
+
+    if args.list_tables:
+        for table in engine.tables():
+            print(table)
+        return
+
+    start_date = end_date = None
+    if args.date:
+        start_date = end_date = datetime.fromisoformat(args.date).date()
+    else:
+        if args.start_date:
+            start_date = datetime.fromisoformat(args.start_date).date()
+        if args.end_date:
+            end_date = datetime.fromisoformat(args.end_date).date()
+    symbols = parse_symbols(args.symbols) if args.symbols else None
+
+    try:
+        start = time.perf_counter()
+        result = engine.sql(args.query, start=start_date, end=end_date, symbols=symbols)
+        logger.info(f"✓ {len(result):,} rows in {time.perf_counter() - start:.2f}s")
+    except Exception as e:
+        logger.error(f"Query failed: {e}")
+        sys.exit(1)
+
+    if args.output:
+        if args.output.endswith(".csv"):
+            result.write_csv(args.output)
+        else:
+            result.write_parquet(args.output)
+        logger.info(f"Wrote {args.output}")
+    else:
+        with pl.Config(tbl_rows=args.limit, tbl_cols=-1):
+            print(result)
+
+
+if __name__ == "__main__":
+    main()
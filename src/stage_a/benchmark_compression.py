@@ -0,0 +1,244 @@
+"""CLI to benchmark compression profiles on a sample partition."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from pathlib import Path
+
+import polars as pl
+
+from .compression import PRESETS, parse_profile, write_parquet_file
+from .parquet_writer import DEFAULT_ROW_GROUP_SIZE
+from .schemas import RAW_SCHEMAS
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
+    handlers=[
+        logging.StreamHandler(),
+    ],
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILES = "snappy,lz4,zstd:3,zstd:9," + ",".join(PRESETS)
+
+
+def load_sample(path: Path) -> pl.DataFrame:
+    """Read a parquet file or every parquet file in a partition directory."""
+    files = [path] if path.is_file() else sorted(path.rglob("*.parquet"))
+    if not files:
+        raise FileNotFoundError(f"No parquet files under {path}")
+    return pl.concat([pl.read_parquet(f) for f in files], how="vertical_relaxed")
+
+
+def canonical_sample(schema: dict[str, pl.DataType], rows: int = 1_000) -> pl.DataFrame:
+    """
+    Synthetic rows with exactly the dtypes of a canonical schema.
+
+    Args:
+        schema: Canonical schema (e.g. RAW_NBBO_SCHEMA)
+        rows: Number of rows
+
+    Returns:
+        DataFrame matching the schema
+    """
+    start = datetime(2024, 6, 10, 13, 30, tzinfo=timezone.utc)
+    columns = []
+    for name, dtype in schema.items():
+        if dtype == pl.Decimal or dtype.is_float():
+            values = [100 + i / 100 for i in range(rows)]
+        elif dtype.is_integer():
+            values = list(range(rows))
+        elif dtype == pl.Datetime:
+            values = [start + timedelta(microseconds=i) for i in range(rows)]
+        elif dtype == pl.Date:
+            values = [date(2024, 6, 10)] * rows
+        elif dtype == pl.Time:
+            values = [dt_time(9, 30, i % 60) for i in range(rows)]
+        else:
+            values = [f"{name}{i % 5}" for i in range(rows)]
+        columns.append(pl.Series(name, values).cast(dtype))
+    return pl.DataFrame(columns)
+
+
+def check_round_trip(specs: list[str], work_dir: Path) -> list[str]:
+    """
+    Write canonical-dtype samples of every raw dataset with each profile and read them back.
+
+    Args:
+        specs: Profile specs to check
+        work_dir: Directory for the temporary files
+
+    Returns:
+        Failures as "profile/dataset: error" (empty if every file reads back unchanged)
+    """
+    failures = []
+    for spec in specs:
+        profile = parse_profile(spec)
+        for dataset, schema in RAW_SCHEMAS.items():
+            df = canonical_sample(schema)
+            path = work_dir / f"check_{spec.replace(':', '_')}_{dataset}.parquet"
+            try:
+                write_parquet_file(df, path, profile)
+                if not pl.read_parquet(path).equals(df):
+                    failures.append(f"{spec}/{dataset}: data changed on read")
+            except Exception as e:
+                failures.append(f"{spec}/{dataset}: {e}")
+            finally:
+                path.unlink(missing_ok=True)
+    return failures
+
+
+def benchmark_profile(
+    df: pl.DataFrame,
+    spec: str,
+    work_dir: Path,
+    row_group_size: int,
+    repeat: int,
+) -> dict:
+    """
+    Write and read the sample with one profile; best of ``repeat`` runs.
+
+    Args:
+        df: Sample data
+        spec: Profile spec (preset, "codec" or "codec:level")
+        work_dir: Directory to write into (put it on the target storage)
+        row_group_size: Rows per row group
+        repeat: Runs per measurement
+
+    Returns:
+        Dictionary with size and write/read seconds
+    """
+    profile = parse_profile(spec)
+    path = work_dir / f"bench_{spec.replace(':', '_')}.parquet"
+    write_seconds = read_seconds = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        write_parquet_file(df, path, profile, row_group_size)
+        write_seconds = min(write_seconds, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        pl.read_parquet(path)
+        read_seconds = min(read_seconds, time.perf_counter() - start)
+
+    size = path.stat().st_size
+    path.unlink()
+    return {"profile": spec, "size": size, "write_seconds": write_seconds, "read_seconds": read_seconds}
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Measure write throughput, read throughput and size of compression profiles",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=f"""
+Examples:
+  # Compare the default candidates on one NBBO partition
+  python -m src.stage_a.benchmark_compression --input /data/taq/parquet_raw/nbbo/trade_date=2024-06-10/symbol=SPY
+
+  # Measure on the NAS itself, with custom candidates
+  python -m src.stage_a.benchmark_compression --input part.parquet --work-dir /Volumes/Data/tmp --profiles lz4,zstd:6,archive
+
+  # Check that every profile reads back unchanged with the canonical raw dtypes
+  python -m src.stage_a.benchmark_compression --check
+
+Profiles: codec[:level] (snappy, lz4, zstd, gzip, brotli, uncompressed) or a preset ({', '.join(PRESETS)}).
+Reads right after a write may be served from the OS page cache; use a work dir on the
+target storage and compare profiles relative to each other.
+        """,
+    )
+
+    parser.add_argument(
+        "--input",
+        default=None,
+        help="Sample parquet file or partition directory (required unless --check)",
+    )
+    parser.add_argument(
+        "--profiles",
+        default=DEFAULT_PROFILES,
+        help=f"Comma-separated profiles to compare (default: {DEFAULT_PROFILES})",
+    )
+    parser.add_argument(
+        "--work-dir",
+        default=None,
+        help="Directory for the benchmark files (default: a temp dir on local disk)",
+    )
+    parser.add_argument(
+        "--row-group-size",
+        type=int,
+        default=DEFAULT_ROW_GROUP_SIZE,
+        help=f"Rows per row group (default: {DEFAULT_ROW_GROUP_SIZE})",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per profile, best time is reported (default: 3)",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Write and read back synthetic data with the canonical raw dtypes for each profile, then exit",
+    )
+
+    args = parser.parse_args()
+    specs = [s.strip() for s in args.profiles.split(",") if s.strip()]
+
+    if args.check:
+        with tempfile.TemporaryDirectory(prefix="compression_check_") as tmp:
+            failures = check_round_trip(specs, Path(tmp))
+        for failure in failures:
+            logger.error(f"  ✗ {failure}")
+        if failures:
+            sys.exit(1)
+        logger.info(f"✓ {len(specs)} profiles round-trip the canonical schemas ({', '.join(RAW_SCHEMAS)})")
+        return
+
+    if not args.input:
+        parser.error("--input is required unless --check is given")
+
+    try:
+        df = load_sample(Path(args.input))
+    except Exception as e:
+        logger.error(f"Error loading sample: {e}")
+        sys.exit(1)
+
+    raw_bytes = df.estimated_size()
+    logger.info(f"Sample: {len(df):,} rows, {len(df.columns)} columns, {raw_bytes / 1e6:.1f} MB in memory")
+
+    work_dir = Path(args.work_dir) if args.work_dir else Path(tempfile.mkdtemp(prefix="compression_bench_"))
+    work_dir.mkdir(parents=True, exist_ok=True)
+
+    results = []
+    try:
+        for spec in specs:
+            try:
+                results.append(benchmark_profile(df, spec, work_dir, args.row_group_size, args.repeat))
+                logger.info(f"  ✓ {spec}")
+            except Exception as e:
+                logger.error(f"  ✗ {spec}: {e}")
+    finally:
+        if not args.work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    if not results:
+        sys.exit(1)
+
+    logger.info("")
+    logger.info(f"{'profile':<12} {'size MB':>9} {'ratio':>6} {'write MB/s':>11} {'read MB/s':>10} {'write rows/s':>13}")
+    for r in sorted(results, key=lambda r: r["size"]):
+        logger.info(
+            f"{r['profile']:<12} {r['size'] / 1e6:>9.1f} {raw_bytes / r['size']:>6.1f} "
+            f"{raw_bytes / 1e6 / r['write_seconds']:>11.0f} {raw_bytes / 1e6 / r['read_seconds']:>10.0f} "
+            f"{len(df) / r['write_seconds']:>13,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""Parquet compression profiles: codec, level and per-column codecs/encodings per dataset."""
+
+from __future__ import annotations
+
+import dataclasses
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import polars as pl
+
+
+@dataclasses.dataclass(frozen=True)
+class CompressionProfile:
+    """
+    How a dataset's Parquet files are compressed.
+
+    The codec/level apply to every column unless overridden in column_codecs.
+    column_encodings sets Parquet encodings per column, e.g.
+    DELTA_BINARY_PACKED for sorted timestamps and sequence numbers or
+    BYTE_STREAM_SPLIT for float prices; those columns are not
+    dictionary-encoded. An encoding is only applied where the column's type
+    supports it (BYTE_STREAM_SPLIT on floats, DELTA_BINARY_PACKED on
+    integers and timestamps): Decimal prices keep the default encoding,
+    since Polars cannot read BYTE_STREAM_SPLIT Decimal pages back.
+    Per-column settings are written through pyarrow.
+    """
+
+    codec: str = "snappy"
+    level: Optional[int] = None
+    column_codecs: dict[str, str] = dataclasses.field(default_factory=dict)
+    column_encodings: dict[str, str] = dataclasses.field(default_factory=dict)
+
+    @property
+    def per_column(self) -> bool:
+        return bool(self.column_codecs or self.column_encodings)
+
+    def describe(self) -> str:
+        text = self.codec if self.level is None else f"{self.codec}:{self.level}"
+        if self.column_codecs:
+            text += f" codecs={self.column_codecs}"
+        if self.column_encodings:
+            text += f" encodings={self.column_encodings}"
+        return text
+
+
+# Named profiles usable anywhere a profile is expected (config values, benchmark)
+PRESETS: dict[str, CompressionProfile] = {
+    # Hot data read interactively (bars, recent days): fastest decode
+    "fast": CompressionProfile("lz4"),
+    # Balanced default for raw data
+    "balanced": CompressionProfile("zstd", 3),
+    # Cold NBBO/quotes archive on the NAS: smallest files, slower writes
+    "archive": CompressionProfile(
+        "zstd",
+        9,
+        column_encodings={
+            "ts_event": "DELTA_BINARY_PACKED",
+            "tr_seqnum": "DELTA_BINARY_PACKED",
+            "qu_seqnum": "DELTA_BINARY_PACKED",
+            "price": "BYTE_STREAM_SPLIT",
+            "bid": "BYTE_STREAM_SPLIT",
+            "ask": "BYTE_STREAM_SPLIT",
+            "best_bid": "BYTE_STREAM_SPLIT",
+            "best_ask": "BYTE_STREAM_SPLIT",
+        },
+    ),
+}
+
+ProfileSpec = Union[str, dict, CompressionProfile]
+
+
+def parse_profile(spec: ProfileSpec) -> CompressionProfile:
+    """
+    Build a profile from a config value.
+
+    Accepts a preset name ("archive"), a codec with optional level ("zstd:9",
+    "lz4"), a mapping with codec/level/column_codecs/column_encodings keys,
+    or a CompressionProfile.
+
+    Args:
+        spec: Profile specification
+
+    Returns:
+        CompressionProfile
+    """
+    if isinstance(spec, CompressionProfile):
+        return spec
+    if isinstance(spec, dict):
+        unknown = set(spec) - {f.name for f in dataclasses.fields(CompressionProfile)}
+        if unknown:
+            raise ValueError(f"Unknown compression profile keys: {sorted(unknown)}")
+        return CompressionProfile(
+            codec=spec.get("codec", "snappy"),
+            level=spec.get("level"),
+            column_codecs=dict(spec.get("column_codecs") or {}),
+            column_encodings={k: v.upper() for k, v in (spec.get("column_encodings") or {}).items()},
+        )
+    if spec in PRESETS:
+        return PRESETS[spec]
+    codec, _, level = str(spec).partition(":")
+    return CompressionProfile(codec=codec, level=int(level) if level else None)
+
+
+def load_profiles(raw: Optional[dict[str, Any]]) -> dict[str, CompressionProfile]:
+    """Parse a config's compression_profiles mapping (dataset -> spec)."""
+    return {dataset: parse_profile(spec) for dataset, spec in (raw or {}).items()}
+
+
+def profile_for(
+    default: str,
+    profiles: dict[str, CompressionProfile],
+    dataset: str,
+) -> CompressionProfile:
+    """
+    Profile for a dataset: its entry in profiles, else the stage-wide compression.
+
+    Args:
+        default: Stage-wide compression setting (e.g. config.compression)
+        profiles: Per-dataset profiles (e.g. config.compression_profiles)
+        dataset: Dataset name (trades, nbbo, enriched_trades, bars_1m, ...)
+
+    Returns:
+        CompressionProfile
+    """
+    return profiles.get(dataset) or parse_profile(default)
+
+
+def _encoding_applies(encoding: str, arrow_type: Any) -> bool:
+    """Whether a column encoding may be used for an Arrow type (see CompressionProfile)."""
+    import pyarrow as pa
+
+    if encoding == "BYTE_STREAM_SPLIT":
+        return pa.types.is_floating(arrow_type)
+    if encoding == "DELTA_BINARY_PACKED":
+        return pa.types.is_integer(arrow_type) or pa.types.is_temporal(arrow_type)
+    return True
+
+
+def write_parquet_file(
+    df: pl.DataFrame,
+    path: Path,
+    compression: ProfileSpec = "snappy",
+    row_group_size: Optional[int] = None,
+) -> None:
+    """
+    Write a DataFrame to one Parquet file with a compression profile.
+
+    Statistics are always written. Profiles without per-column settings use
+    the Polars writer; the others go through pyarrow, which supports
+    per-column codecs and encodings.
+
+    Args:
+        df: Data to write
+        path: Output file path
+        compression: Profile, preset name or codec string
+        row_group_size: Target rows per row group (None = writer default)
+    """
+    profile = parse_profile(compression)
+    if not profile.per_column:
+        df.write_parquet(
+            path,
+            compression=profile.codec,
+            compression_level=profile.level,
+            statistics=True,
+            row_group_size=row_group_size,
+        )
+        return
+
+    import pyarrow.parquet as pq
+
+    table = df.to_arrow()
+    columns = table.column_names
+    codecs = {c: profile.column_codecs.get(c, profile.codec) for c in columns}
+    encodings = {
+        c: e
+        for c, e in profile.column_encodings.items()
+        if c in columns and _encoding_applies(e, table.schema.field(c).type)
+    }
+    # The level belongs to the profile codec; overridden columns use their codec's default
+    levels = None if profile.level is None else {c: profile.level for c in columns if codecs[c] == profile.codec}
+    pq.write_table(
+        table,
+        path,
+        compression=codecs,
+        compression_level=levels,
+        use_dictionary=[c for c in columns if c not in encodings],
+        column_encoding=encodings or None,
+        write_statistics=True,
+        row_group_size=row_group_size,
+    )
@@ -8,6 +8,8 @@ from typing import Optional
 
 import yaml
 
+from .compression import CompressionProfile, load_profiles
+
 
 @dataclasses.dataclass
 class StageAConfig:
@@ -18,14 +20,22 @@ class StageAConfig:
     
     # WRDS connection
     wrds_username: Optional[str] = None
+    taq_catalog_cache_dir: Optional[Path] = None  # On-disk cache of TAQ table listings (None = in-process only)
     
     # Extraction settings
     chunk_size: int = 50  # Number of symbols to process per chunk
     streaming_chunk_rows: int = 1_000_000  # Rows per streaming chunk
+    max_wrds_connections: int = 1  # Dates extracted concurrently in range mode (one connection each)
+    column_profile: str = "full"  # Source columns to select: "full" (canonical schema) or "lean"
+    columns: dict[str, list[str]] = dataclasses.field(default_factory=dict)  # Per-dataset override of the profile
+    server_side_derive: bool = False  # Compute symbol and ts_event in the WRDS query instead of the client
     
     # Parquet settings
-    compression: str = "snappy"
+    compression: str = "snappy"  # Codec ("zstd:9") or preset ("fast", "balanced", "archive")
+    compression_profiles: dict[str, CompressionProfile] = dataclasses.field(default_factory=dict)  # Per-dataset override
     partition_by_symbol: bool = True
+    staged_writes: bool = False  # Stage each date partition beside its final dir and publish it with renames
+    row_group_size: Optional[int] = 100_000  # Rows per row group; files are sorted by ts_event (None = Polars default)
     
     # Timezone
     timezone: str = "America/New_York"
@@ -41,10 +51,18 @@ def load_config(config_path: str) -> StageAConfig:
     return StageAConfig(
         parquet_raw_root=Path(stage_a.get("parquet_raw_root", "/Volumes/Data/parquet_raw")),
         wrds_username=stage_a.get("wrds_username"),
+        taq_catalog_cache_dir=Path(stage_a["taq_catalog_cache_dir"]) if stage_a.get("taq_catalog_cache_dir") else None,
         chunk_size=stage_a.get("chunk_size", 50),
         streaming_chunk_rows=stage_a.get("streaming_chunk_rows", 1_000_000),
+        max_wrds_connections=stage_a.get("max_wrds_connections", 1),
+        column_profile=stage_a.get("column_profile", "full"),
+        columns=stage_a.get("columns") or {},
+        server_side_derive=stage_a.get("server_side_derive", False),
         compression=stage_a.get("compression", "snappy"),
+        compression_profiles=load_profiles(stage_a.get("compression_profiles")),
         partition_by_symbol=stage_a.get("partition_by_symbol", True),
+        staged_writes=stage_a.get("staged_writes", False),
+        row_group_size=stage_a.get("row_group_size", 100_000),
         timezone=stage_a.get("timezone", "America/New_York"),
     )
 
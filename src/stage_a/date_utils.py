@@ -3,10 +3,31 @@
 from __future__ import annotations
 
 import logging
-from datetime import date, timedelta
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
 
+# Regular NYSE session (local exchange time)
+SESSION_OPEN = time(9, 30)
+SESSION_CLOSE = time(16, 0)
+EARLY_CLOSE = time(13, 0)
+
+# Unscheduled full-day closures (weather, national days of mourning, ...)
+SPECIAL_CLOSURES = {
+    date(2001, 9, 11): "September 11",
+    date(2001, 9, 12): "September 11",
+    date(2001, 9, 13): "September 11",
+    date(2001, 9, 14): "September 11",
+    date(2004, 6, 11): "Reagan day of mourning",
+    date(2007, 1, 2): "Ford day of mourning",
+    date(2012, 10, 29): "Hurricane Sandy",
+    date(2012, 10, 30): "Hurricane Sandy",
+    date(2018, 12, 5): "G.H.W. Bush day of mourning",
+    date(2025, 1, 9): "Carter day of mourning",
+}
+
 
 def is_weekday(check_date: date) -> bool:
     """
@@ -52,19 +73,156 @@ def get_date_range(start_date: date, end_date: date) -> list[date]:
     return dates
 
 
-def filter_trading_days(dates: list[date]) -> list[date]:
+def _easter(year: int) -> date:
+    """Western Easter Sunday (anonymous Gregorian algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """n-th given weekday (0=Monday) of a month; n=-1 for the last one."""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    next_month = date(year + month // 12, month % 12 + 1, 1)
+    last = next_month - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _observed(holiday: date) -> date:
+    """Saturday holidays are observed on Friday, Sunday holidays on Monday."""
+    if holiday.weekday() == 5:
+        return holiday - timedelta(days=1)
+    if holiday.weekday() == 6:
+        return holiday + timedelta(days=1)
+    return holiday
+
+
+@lru_cache(maxsize=None)
+def nyse_holidays(year: int) -> dict[date, str]:
+    """
+    Full-day NYSE closures in a year (observed holidays plus special closures).
+    
+    Args:
+        year: Calendar year
+        
+    Returns:
+        Dictionary mapping closed dates to the holiday name
     """
-    Filter dates to only include weekdays (trading days).
+    holidays = {}
+    new_year = date(year, 1, 1)
+    # No Friday observance when New Year's Day falls on a Saturday
+    if new_year.weekday() != 5:
+        holidays[_observed(new_year)] = "New Year's Day"
+    holidays[_nth_weekday(year, 1, 0, 3)] = "Martin Luther King Jr. Day"
+    holidays[_nth_weekday(year, 2, 0, 3)] = "Washington's Birthday"
+    holidays[_easter(year) - timedelta(days=2)] = "Good Friday"
+    holidays[_nth_weekday(year, 5, 0, -1)] = "Memorial Day"
+    if year >= 2022:
+        holidays[_observed(date(year, 6, 19))] = "Juneteenth"
+    holidays[_observed(date(year, 7, 4))] = "Independence Day"
+    holidays[_nth_weekday(year, 9, 0, 1)] = "Labor Day"
+    holidays[_nth_weekday(year, 11, 3, 4)] = "Thanksgiving Day"
+    holidays[_observed(date(year, 12, 25))] = "Christmas Day"
+    for closed, name in SPECIAL_CLOSURES.items():
+        if closed.year == year:
+            holidays[closed] = name
+    return holidays
+
+
+def is_trading_day(check_date: date) -> bool:
+    """
+    Check if the NYSE has a session on a date (weekday and not a holiday).
+    
+    Args:
+        check_date: Date to check
+        
+    Returns:
+        True if the market is open
+    """
+    return is_weekday(check_date) and check_date not in nyse_holidays(check_date.year)
+
+
+def is_early_close(check_date: date) -> bool:
+    """
+    Check if a trading day closes early (13:00): July 3, the day after
+    Thanksgiving and Christmas Eve.
     
-    Note: This does not check for market holidays. For more accurate
-    trading day detection, you may want to use a calendar library
-    like pandas_market_calendars or check against actual data availability.
+    Args:
+        check_date: Date to check
+        
+    Returns:
+        True if the session closes at 13:00
+    """
+    if not is_trading_day(check_date):
+        return False
+    if (check_date.month, check_date.day) in ((7, 3), (12, 24)):
+        return True
+    return check_date == _nth_weekday(check_date.year, 11, 3, 4) + timedelta(days=1)
+
+
+def session_times(trade_date: date) -> tuple[time, time]:
+    """
+    Regular session (open, close) in local exchange time.
+    
+    Args:
+        trade_date: Trading day
+        
+    Returns:
+        (open, close), close is 13:00 on early-close days
+        
+    Raises:
+        ValueError: If the market is closed on trade_date
+    """
+    if not is_trading_day(trade_date):
+        raise ValueError(f"{trade_date} is not a trading day")
+    return SESSION_OPEN, EARLY_CLOSE if is_early_close(trade_date) else SESSION_CLOSE
+
+
+def session_bounds_utc(trade_date: date, timezone: str = "America/New_York") -> tuple[datetime, datetime]:
+    """
+    Regular session [open, close) for trade_date in UTC.
+    
+    Args:
+        trade_date: Trading day
+        timezone: Exchange timezone
+        
+    Returns:
+        (start, end) as timezone-aware UTC datetimes
+        
+    Raises:
+        ValueError: If the market is closed on trade_date
+    """
+    open_time, close_time = session_times(trade_date)
+    tz = ZoneInfo(timezone)
+    utc = ZoneInfo("UTC")
+    start = datetime.combine(trade_date, open_time, tzinfo=tz).astimezone(utc)
+    end = datetime.combine(trade_date, close_time, tzinfo=tz).astimezone(utc)
+    return start, end
+
+
+def filter_trading_days(dates: list[date]) -> list[date]:
+    """
+    Filter dates to NYSE trading days (weekdays that are not market holidays).
     
     Args:
         dates: List of dates to filter
         
     Returns:
-        List of dates that are weekdays
+        List of dates with a regular session
     """
-    return [d for d in dates if is_weekday(d)]
+    trading_days = [d for d in dates if is_trading_day(d)]
+    holidays = [d for d in dates if is_weekday(d) and not is_trading_day(d)]
+    if holidays:
+        logger.debug(f"Skipping {len(holidays)} market holidays: {', '.join(str(d) for d in holidays)}")
+    return trading_days
 
@@ -46,6 +46,9 @@ Examples:
   # Extract for a date range (checks trading days and table availability)
   python -m src.stage_a.extract --start-date 2024-06-10 --end-date 2024-06-14 --config config.yaml
   
+  # Extract a date range, 4 dates at a time (4 WRDS connections)
+  python -m src.stage_a.extract --start-date 2024-01-01 --end-date 2024-12-31 --config config.yaml --workers 4
+  
   # Extract only trades data
   python -m src.stage_a.extract --date 2024-06-10 --config config.yaml --type trades
   
@@ -110,6 +113,13 @@ Examples:
         help="Resume extraction: skip symbols that are already ingested. "
              "Useful when extraction was interrupted and you want to continue from where it left off.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Dates to extract in parallel in date range mode, one WRDS connection each "
+             "(overrides stage_a.max_wrds_connections)",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -229,6 +239,7 @@ Examples:
                 overwrite=args.overwrite,
                 data_types=data_types,
                 resume=args.resume,
+                max_workers=args.workers,
             )
             
             # Summary already printed by extract_stage_a_range
@@ -7,6 +7,8 @@ from datetime import date
 from pathlib import Path
 from typing import Literal
 
+from .partitions import date_partition_dir, symbol_partition_dir
+
 logger = logging.getLogger(__name__)
 
 DataType = Literal["trades", "quotes", "nbbo"]
@@ -33,44 +35,12 @@ def check_partition_exists(
     else:
         raise ValueError(f"Unknown data type: {data_type}")
     
-    date_str = trade_date.isoformat()
-    date_partition_dir = parquet_root / dataset / f"trade_date={date_str}"
-    
     if symbol and partition_by_symbol:
-        # Polars partition_by creates directories with tuple notation: symbol=('AAPL',)
-        # We need to check all existing symbol directories and match by symbol value
-        if not date_partition_dir.exists():
-            logger.debug(f"  Date partition directory does not exist: {date_partition_dir}")
-            return False
-        
-        # List all symbol directories and find the one matching our symbol
-        symbol_dirs = [d for d in date_partition_dir.iterdir() 
-                      if d.is_dir() and d.name.startswith("symbol=")]
-        
-        # Try to find matching directory
-        partition_dir = None
-        for sym_dir in symbol_dirs:
-            # Extract symbol from directory name (handle both formats)
-            sym_name = sym_dir.name.replace("symbol=", "")
-            # Handle tuple notation: ('AAPL',) or ("AAPL",)
-            if sym_name.startswith("('") and sym_name.endswith("',)"):
-                extracted_symbol = sym_name[2:-3]
-            elif sym_name.startswith('("') and sym_name.endswith('",)'):
-                extracted_symbol = sym_name[2:-3]
-            else:
-                extracted_symbol = sym_name
-            
-            if extracted_symbol == symbol:
-                partition_dir = sym_dir
-                break
-        
-        if partition_dir is None:
-            logger.debug(f"  No partition directory found for symbol={symbol}")
-            if symbol_dirs:
-                logger.debug(f"  Available symbol dirs (sample): {[d.name for d in symbol_dirs[:5]]}")
-            return False
+        # Symbol directories are always symbol=SYM (legacy tuple names are migrated
+        # by src.stage_a.migrate_partitions), so the path is built, not looked up
+        partition_dir = symbol_partition_dir(parquet_root, dataset, trade_date, symbol)
     else:
-        partition_dir = date_partition_dir
+        partition_dir = date_partition_dir(parquet_root, dataset, trade_date)
     
     # Debug: log what we're checking
     logger.debug(f"Checking partition: {partition_dir}")
@@ -209,12 +179,10 @@ def delete_partition(
     else:
         raise ValueError(f"Unknown data type: {data_type}")
     
-    date_str = trade_date.isoformat()
-    
     if symbol and partition_by_symbol:
-        partition_dir = parquet_root / dataset / f"trade_date={date_str}" / f"symbol={symbol}"
+        partition_dir = symbol_partition_dir(parquet_root, dataset, trade_date, symbol)
     else:
-        partition_dir = parquet_root / dataset / f"trade_date={date_str}"
+        partition_dir = date_partition_dir(parquet_root, dataset, trade_date)
     
     if not partition_dir.exists():
         return False
@@ -0,0 +1,158 @@
+"""Per-date partition manifests: which symbols a dataset holds for a trade date.
+
+Manifests live beside the partitions, one JSON file per (dataset, trade_date):
+
+    {parquet_root}/{dataset}/_manifests/trade_date=YYYY-MM-DD.json
+
+Keeping them out of the date directory means writing a manifest does not change
+that directory's mtime, so the mtime recorded in the manifest tells readers
+whether symbol directories were added or removed since it was written (e.g. by
+``delete_partition`` or a writer that predates manifests). A stale or missing
+manifest is rebuilt from a single scan of the date directory.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from .partitions import date_partition_dir, parse_symbol_dir_name
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_DIR = "_manifests"
+
+
+def manifest_path_for(parquet_root: Path, dataset: str, trade_date: date) -> Path:
+    """Return the manifest path for (dataset, trade_date)."""
+    return Path(parquet_root) / dataset / MANIFEST_DIR / f"trade_date={trade_date.isoformat()}.json"
+
+
+def _dir_mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def scan_date_partition(date_dir: Path) -> dict[str, Optional[int]]:
+    """
+    List symbols with parquet data under a date directory in one scandir pass.
+
+    Symbol directories are checked for parquet files with an early exit, so
+    each costs at most one directory listing. Row counts are unknown (None).
+
+    Args:
+        date_dir: {dataset}/trade_date=YYYY-MM-DD directory
+
+    Returns:
+        Dictionary mapping symbol to row count (None)
+    """
+    symbols: dict[str, Optional[int]] = {}
+    try:
+        entries = os.scandir(date_dir)
+    except FileNotFoundError:
+        return symbols
+    with entries:
+        for entry in entries:
+            symbol = parse_symbol_dir_name(entry.name)
+            if symbol is None or not entry.is_dir():
+                continue
+            with os.scandir(entry.path) as files:
+                if any(f.name.endswith(".parquet") for f in files):
+                    symbols[symbol] = None
+    return symbols
+
+
+def read_manifest(parquet_root: Path, dataset: str, trade_date: date) -> Optional[dict[str, Optional[int]]]:
+    """
+    Read the manifest for (dataset, trade_date) if it is still current.
+
+    Args:
+        parquet_root: Root directory for Parquet files
+        dataset: Dataset name (trades, quotes, nbbo)
+        trade_date: Trade date
+
+    Returns:
+        Dictionary mapping symbol to row count (None if unknown), or None if
+        there is no manifest or the date directory changed since it was written
+    """
+    path = manifest_path_for(parquet_root, dataset, trade_date)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable manifest {path}: {e}")
+        return None
+
+    date_dir = date_partition_dir(parquet_root, dataset, trade_date)
+    if manifest.get("dir_mtime_ns") != _dir_mtime_ns(date_dir):
+        logger.debug(f"Manifest {path} is stale")
+        return None
+    return manifest.get("symbols", {})
+
+
+def write_manifest(
+    parquet_root: Path,
+    dataset: str,
+    trade_date: date,
+    symbols: dict[str, Optional[int]],
+) -> None:
+    """
+    Atomically replace the manifest for (dataset, trade_date).
+
+    Args:
+        parquet_root: Root directory for Parquet files
+        dataset: Dataset name (trades, quotes, nbbo)
+        trade_date: Trade date
+        symbols: Dictionary mapping symbol to row count (None if unknown)
+    """
+    date_dir = date_partition_dir(parquet_root, dataset, trade_date)
+    path = manifest_path_for(parquet_root, dataset, trade_date)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        "trade_date": trade_date.isoformat(),
+        "dataset": dataset,
+        "dir_mtime_ns": _dir_mtime_ns(date_dir),
+        "updated_at": datetime.now(tz=timezone.utc).isoformat(),
+        "symbols": dict(sorted(symbols.items())),
+    }
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, path)
+
+
+def update_manifest(
+    parquet_root: Path,
+    dataset: str,
+    trade_date: date,
+    symbol_rows: dict[str, int],
+) -> None:
+    """
+    Record symbols just written for (dataset, trade_date).
+
+    Merges into the current manifest; if there is none (or it is stale) the
+    date directory is scanned first so symbols written earlier are kept.
+    Failures are logged, never raised: the manifest is only an index.
+
+    Args:
+        parquet_root: Root directory for Parquet files
+        dataset: Dataset name (trades, quotes, nbbo)
+        trade_date: Trade date
+        symbol_rows: Rows written per symbol
+    """
+    try:
+        symbols = read_manifest(parquet_root, dataset, trade_date)
+        if symbols is None:
+            symbols = scan_date_partition(date_partition_dir(parquet_root, dataset, trade_date))
+        symbols.update(symbol_rows)
+        write_manifest(parquet_root, dataset, trade_date, symbols)
+    except OSError as e:
+        logger.warning(f"Could not update manifest for {dataset} {trade_date}: {e}")
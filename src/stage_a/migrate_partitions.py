@@ -0,0 +1,216 @@
+"""One-time migration of legacy tuple-named symbol partitions to ``symbol=SYM``.
+
+Older writers named symbol directories after the Polars ``partition_by`` key
+tuple (``symbol=('AAPL',)``). Writers now always produce ``symbol=AAPL`` and
+readers build that path directly, so legacy directories must be renamed:
+
+- If the canonical directory does not exist, the legacy one is renamed (one
+  rename, no data copied).
+- If both exist, the legacy directory's files are moved into the canonical one
+  (a name already taken gets a ``legacy_`` prefix), the statistics sidecar is
+  recomputed from the merged files and the legacy directory is removed.
+
+Manifests of migrated dates are rebuilt.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+from .manifest import scan_date_partition, write_manifest
+from .partition_stats import STATS_FILE, stats_from_files, write_partition_stats
+from .partitions import is_legacy_symbol_dir_name, parse_symbol_dir_name, symbol_dir_name
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
+    handlers=[
+        logging.StreamHandler(),
+    ],
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATASETS = ["trades", "quotes", "nbbo"]
+
+_DATE_DIR_PREFIX = "trade_date="
+
+
+@dataclass
+class MigrationResult:
+    """Counts of one migration run."""
+
+    renamed: int = 0
+    merged: int = 0
+    dates: int = 0
+
+    def add(self, other: MigrationResult) -> None:
+        self.renamed += other.renamed
+        self.merged += other.merged
+        self.dates += other.dates
+
+
+def _free_name(target_dir: Path, name: str) -> Path:
+    """Path in target_dir for an entry called name, prefixed with legacy_ if taken."""
+    candidate = target_dir / name
+    n = 0
+    while candidate.exists():
+        prefix = "legacy_" if n == 0 else f"legacy{n}_"
+        candidate = target_dir / f"{prefix}{name}"
+        n += 1
+    return candidate
+
+
+def _merge_into(legacy_dir: Path, canonical_dir: Path, dataset: str) -> None:
+    """Move legacy_dir's entries into canonical_dir and refresh the stats sidecar."""
+    for entry in os.scandir(legacy_dir):
+        if entry.name == STATS_FILE:
+            os.remove(entry.path)
+        elif entry.name == "_SUCCESS" and (canonical_dir / "_SUCCESS").exists():
+            os.remove(entry.path)
+        else:
+            os.rename(entry.path, _free_name(canonical_dir, entry.name))
+    os.rmdir(legacy_dir)
+    write_partition_stats(canonical_dir, stats_from_files(canonical_dir, dataset))
+
+
+def migrate_date_dir(date_dir: Path, dataset: str, dry_run: bool = False) -> MigrationResult:
+    """
+    Rename the legacy symbol directories of one trade date.
+
+    Args:
+        date_dir: {dataset}/trade_date=YYYY-MM-DD directory
+        dataset: Dataset name (trades, quotes, nbbo), for the stats sidecars
+        dry_run: Only log what would be done
+
+    Returns:
+        MigrationResult for the date
+    """
+    result = MigrationResult()
+    with os.scandir(date_dir) as entries:
+        legacy = sorted(e.name for e in entries if e.is_dir() and is_legacy_symbol_dir_name(e.name))
+
+    for name in legacy:
+        symbol = parse_symbol_dir_name(name)
+        legacy_dir = date_dir / name
+        canonical_dir = date_dir / symbol_dir_name(symbol)
+        if canonical_dir.exists():
+            logger.info(f"  merge  {legacy_dir} -> {canonical_dir.name}")
+            if not dry_run:
+                _merge_into(legacy_dir, canonical_dir, dataset)
+            result.merged += 1
+        else:
+            logger.info(f"  rename {legacy_dir} -> {canonical_dir.name}")
+            if not dry_run:
+                os.rename(legacy_dir, canonical_dir)
+            result.renamed += 1
+
+    if legacy:
+        result.dates = 1
+    return result
+
+
+def migrate_dataset(parquet_root: Path, dataset: str, dry_run: bool = False) -> MigrationResult:
+    """
+    Migrate every trade date of a dataset and rebuild the manifests it touched.
+
+    Args:
+        parquet_root: Root directory for Parquet files
+        dataset: Dataset name (trades, quotes, nbbo)
+        dry_run: Only log what would be done
+
+    Returns:
+        MigrationResult for the dataset
+    """
+    result = MigrationResult()
+    dataset_dir = Path(parquet_root) / dataset
+    if not dataset_dir.exists():
+        logger.debug(f"  {dataset_dir} does not exist, skipping")
+        return result
+
+    with os.scandir(dataset_dir) as entries:
+        date_dirs = sorted(e.name for e in entries if e.is_dir() and e.name.startswith(_DATE_DIR_PREFIX))
+
+    for name in date_dirs:
+        try:
+            trade_date = date.fromisoformat(name[len(_DATE_DIR_PREFIX):])
+        except ValueError:
+            continue
+        date_dir = dataset_dir / name
+        date_result = migrate_date_dir(date_dir, dataset, dry_run)
+        if date_result.dates and not dry_run:
+            write_manifest(parquet_root, dataset, trade_date, scan_date_partition(date_dir))
+        result.add(date_result)
+    return result
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Rename legacy tuple-named symbol partitions (symbol=('AAPL',)) to symbol=AAPL",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # See what would change
+  python -m src.stage_a.migrate_partitions --parquet-root /data/taq/parquet_raw --dry-run
+
+  # Migrate several sources
+  python -m src.stage_a.migrate_partitions --parquet-root /data/taq/parquet_raw /data/alpaca/parquet_raw
+        """,
+    )
+
+    parser.add_argument(
+        "--parquet-root",
+        nargs="+",
+        required=True,
+        help="parquet_raw root(s) to migrate",
+    )
+    parser.add_argument(
+        "--datasets",
+        default=",".join(DEFAULT_DATASETS),
+        help=f"Comma-separated datasets to migrate (default: {','.join(DEFAULT_DATASETS)})",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only log what would be renamed or merged",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable verbose logging",
+    )
+
+    args = parser.parse_args()
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    datasets = [d.strip() for d in args.datasets.split(",") if d.strip()]
+    total = MigrationResult()
+    failed = False
+    for root in args.parquet_root:
+        for dataset in datasets:
+            logger.info(f"Migrating {root}/{dataset}")
+            try:
+                result = migrate_dataset(Path(root), dataset, args.dry_run)
+            except Exception as e:
+                logger.error(f"  ✗ {root}/{dataset}: {e}")
+                failed = True
+                continue
+            logger.info(f"  ✓ {result.renamed} renamed, {result.merged} merged across {result.dates} dates")
+            total.add(result)
+
+    verb = "Would migrate" if args.dry_run else "Migrated"
+    logger.info(f"{verb} {total.renamed + total.merged} partitions ({total.renamed} renamed, {total.merged} merged)")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
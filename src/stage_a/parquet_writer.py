@@ -3,36 +3,170 @@
 from __future__ import annotations
 
 import logging
+import os
+import shutil
+import uuid
+from collections import Counter
 from datetime import date
 from pathlib import Path
-from tempfile import TemporaryDirectory
-from typing import Iterator
+from typing import Iterator, Optional
 
 import polars as pl
 
+from .compression import ProfileSpec, write_parquet_file
+from .manifest import update_manifest
+from .partition_stats import PartitionStats, write_partition_stats
+from .partitions import date_partition_dir, partition_key_symbol, symbol_dir_name
+
 logger = logging.getLogger(__name__)
 
+# Within-file order: event time, then the TAQ sequence number for same-timestamp events
+SORT_COLUMNS = ("ts_event", "tr_seqnum", "qu_seqnum")
+
+# Default rows per Parquet row group (~1 minute of SPY NBBO updates), small
+# enough that time-window reads skip most of a file via min/max statistics
+DEFAULT_ROW_GROUP_SIZE = 100_000
+
+
+def write_partition_file(
+    df: pl.DataFrame,
+    path: Path,
+    compression: ProfileSpec = "snappy",
+    row_group_size: Optional[int] = DEFAULT_ROW_GROUP_SIZE,
+) -> None:
+    """
+    Write one partition file sorted by event time, with row-group statistics.
+    
+    Rows are sorted by ts_event (tie-broken by tr_seqnum/qu_seqnum when
+    present) so each row group covers a narrow time range, and min/max
+    statistics are always written so readers can prune row groups.
+    
+    Args:
+        df: Rows of one partition
+        path: Output file path
+        compression: Compression profile, preset name or codec
+        row_group_size: Target rows per row group (None = Polars default)
+    """
+    sort_columns = [c for c in SORT_COLUMNS if c in df.columns]
+    if sort_columns:
+        df = df.sort(sort_columns, maintain_order=True)
+    write_parquet_file(df, path, compression, row_group_size)
+
+
+class FsOpCounter:
+    """
+    Filesystem metadata operations issued by a writer, for per-run logging.
+    
+    Each call is counted once (a recursive mkdir or rmtree may issue several
+    syscalls); on a NAS each is at least one round trip, so the totals show
+    how chatty a write path is.
+    """
+    
+    def __init__(self):
+        self.counts: Counter[str] = Counter()
+    
+    def mkdir(self, path: Path) -> None:
+        path.mkdir(parents=True, exist_ok=True)
+        self.counts["mkdir"] += 1
+    
+    def exists(self, path: Path) -> bool:
+        self.counts["stat"] += 1
+        return path.exists()
+    
+    def rename(self, src: Path, dst: Path) -> None:
+        os.replace(src, dst)
+        self.counts["rename"] += 1
+    
+    def touch(self, path: Path) -> None:
+        path.touch()
+        self.counts["create"] += 1
+    
+    def write(self, df: pl.DataFrame, path: Path, compression: ProfileSpec, row_group_size: Optional[int]) -> None:
+        write_partition_file(df, path, compression, row_group_size)
+        self.counts["create"] += 1
+    
+    def write_stats(self, partition_dir: Path, stats: PartitionStats) -> None:
+        write_partition_stats(partition_dir, stats)
+        self.counts["create"] += 1
+    
+    def rmtree(self, path: Path) -> None:
+        shutil.rmtree(path, ignore_errors=True)
+        self.counts["rmtree"] += 1
+    
+    def summary(self) -> str:
+        if not self.counts:
+            return "no filesystem ops"
+        return ", ".join(f"{n} {op}" for op, n in sorted(self.counts.items())) + f" ({sum(self.counts.values())} total)"
+
+
+def staging_dir_for(final_dir: Path) -> Path:
+    """Hidden sibling of a date directory (same filesystem, so publishing is a rename)."""
+    return final_dir.with_name(f".{final_dir.name}.staging-{uuid.uuid4().hex[:8]}")
+
+
+def publish_staged(staging_dir: Path, final_dir: Path, fs: FsOpCounter) -> None:
+    """
+    Move a fully written date partition from its staging directory into place.
+    
+    A new date is published with a single directory rename (with _SUCCESS
+    already inside). If the date directory exists (resume, other symbols),
+    each staged symbol directory is renamed in, replacing an older copy: one
+    or two renames per symbol written by the run, while symbols it did not
+    write stay where they are. A date-level swap would instead have to move
+    every untouched symbol into the staging directory first. Each symbol
+    swaps atomically, but readers may see old and new symbols side by side
+    until the publish finishes.
+    
+    Args:
+        staging_dir: Staged date directory (symbol=* subdirectories and/or files)
+        final_dir: {dataset}/trade_date=YYYY-MM-DD directory
+        fs: Operation counter
+    """
+    if not fs.exists(final_dir):
+        fs.touch(staging_dir / "_SUCCESS")
+        fs.rename(staging_dir, final_dir)
+        return
+    
+    replaced_dir = staging_dir / ".replaced"
+    with os.scandir(staging_dir) as it:
+        entries = list(it)
+    fs.counts["listdir"] += 1
+    for entry in entries:
+        target = final_dir / entry.name
+        if entry.is_dir() and fs.exists(target):
+            # Swap out the old copy; it is removed with the staging directory
+            if not replaced_dir.exists():
+                fs.mkdir(replaced_dir)
+            fs.rename(target, replaced_dir / entry.name)
+        fs.rename(Path(entry.path), target)
+    fs.touch(final_dir / "_SUCCESS")
+    fs.rmtree(staging_dir)
+
 
 def write_partitioned_streaming(
     data_chunks: list[pl.DataFrame],
     parquet_root: Path,
     dataset: str,
     trade_date: date,
-    compression: str = "snappy",
+    compression: ProfileSpec = "snappy",
     partition_by_symbol: bool = True,
+    row_group_size: Optional[int] = DEFAULT_ROW_GROUP_SIZE,
 ) -> int:
     """
     Write data chunks to Parquet with partitioning.
     
-    Uses atomic writes (temp dir + rename) for NAS efficiency.
+    The date partition is written to a staging directory next to its final
+    location (same filesystem) and published with directory renames, so
+    readers never see a partial date and the NAS sees few metadata calls.
     
     Args:
         data_chunks: List of DataFrames to write
         parquet_root: Root directory for Parquet files
         dataset: Dataset name (trades, quotes, nbbo)
         trade_date: Trade date for partitioning
-        compression: Compression algorithm
+        compression: Compression profile, preset name or codec
         partition_by_symbol: Whether to partition by symbol
+        row_group_size: Target rows per row group (None = Polars default)
         
     Returns:
         Total number of rows written
@@ -50,63 +184,41 @@ def write_partitioned_streaming(
         logger.warning(f"Empty DataFrame for {dataset}")
         return 0
     
-    date_str = trade_date.isoformat()
+    fs = FsOpCounter()
+    final_dir = date_partition_dir(parquet_root, dataset, trade_date)
+    staging_dir = staging_dir_for(final_dir)
+    fs.mkdir(staging_dir)
     
-    # Use temp directory for atomic writes (NAS-friendly)
-    with TemporaryDirectory(prefix=f"{dataset}_{date_str}_") as temp_dir:
-        temp_path = Path(temp_dir)
-        
+    try:
+        symbol_rows: dict[str, int] = {}
         if partition_by_symbol and "symbol" in df.columns:
             # Partition by symbol
-            # Note: partition_by returns keys that might have tuple notation, so we need to clean them
+            # partition_by keys may be tuples; directories are always named symbol=SYM
             for symbol_key, symbol_df in df.partition_by("symbol", as_dict=True).items():
-                # Clean symbol key - remove tuple notation if present
-                if isinstance(symbol_key, tuple):
-                    symbol = symbol_key[0] if len(symbol_key) > 0 else str(symbol_key)
-                elif symbol_key.startswith("('") and symbol_key.endswith("',)"):
-                    # Handle string representation of tuple: "('AAPL',)"
-                    symbol = symbol_key[2:-3]
-                elif symbol_key.startswith('("') and symbol_key.endswith('",)'):
-                    # Handle string representation with double quotes: '("AAPL",)'
-                    symbol = symbol_key[2:-3]
-                else:
-                    symbol = symbol_key
+                symbol = partition_key_symbol(symbol_key)
                 
-                symbol_dir = temp_path / f"symbol={symbol}"
-                symbol_dir.mkdir(parents=True, exist_ok=True)
-                out_path = symbol_dir / "part.parquet"
-                symbol_df.write_parquet(out_path, compression=compression)
+                symbol_dir = staging_dir / symbol_dir_name(symbol)
+                fs.mkdir(symbol_dir)
+                fs.write(symbol_df, symbol_dir / "part.parquet", compression, row_group_size)
+                fs.write_stats(symbol_dir, PartitionStats.from_frame(symbol_df, dataset))
+                symbol_rows[symbol] = len(symbol_df)
                 logger.debug(f"  Wrote {len(symbol_df):,} rows for symbol={symbol}")
         else:
             # Single partition
-            out_path = temp_path / "part.parquet"
-            df.write_parquet(out_path, compression=compression)
+            fs.write(df, staging_dir / "part.parquet", compression, row_group_size)
             logger.debug(f"  Wrote {total_rows:,} rows")
         
-        # Atomic move to final location
-        final_dir = parquet_root / dataset / f"trade_date={date_str}"
-        if partition_by_symbol and "symbol" in df.columns:
-            # Move symbol subdirectories
-            for symbol_dir in temp_path.iterdir():
-                if symbol_dir.is_dir():
-                    final_symbol_dir = final_dir / symbol_dir.name
-                    final_symbol_dir.mkdir(parents=True, exist_ok=True)
-                    # Move parquet files
-                    for parquet_file in symbol_dir.glob("*.parquet"):
-                        final_file = final_symbol_dir / parquet_file.name
-                        parquet_file.rename(final_file)
-        else:
-            # Move single partition
-            final_dir.mkdir(parents=True, exist_ok=True)
-            for parquet_file in temp_path.glob("*.parquet"):
-                final_file = final_dir / parquet_file.name
-                parquet_file.rename(final_file)
-        
-        # Create _SUCCESS marker
-        success_marker = final_dir / "_SUCCESS"
-        success_marker.touch()
-        
-        logger.info(f"✓ Wrote {total_rows:,} rows to {final_dir}")
+        fs.mkdir(final_dir.parent)
+        publish_staged(staging_dir, final_dir, fs)
+    except BaseException:
+        fs.rmtree(staging_dir)
+        raise
+    
+    if symbol_rows:
+        update_manifest(parquet_root, dataset, trade_date, symbol_rows)
+    
+    logger.info(f"✓ Wrote {total_rows:,} rows to {final_dir}")
+    logger.debug(f"  Filesystem: {fs.summary()}")
     
     return total_rows
 
@@ -116,8 +228,10 @@ def write_chunks_incrementally(
     parquet_root: Path,
     dataset: str,
     trade_date: date,
-    compression: str = "snappy",
+    compression: ProfileSpec = "snappy",
     partition_by_symbol: bool = True,
+    row_group_size: Optional[int] = DEFAULT_ROW_GROUP_SIZE,
+    staged: bool = False,
 ) -> int:
     """
     Write chunks incrementally as they arrive (memory-efficient streaming).
@@ -126,84 +240,103 @@ def write_chunks_incrementally(
     Uses incremental file naming (part_0000.parquet, part_0001.parquet, etc.)
     for each symbol partition.
     
+    With staged=True the files go to a staging directory beside the date
+    directory and are published at the end with directory renames (one for a
+    new date), so an interrupted run leaves nothing half-written in place.
+    Either way each symbol directory is created once per run, and the
+    filesystem operations issued are logged.
+    
     Args:
         chunk_iterator: Iterator yielding DataFrames (one chunk at a time)
         parquet_root: Root directory for Parquet files
         dataset: Dataset name (trades, quotes, nbbo)
         trade_date: Trade date for partitioning
-        compression: Compression algorithm
+        compression: Compression profile, preset name or codec
         partition_by_symbol: Whether to partition by symbol
+        row_group_size: Target rows per row group (None = Polars default)
+        staged: Stage the date partition and publish it when complete
         
     Returns:
         Total number of rows written
     """
-    date_str = trade_date.isoformat()
-    final_dir = parquet_root / dataset / f"trade_date={date_str}"
-    final_dir.mkdir(parents=True, exist_ok=True)
+    final_dir = date_partition_dir(parquet_root, dataset, trade_date)
+    fs = FsOpCounter()
+    write_dir = staging_dir_for(final_dir) if staged else final_dir
+    fs.mkdir(write_dir)
     
-    # Track chunk numbers per symbol for incremental naming
+    # Track chunk numbers per symbol for incremental naming (also: directories already created)
     symbol_chunk_counters: dict[str, int] = {}
+    symbol_rows: dict[str, int] = {}
+    symbol_stats: dict[str, PartitionStats] = {}
     total_rows = 0
     chunk_num = 0
     
-    logger.info(f"Writing chunks incrementally to {final_dir}...")
+    logger.info(f"Writing chunks incrementally to {final_dir}{' (staged)' if staged else ''}...")
     
-    for chunk in chunk_iterator:
-        chunk_num += 1
-        chunk_rows = len(chunk)
-        
-        if chunk.is_empty():
-            logger.debug(f"  Chunk {chunk_num}: Empty, skipping")
-            continue
+    try:
+        for chunk in chunk_iterator:
+            chunk_num += 1
+            chunk_rows = len(chunk)
+            
+            if chunk.is_empty():
+                logger.debug(f"  Chunk {chunk_num}: Empty, skipping")
+                continue
+            
+            logger.info(f"  Chunk {chunk_num}: {chunk_rows:,} rows")
+            
+            if partition_by_symbol and "symbol" in chunk.columns:
+                # Partition by symbol and write each symbol's data incrementally
+                for symbol_key, symbol_df in chunk.partition_by("symbol", as_dict=True).items():
+                    symbol = partition_key_symbol(symbol_key)
+                    
+                    symbol_dir = write_dir / symbol_dir_name(symbol)
+                    
+                    # First chunk for this symbol in this run: create its directory
+                    if symbol not in symbol_chunk_counters:
+                        symbol_chunk_counters[symbol] = 0
+                        fs.mkdir(symbol_dir)
+                    
+                    # Write incremental chunk file
+                    chunk_file = symbol_dir / f"part_{symbol_chunk_counters[symbol]:04d}.parquet"
+                    fs.write(symbol_df, chunk_file, compression, row_group_size)
+                    symbol_chunk_counters[symbol] += 1
+                    symbol_rows[symbol] = symbol_rows.get(symbol, 0) + len(symbol_df)
+                    symbol_stats[symbol] = symbol_stats.get(symbol, PartitionStats()).merge(
+                        PartitionStats.from_frame(symbol_df, dataset)
+                    )
+                    total_rows += len(symbol_df)
+                    
+                    logger.debug(f"    Wrote {len(symbol_df):,} rows for symbol={symbol} (chunk {symbol_chunk_counters[symbol]})")
+            else:
+                # Single partition - write incremental chunk
+                chunk_file = write_dir / f"part_{chunk_num:04d}.parquet"
+                fs.write(chunk, chunk_file, compression, row_group_size)
+                total_rows += chunk_rows
+                logger.debug(f"    Wrote chunk {chunk_num} ({chunk_rows:,} rows)")
+            
+            # Log progress periodically
+            if chunk_num % 10 == 0:
+                logger.info(f"  Progress: {chunk_num} chunks processed, {total_rows:,} total rows written")
         
-        logger.info(f"  Chunk {chunk_num}: {chunk_rows:,} rows")
+        # Statistics sidecars, once each symbol's files are all written
+        for symbol, stats in symbol_stats.items():
+            fs.write_stats(write_dir / symbol_dir_name(symbol), stats)
         
-        if partition_by_symbol and "symbol" in chunk.columns:
-            # Partition by symbol and write each symbol's data incrementally
-            for symbol_key, symbol_df in chunk.partition_by("symbol", as_dict=True).items():
-                # Clean symbol key - remove tuple notation if present
-                if isinstance(symbol_key, tuple):
-                    symbol = symbol_key[0] if len(symbol_key) > 0 else str(symbol_key)
-                elif isinstance(symbol_key, str):
-                    if symbol_key.startswith("('") and symbol_key.endswith("',)"):
-                        symbol = symbol_key[2:-3]
-                    elif symbol_key.startswith('("') and symbol_key.endswith('",)'):
-                        symbol = symbol_key[2:-3]
-                    else:
-                        symbol = symbol_key
-                else:
-                    symbol = str(symbol_key)
-                
-                # Get or initialize chunk counter for this symbol
-                if symbol not in symbol_chunk_counters:
-                    symbol_chunk_counters[symbol] = 0
-                
-                symbol_dir = final_dir / f"symbol={symbol}"
-                symbol_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Write incremental chunk file
-                chunk_file = symbol_dir / f"part_{symbol_chunk_counters[symbol]:04d}.parquet"
-                symbol_df.write_parquet(chunk_file, compression=compression)
-                symbol_chunk_counters[symbol] += 1
-                total_rows += len(symbol_df)
-                
-                logger.debug(f"    Wrote {len(symbol_df):,} rows for symbol={symbol} (chunk {symbol_chunk_counters[symbol]})")
+        if staged:
+            publish_staged(write_dir, final_dir, fs)
         else:
-            # Single partition - write incremental chunk
-            chunk_file = final_dir / f"part_{chunk_num:04d}.parquet"
-            chunk.write_parquet(chunk_file, compression=compression)
-            total_rows += chunk_rows
-            logger.debug(f"    Wrote chunk {chunk_num} ({chunk_rows:,} rows)")
-        
-        # Log progress periodically
-        if chunk_num % 10 == 0:
-            logger.info(f"  Progress: {chunk_num} chunks processed, {total_rows:,} total rows written")
+            # Create _SUCCESS marker when done
+            fs.touch(final_dir / "_SUCCESS")
+    except BaseException:
+        if staged:
+            fs.rmtree(write_dir)
+        raise
     
-    # Create _SUCCESS marker when done
-    success_marker = final_dir / "_SUCCESS"
-    success_marker.touch()
+    if symbol_rows:
+        update_manifest(parquet_root, dataset, trade_date, symbol_rows)
     
     logger.info(f"✓ Wrote {total_rows:,} rows in {chunk_num} chunks to {final_dir}")
+    logger.info(f"  Filesystem: {fs.summary()}")
     
     return total_rows
 
@@ -213,8 +346,9 @@ def write_chunked_from_csv(
     parquet_root: Path,
     dataset: str,
     trade_date: date,
-    compression: str = "snappy",
+    compression: ProfileSpec = "snappy",
     partition_by_symbol: bool = True,
+    row_group_size: Optional[int] = DEFAULT_ROW_GROUP_SIZE,
     chunk_size: int = 1_000_000,
     enrich_fn=None,
     symbols_to_extract: list[str] | None = None,
@@ -227,8 +361,9 @@ def write_chunked_from_csv(
         parquet_root: Root directory for Parquet files
         dataset: Dataset name
         trade_date: Trade date
-        compression: Compression algorithm
+        compression: Compression profile, preset name or codec
         partition_by_symbol: Whether to partition by symbol
+        row_group_size: Target rows per row group (None = Polars default)
         chunk_size: Rows per chunk
         enrich_fn: Optional function to enrich each chunk (takes DataFrame, returns DataFrame)
         symbols_to_extract: Optional list of symbols to extract. If provided, only these symbols will be written.
@@ -250,14 +385,15 @@ def write_chunked_from_csv(
     total_count = lf.select(pl.len()).collect().item()
     logger.info(f"Total rows in CSV: {total_count:,}")
     
-    date_str = trade_date.isoformat()
-    final_dir = parquet_root / dataset / f"trade_date={date_str}"
+    final_dir = date_partition_dir(parquet_root, dataset, trade_date)
     final_dir.mkdir(parents=True, exist_ok=True)
     
     # Process in chunks
     offset = 0
     chunk_num = 0
     total_written = 0
+    symbol_rows: dict[str, int] = {}
+    symbol_stats: dict[str, PartitionStats] = {}
     
     while offset < total_count:
         logger.info(f"Processing chunk {chunk_num + 1}: rows {offset:,} to {min(offset + chunk_size, total_count):,}")
@@ -283,30 +419,21 @@ def write_chunked_from_csv(
         if partition_by_symbol and "symbol" in chunk.columns:
             # Write per symbol
             for symbol_key, symbol_df in chunk.partition_by("symbol", as_dict=True).items():
-                # Clean symbol key - remove tuple notation if present
-                if isinstance(symbol_key, tuple):
-                    symbol = symbol_key[0] if len(symbol_key) > 0 else str(symbol_key)
-                elif isinstance(symbol_key, str):
-                    if symbol_key.startswith("('") and symbol_key.endswith("',)"):
-                        # Handle string representation of tuple: "('AAPL',)"
-                        symbol = symbol_key[2:-3]
-                    elif symbol_key.startswith('("') and symbol_key.endswith('",)'):
-                        # Handle string representation with double quotes: '("AAPL",)'
-                        symbol = symbol_key[2:-3]
-                    else:
-                        symbol = symbol_key
-                else:
-                    symbol = str(symbol_key)
+                symbol = partition_key_symbol(symbol_key)
                 
-                symbol_dir = final_dir / f"symbol={symbol}"
+                symbol_dir = final_dir / symbol_dir_name(symbol)
                 symbol_dir.mkdir(parents=True, exist_ok=True)
                 chunk_file = symbol_dir / f"part_{chunk_num:04d}.parquet"
-                symbol_df.write_parquet(chunk_file, compression=compression)
+                write_partition_file(symbol_df, chunk_file, compression, row_group_size)
+                symbol_rows[symbol] = symbol_rows.get(symbol, 0) + len(symbol_df)
+                symbol_stats[symbol] = symbol_stats.get(symbol, PartitionStats()).merge(
+                    PartitionStats.from_frame(symbol_df, dataset)
+                )
                 total_written += len(symbol_df)
         else:
             # Write single chunk
             chunk_file = final_dir / f"part_{chunk_num:04d}.parquet"
-            chunk.write_parquet(chunk_file, compression=compression)
+            write_partition_file(chunk, chunk_file, compression, row_group_size)
             total_written += len(chunk)
         
         chunk_num += 1
@@ -315,9 +442,15 @@ def write_chunked_from_csv(
         if offset % (chunk_size * 10) == 0:
             logger.info(f"Progress: {offset:,} / {total_count:,} rows processed, {total_written:,} written")
     
+    for symbol, stats in symbol_stats.items():
+        write_partition_stats(final_dir / symbol_dir_name(symbol), stats)
+    
     # Create _SUCCESS marker
     success_marker = final_dir / "_SUCCESS"
     success_marker.touch()
     
+    if symbol_rows:
+        update_manifest(parquet_root, dataset, trade_date, symbol_rows)
+    
     logger.info(f"✓ Wrote {total_written:,} rows from CSV to {final_dir}")
     return total_written
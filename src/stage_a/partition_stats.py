@@ -0,0 +1,217 @@
+"""Per-partition statistics sidecars, so summaries don't need the tick data.
+
+Writers leave a small JSON file in each (date, symbol) partition:
+
+    {dataset}/trade_date=YYYY-MM-DD/symbol=SYM/_STATS.json
+
+with the row count, event-time range and, depending on the dataset, traded
+volume/notional or spread statistics.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+STATS_FILE = "_STATS.json"
+
+# Spreads are bucketed to 1/100 cent so chunk statistics merge exactly
+SPREAD_SCALE = 10_000
+
+# Bid/ask columns per dataset (trades have none)
+_QUOTE_COLUMNS = {
+    "nbbo": ("best_bid", "best_ask"),
+    "quotes": ("bid", "ask"),
+}
+
+
+@dataclasses.dataclass
+class PartitionStats:
+    """Summary of one partition; built per chunk and merged as chunks are written."""
+
+    rows: int = 0
+    min_ts: Optional[datetime] = None
+    max_ts: Optional[datetime] = None
+    volume: Optional[int] = None  # Trades: sum of size
+    notional: Optional[float] = None  # Trades: sum of price * size
+    quote_count: Optional[int] = None  # Quotes/NBBO: rows with a two-sided positive quote
+    spread_histogram: dict[int, int] = dataclasses.field(default_factory=dict)  # Spread (1e-4 units) -> count
+
+    @classmethod
+    def from_frame(cls, df: pl.DataFrame, data_type: str) -> PartitionStats:
+        """
+        Statistics of a DataFrame of one dataset.
+
+        Args:
+            df: Rows of one partition (or a chunk of it)
+            data_type: Dataset (trades, quotes, nbbo)
+
+        Returns:
+            PartitionStats
+        """
+        stats = cls(rows=len(df))
+        if len(df) == 0:
+            return stats
+        if "ts_event" in df.columns:
+            bounds = df.select(
+                pl.col("ts_event").min().alias("min"),
+                pl.col("ts_event").max().alias("max"),
+            ).row(0)
+            stats.min_ts, stats.max_ts = bounds
+
+        if data_type == "trades" and {"price", "size"} <= set(df.columns):
+            volume, notional = df.select(
+                pl.col("size").cast(pl.Int64).sum(),
+                (pl.col("price").cast(pl.Float64) * pl.col("size").cast(pl.Float64)).sum(),
+            ).row(0)
+            stats.volume, stats.notional = int(volume), float(notional)
+
+        bid_col, ask_col = _QUOTE_COLUMNS.get(data_type, (None, None))
+        if bid_col in df.columns and ask_col in df.columns:
+            bid = pl.col(bid_col).cast(pl.Float64)
+            ask = pl.col(ask_col).cast(pl.Float64)
+            spreads = (
+                df.lazy()
+                .filter((bid > 0) & (ask > 0))
+                .select(((ask - bid) * SPREAD_SCALE).round(0).cast(pl.Int64).alias("spread"))
+                .group_by("spread")
+                .agg(pl.len().alias("n"))
+                .collect()
+            )
+            stats.spread_histogram = dict(zip(spreads["spread"].to_list(), spreads["n"].to_list()))
+            stats.quote_count = int(spreads["n"].sum()) if len(spreads) else 0
+        return stats
+
+    def merge(self, other: PartitionStats) -> PartitionStats:
+        """Combine with the statistics of another chunk of the same partition."""
+        def add(a, b):
+            return b if a is None else a if b is None else a + b
+
+        histogram = dict(self.spread_histogram)
+        for spread, n in other.spread_histogram.items():
+            histogram[spread] = histogram.get(spread, 0) + n
+        return PartitionStats(
+            rows=self.rows + other.rows,
+            min_ts=min((t for t in (self.min_ts, other.min_ts) if t is not None), default=None),
+            max_ts=max((t for t in (self.max_ts, other.max_ts) if t is not None), default=None),
+            volume=add(self.volume, other.volume),
+            notional=add(self.notional, other.notional),
+            quote_count=add(self.quote_count, other.quote_count),
+            spread_histogram=histogram,
+        )
+
+    @property
+    def mean_spread(self) -> Optional[float]:
+        total = sum(self.spread_histogram.values())
+        if not total:
+            return None
+        return sum(s * n for s, n in self.spread_histogram.items()) / total / SPREAD_SCALE
+
+    @property
+    def median_spread(self) -> Optional[float]:
+        total = sum(self.spread_histogram.values())
+        if not total:
+            return None
+        seen = 0
+        for spread in sorted(self.spread_histogram):
+            seen += self.spread_histogram[spread]
+            if seen * 2 >= total:
+                return spread / SPREAD_SCALE
+        return None
+
+    def to_dict(self) -> dict:
+        """JSON-serializable sidecar content."""
+        return {
+            "rows": self.rows,
+            "min_ts": _iso(self.min_ts),
+            "max_ts": _iso(self.max_ts),
+            "volume": self.volume,
+            "notional": self.notional,
+            "quote_count": self.quote_count,
+            "mean_spread": self.mean_spread,
+            "median_spread": self.median_spread,
+            "spread_histogram": {str(k): v for k, v in sorted(self.spread_histogram.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> PartitionStats:
+        return cls(
+            rows=data.get("rows", 0),
+            min_ts=datetime.fromisoformat(data["min_ts"]) if data.get("min_ts") else None,
+            max_ts=datetime.fromisoformat(data["max_ts"]) if data.get("max_ts") else None,
+            volume=data.get("volume"),
+            notional=data.get("notional"),
+            quote_count=data.get("quote_count"),
+            spread_histogram={int(k): v for k, v in (data.get("spread_histogram") or {}).items()},
+        )
+
+
+def _iso(ts: Optional[datetime]) -> Optional[str]:
+    if ts is None:
+        return None
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return ts.astimezone(timezone.utc).isoformat()
+
+
+def write_partition_stats(partition_dir: Path, stats: PartitionStats) -> None:
+    """
+    Write the statistics sidecar of a partition (temp file + rename).
+
+    Args:
+        partition_dir: symbol=SYM directory
+        stats: Statistics of all files in the partition
+    """
+    path = Path(partition_dir) / STATS_FILE
+    tmp_path = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(stats.to_dict(), f)
+    os.replace(tmp_path, path)
+
+
+def read_partition_stats(partition_dir: Path) -> Optional[PartitionStats]:
+    """
+    Read a partition's statistics sidecar.
+
+    Args:
+        partition_dir: symbol=SYM directory
+
+    Returns:
+        PartitionStats, or None if the partition has no (readable) sidecar
+    """
+    try:
+        with open(Path(partition_dir) / STATS_FILE, "r", encoding="utf-8") as f:
+            return PartitionStats.from_dict(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def stats_from_files(partition_dir: Path, data_type: str) -> PartitionStats:
+    """
+    Compute a partition's statistics from its parquet files (e.g. to backfill).
+
+    Only the columns the statistics need are read.
+
+    Args:
+        partition_dir: symbol=SYM directory
+        data_type: Dataset (trades, quotes, nbbo)
+
+    Returns:
+        PartitionStats
+    """
+    files = sorted(Path(partition_dir).glob("*.parquet"))
+    if not files:
+        return PartitionStats()
+    lf = pl.scan_parquet([str(f) for f in files])
+    available = set(lf.collect_schema().names()) if hasattr(lf, "collect_schema") else set(lf.columns)
+    wanted = {"ts_event", "price", "size", *_QUOTE_COLUMNS.get(data_type, ())}
+    return PartitionStats.from_frame(lf.select(sorted(wanted & available)).collect(), data_type)
@@ -0,0 +1,104 @@
+"""Helpers for the hive-style partition layout: {dataset}/trade_date=YYYY-MM-DD/symbol=SYM/.
+
+Writers always name symbol directories ``symbol=SYM`` (see partition_key_symbol),
+so readers build partition paths with symbol_partition_dir (or symbol_dir_name
+under a date directory they already hold) instead of listing the date
+directory. Trees written before that guarantee may still hold legacy
+tuple-named directories; ``python -m src.stage_a.migrate_partitions`` renames them.
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import date
+from pathlib import Path
+
+
+def date_partition_dir(parquet_root: Path, dataset: str, trade_date: date) -> Path:
+    """Return {parquet_root}/{dataset}/trade_date={date}."""
+    return Path(parquet_root) / dataset / f"trade_date={trade_date.isoformat()}"
+
+
+SYMBOL_DIR_PREFIX = "symbol="
+
+
+def symbol_dir_name(symbol: str) -> str:
+    """Return the directory name of a symbol partition, symbol={symbol}."""
+    return f"{SYMBOL_DIR_PREFIX}{symbol}"
+
+
+def symbol_partition_dir(parquet_root: Path, dataset: str, trade_date: date, symbol: str) -> Path:
+    """Return {parquet_root}/{dataset}/trade_date={date}/symbol={symbol}."""
+    return date_partition_dir(parquet_root, dataset, trade_date) / symbol_dir_name(symbol)
+
+
+def partition_key_symbol(key: object) -> str:
+    """
+    Symbol of a ``DataFrame.partition_by("symbol", as_dict=True)`` key.
+
+    Depending on the Polars version the key is a 1-tuple or a scalar; writers
+    use this so a directory is never named after the tuple (``symbol=('AAPL',)``).
+
+    Args:
+        key: Partition key
+
+    Returns:
+        Symbol string
+    """
+    if isinstance(key, tuple):
+        key = key[0] if key else ""
+    symbol = str(key)
+    parsed = parse_symbol_dir_name(symbol_dir_name(symbol))
+    return parsed if parsed is not None else symbol
+
+
+def is_legacy_symbol_dir_name(name: str) -> bool:
+    """True for tuple-notation symbol directory names (``symbol=('AAPL',)``)."""
+    symbol = parse_symbol_dir_name(name)
+    return symbol is not None and name != symbol_dir_name(symbol)
+
+
+def parse_symbol_dir_name(name: str) -> str | None:
+    """
+    Extract the symbol from a partition directory name.
+
+    Handles both ``symbol=AAPL`` and the legacy tuple notation written by older
+    Polars ``partition_by`` keys (``symbol=('AAPL',)`` or ``symbol=("AAPL",)``).
+
+    Args:
+        name: Directory name
+
+    Returns:
+        Symbol, or None if the name is not a symbol partition
+    """
+    if not name.startswith(SYMBOL_DIR_PREFIX):
+        return None
+    sym_name = name[len(SYMBOL_DIR_PREFIX):]
+    if (sym_name.startswith("('") and sym_name.endswith("',)")) or (
+        sym_name.startswith('("') and sym_name.endswith('",)')
+    ):
+        return sym_name[2:-3]
+    return sym_name
+
+
+def list_symbol_partitions(date_dir: Path) -> dict[str, Path]:
+    """
+    Map each symbol to its partition directory under a date directory (one scandir).
+
+    Args:
+        date_dir: {dataset}/trade_date=YYYY-MM-DD directory
+
+    Returns:
+        Dictionary mapping symbol to partition directory (empty if date_dir is missing)
+    """
+    partitions: dict[str, Path] = {}
+    try:
+        entries = os.scandir(date_dir)
+    except FileNotFoundError:
+        return partitions
+    with entries:
+        for entry in entries:
+            symbol = parse_symbol_dir_name(entry.name)
+            if symbol is not None and entry.is_dir():
+                partitions[symbol] = Path(entry.path)
+    return partitions
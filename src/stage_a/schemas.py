@@ -6,6 +6,8 @@ import polars as pl
 
 
 # Raw trade schema (lossless - all original fields + derived)
+# Low-cardinality code columns (exchanges, conditions, symbols, run ids) are
+# Categorical: dictionary-encoded in memory and in Parquet
 RAW_TRADE_SCHEMA = {
     # Original fields
     "date": pl.Date,
@@ -15,24 +17,24 @@ RAW_TRADE_SCHEMA = {
     "part_time_nano": pl.Int16,
     "trf_time": pl.Time,
     "trf_time_nano": pl.Int16,
-    "sym_root": pl.Utf8,
-    "sym_suffix": pl.Utf8,
-    "ex": pl.Utf8,
+    "sym_root": pl.Categorical,
+    "sym_suffix": pl.Categorical,
+    "ex": pl.Categorical,  # Exchange code (low cardinality)
     "price": pl.Decimal(precision=10, scale=4),  # Lossless price
     "size": pl.Int32,
-    "tr_corr": pl.Utf8,
+    "tr_corr": pl.Categorical,
     "tr_id": pl.Int64,
-    "tr_rf": pl.Utf8,
-    "tr_scond": pl.Utf8,
+    "tr_rf": pl.Categorical,
+    "tr_scond": pl.Categorical,
     "tr_seqnum": pl.Int64,
-    "tr_source": pl.Utf8,
-    "tr_stop_ind": pl.Utf8,
-    "tte_ind": pl.Utf8,
+    "tr_source": pl.Categorical,
+    "tr_stop_ind": pl.Categorical,
+    "tte_ind": pl.Categorical,
     # Derived fields
     "trade_date": pl.Date,  # Same as date, for partitioning
-    "symbol": pl.Utf8,  # Canonical symbol
+    "symbol": pl.Categorical,  # Canonical symbol
     "ts_event": pl.Datetime(time_zone="UTC"),  # Canonical timestamp
-    "extract_run_id": pl.Utf8,  # UUID string
+    "extract_run_id": pl.Categorical,  # UUID string, one per run
     "ingest_ts": pl.Datetime(time_zone="UTC"),  # When ingested
 }
 
@@ -42,21 +44,21 @@ RAW_QUOTE_SCHEMA = {
     "date": pl.Date,
     "time_m": pl.Time,
     "time_m_nano": pl.Int16,
-    "sym_root": pl.Utf8,
-    "sym_suffix": pl.Utf8,
-    "ex": pl.Utf8,
+    "sym_root": pl.Categorical,
+    "sym_suffix": pl.Categorical,
+    "ex": pl.Categorical,
     "bid": pl.Decimal(precision=10, scale=4),
     "bidsiz": pl.Int32,
     "ask": pl.Decimal(precision=10, scale=4),
     "asksiz": pl.Int32,
     "qu_seqnum": pl.Int64,
-    "qu_cancel": pl.Utf8,
-    "qu_source": pl.Utf8,
+    "qu_cancel": pl.Categorical,
+    "qu_source": pl.Categorical,
     # Derived fields
     "trade_date": pl.Date,
-    "symbol": pl.Utf8,
+    "symbol": pl.Categorical,
     "ts_event": pl.Datetime(time_zone="UTC"),
-    "extract_run_id": pl.Utf8,
+    "extract_run_id": pl.Categorical,
     "ingest_ts": pl.Datetime(time_zone="UTC"),
 }
 
@@ -66,27 +68,122 @@ RAW_NBBO_SCHEMA = {
     "date": pl.Date,
     "time_m": pl.Time,
     "time_m_nano": pl.Int16,
-    "sym_root": pl.Utf8,
-    "sym_suffix": pl.Utf8,
+    "sym_root": pl.Categorical,
+    "sym_suffix": pl.Categorical,
     "best_bid": pl.Decimal(precision=10, scale=4),
     "best_bidsiz": pl.Int32,
     "best_ask": pl.Decimal(precision=10, scale=4),
     "best_asksiz": pl.Int32,
-    "best_bidex": pl.Utf8,
-    "best_askex": pl.Utf8,
-    "nbbo_qu_cond": pl.Utf8,
-    "secstat_ind": pl.Utf8,
-    "luld_indicator": pl.Utf8,
+    "best_bidex": pl.Categorical,
+    "best_askex": pl.Categorical,
+    "nbbo_qu_cond": pl.Categorical,
+    "secstat_ind": pl.Categorical,
+    "luld_indicator": pl.Categorical,
     "luld_bbo_cqs": pl.Decimal(precision=10, scale=4),
     "luld_bbo_uts": pl.Decimal(precision=10, scale=4),
     # Derived fields
     "trade_date": pl.Date,
-    "symbol": pl.Utf8,
+    "symbol": pl.Categorical,
     "ts_event": pl.Datetime(time_zone="UTC"),
-    "extract_run_id": pl.Utf8,
+    "extract_run_id": pl.Categorical,
     "ingest_ts": pl.Datetime(time_zone="UTC"),
 }
 
+RAW_SCHEMAS = {
+    "trades": RAW_TRADE_SCHEMA,
+    "quotes": RAW_QUOTE_SCHEMA,
+    "nbbo": RAW_NBBO_SCHEMA,
+}
+
+# Columns added by the extractors; the rest of each raw schema comes from the source
+DERIVED_COLUMNS = ("trade_date", "symbol", "ts_event", "extract_run_id", "ingest_ts")
+
+# Source columns the derived columns are built from (always selected)
+KEY_SOURCE_COLUMNS = ["date", "time_m", "time_m_nano", "sym_root", "sym_suffix"]
+
+# Column profiles for source queries: "full" is every original column of the
+# raw schema, "lean" only what enrichment, bars and the app use
+COLUMN_PROFILES = ("full", "lean")
+LEAN_SOURCE_COLUMNS = {
+    "trades": KEY_SOURCE_COLUMNS + ["ex", "price", "size", "tr_corr", "tr_scond", "tr_seqnum"],
+    "quotes": KEY_SOURCE_COLUMNS + ["ex", "bid", "bidsiz", "ask", "asksiz", "qu_seqnum"],
+    "nbbo": KEY_SOURCE_COLUMNS + ["best_bid", "best_bidsiz", "best_ask", "best_asksiz", "best_bidex", "best_askex"],
+}
+
+
+def source_columns(
+    data_type: str,
+    profile: str = "full",
+    columns: list[str] | None = None,
+) -> list[str]:
+    """
+    Source columns to request for a dataset.
+    
+    Args:
+        data_type: "trades", "quotes" or "nbbo"
+        profile: Column profile ("full" or "lean"), used if columns is not given
+        columns: Explicit column list (overrides the profile)
+        
+    Returns:
+        Column names; the key columns needed for symbol and ts_event are
+        always included
+    """
+    if columns is None:
+        if profile == "full":
+            columns = [c for c in RAW_SCHEMAS[data_type] if c not in DERIVED_COLUMNS]
+        elif profile == "lean":
+            columns = LEAN_SOURCE_COLUMNS[data_type]
+        else:
+            raise ValueError(f"Unknown column profile: {profile}. Valid profiles: {COLUMN_PROFILES}")
+    return [c for c in KEY_SOURCE_COLUMNS if c not in columns] + list(columns)
+
+
+def _cast_column(name: str, source: pl.DataType, target: pl.DataType) -> pl.Expr:
+    """Expression casting one column to its canonical dtype."""
+    col = pl.col(name)
+    if source == target:
+        return col
+    if source == pl.Utf8 and target == pl.Date:
+        return col.str.to_date("%Y-%m-%d")
+    if source == pl.Utf8 and target == pl.Time:
+        return col.str.to_time("%H:%M:%S%.f")
+    if target == pl.Categorical and source != pl.Utf8:
+        # e.g. CSV codes inferred as integers
+        col = col.cast(pl.Utf8)
+    return col.cast(target)
+
+
+def cast_to_schema(
+    df: pl.DataFrame,
+    schema: dict[str, pl.DataType],
+    keep_extra: bool = True,
+) -> pl.DataFrame:
+    """
+    Cast a DataFrame to a canonical schema in one pass.
+    
+    Canonical columns come first, in schema order, cast to the schema dtype;
+    columns the source does not provide are added as typed nulls. Columns not
+    in the schema are appended unchanged if keep_extra, otherwise dropped.
+    Every source (WRDS, Alpaca, CSV) goes through this before writing, so
+    partitions of all sources concatenate without casts. Text dates and times
+    (CSV) are parsed as %Y-%m-%d and %H:%M:%S%.f.
+    
+    Args:
+        df: DataFrame to cast
+        schema: Canonical schema (e.g. RAW_TRADE_SCHEMA)
+        keep_extra: Keep non-canonical columns after the canonical ones
+        
+    Returns:
+        DataFrame whose canonical columns match the schema exactly
+    """
+    exprs = [
+        (_cast_column(name, df.schema[name], dtype) if name in df.columns else pl.lit(None, dtype=dtype)).alias(name)
+        for name, dtype in schema.items()
+    ]
+    if keep_extra:
+        exprs.extend(pl.col(name) for name in df.columns if name not in schema)
+    return df.select(exprs)
+
 
 def build_canonical_symbol(sym_root: pl.Expr, sym_suffix: pl.Expr) -> pl.Expr:
     """Build canonical symbol: sym_root if suffix is blank/null, else sym_root.suffix."""
@@ -3,27 +3,24 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing.util
+import time
 import uuid
-from datetime import date, datetime
-from pathlib import Path
+from concurrent.futures import as_completed
+from datetime import date
 from typing import Literal
 
-import polars as pl
-
+from .compression import profile_for
 from .config import StageAConfig
-from .date_utils import filter_trading_days, get_date_range
+from .date_utils import filter_trading_days, get_date_range, is_trading_day
 from .ingestion_checker import (
-    check_ingestion_status,
     check_partition_exists,
     delete_partitions_for_symbols,
     get_missing_data,
-    is_fully_ingested,
-)
-from .parquet_writer import (
-    write_chunks_incrementally,
-    write_partitioned_streaming,
 )
-from .schemas import build_canonical_symbol, build_ts_event
+from .parquet_writer import write_chunks_incrementally
+from .partitions import date_partition_dir, symbol_partition_dir
+from .workers import spawn_pool
 from .wrds_extractor import WRDSExtractor
 
 logger = logging.getLogger(__name__)
@@ -38,6 +35,7 @@ def extract_stage_a(
     overwrite: bool = False,
     data_types: list[str] | None = None,
     resume: bool = False,
+    extractor: WRDSExtractor | None = None,
 ) -> dict[str, int]:
     """
     Execute Stage A extraction for the given date and symbols.
@@ -53,6 +51,8 @@ def extract_stage_a(
         overwrite: If True, overwrite existing data
         data_types: List of data types to extract (default: ["trades", "nbbo"])
         resume: If True, skip symbols that are already ingested (useful for resuming interrupted extractions)
+        extractor: Open WRDSExtractor to reuse (left open); by default one
+            connection is opened for this call and closed at the end
         
     Returns:
         Dictionary with row counts: {"trades": 1000, "quotes": 2000, "nbbo": 1500}
@@ -67,6 +67,10 @@ def extract_stage_a(
     if invalid_types:
         raise ValueError(f"Invalid data types: {invalid_types}. Valid types: {valid_types}")
     
+    if not is_trading_day(trade_date):
+        logger.warning(f"{trade_date} is not a trading day (weekend or market holiday), skipping")
+        return {"trades": 0, "quotes": 0, "nbbo": 0}
+    
     logger.info("=" * 80)
     logger.info(f"Stage A: Extract raw data for {trade_date} ({len(symbols)} symbols)")
     logger.info(f"Data types: {', '.join(data_types)}")
@@ -128,11 +132,10 @@ def extract_stage_a(
                 logger.debug(f"  Sample check for {dt} symbol '{sample_symbol}': exists={sample_exists}")
                 if not sample_exists:
                     # Show what directory we're looking for
-                    date_str = trade_date.isoformat()
                     if config.partition_by_symbol:
-                        expected_dir = config.parquet_raw_root / dt / f"trade_date={date_str}" / f"symbol={sample_symbol}"
+                        expected_dir = symbol_partition_dir(config.parquet_raw_root, dt, trade_date, sample_symbol)
                     else:
-                        expected_dir = config.parquet_raw_root / dt / f"trade_date={date_str}"
+                        expected_dir = date_partition_dir(config.parquet_raw_root, dt, trade_date)
                     logger.debug(f"  Expected directory: {expected_dir}")
                     logger.debug(f"  Directory exists: {expected_dir.exists()}")
         
@@ -149,7 +152,7 @@ def extract_stage_a(
                 break
         
         if all_ingested:
-            logger.info(f"✓ All specified data types already ingested. Nothing to resume.")
+            logger.info("✓ All specified data types already ingested. Nothing to resume.")
             results = {"trades": 0, "quotes": 0, "nbbo": 0}
             return results
     else:
@@ -164,7 +167,7 @@ def extract_stage_a(
                 break
         
         if all_ingested:
-            logger.info(f"✓ All specified data types already ingested. Use --overwrite to re-extract or --resume to continue.")
+            logger.info("✓ All specified data types already ingested. Use --overwrite to re-extract or --resume to continue.")
             results = {"trades": 0, "quotes": 0, "nbbo": 0}
             return results
         
@@ -179,6 +182,37 @@ def extract_stage_a(
     
     results = {"trades": 0, "quotes": 0, "nbbo": 0}
     
+    # One connection for all data types (or the caller's, reused across dates)
+    owns_extractor = extractor is None
+    if owns_extractor:
+        extractor = WRDSExtractor(config)
+    try:
+        _extract_data_types(config, extractor, trade_date, data_types, symbols_to_extract, extract_run_id, results)
+    finally:
+        if owns_extractor:
+            extractor.close()
+    
+    logger.info("\n" + "=" * 80)
+    logger.info("Stage A Complete!")
+    logger.info("=" * 80)
+    for dt in data_types:
+        logger.info(f"{dt.capitalize()}: {results[dt]:,} rows")
+    
+    return results
+
+
+def _extract_data_types(
+    config: StageAConfig,
+    extractor: WRDSExtractor,
+    trade_date: date,
+    data_types: list[str],
+    symbols_to_extract: dict[str, list[str]],
+    extract_run_id: str,
+    results: dict[str, int],
+) -> None:
+    """Stream each data type from WRDS into Parquet, filling in results."""
+    extractor.connect()
+    
     # Step 2: Process each specified data type
     for data_type in data_types:
         if not symbols_to_extract[data_type]:
@@ -191,42 +225,76 @@ def extract_stage_a(
         
         # Extract from WRDS using streaming (memory-efficient)
         logger.info("Extracting from WRDS (streaming mode)...")
-            
-            with WRDSExtractor(config) as extractor:
-                # Create iterator based on data type
-                if data_type == "trades":
-                    chunk_iterator = extractor.extract_trades_streaming(
-                        trade_date, symbols_to_extract[data_type], extract_run_id
-                    )
-                elif data_type == "quotes":
-                    chunk_iterator = extractor.extract_quotes_streaming(
-                        trade_date, symbols_to_extract[data_type], extract_run_id
-                    )
-                else:  # nbbo
-                    chunk_iterator = extractor.extract_nbbo_streaming(
-                        trade_date, symbols_to_extract[data_type], extract_run_id
-                    )
-                
-                # Write chunks incrementally (avoids accumulating in memory)
-                results[data_type] = write_chunks_incrementally(
-                    chunk_iterator,
-                    config.parquet_raw_root,
-                    data_type,
-                    trade_date,
-                    compression=config.compression,
-                    partition_by_symbol=config.partition_by_symbol,
-                )
-                
-                if results[data_type] == 0:
-                    logger.warning(f"No data extracted for {data_type}")
-    
-    logger.info("\n" + "=" * 80)
-    logger.info("Stage A Complete!")
-    logger.info("=" * 80)
-    for dt in data_types:
-        logger.info(f"{dt.capitalize()}: {results[dt]:,} rows")
-    
-    return results
+        
+        # Create iterator based on data type
+        if data_type == "trades":
+            chunk_iterator = extractor.extract_trades_streaming(
+                trade_date, symbols_to_extract[data_type], extract_run_id
+            )
+        elif data_type == "quotes":
+            chunk_iterator = extractor.extract_quotes_streaming(
+                trade_date, symbols_to_extract[data_type], extract_run_id
+            )
+        else:  # nbbo
+            chunk_iterator = extractor.extract_nbbo_streaming(
+                trade_date, symbols_to_extract[data_type], extract_run_id
+            )
+        
+        # Write chunks incrementally (avoids accumulating in memory)
+        results[data_type] = write_chunks_incrementally(
+            chunk_iterator,
+            config.parquet_raw_root,
+            data_type,
+            trade_date,
+            compression=profile_for(config.compression, config.compression_profiles, data_type),
+            partition_by_symbol=config.partition_by_symbol,
+            row_group_size=config.row_group_size,
+            staged=config.staged_writes,
+        )
+        
+        if results[data_type] == 0:
+            logger.warning(f"No data extracted for {data_type}")
+
+
+# Per-process extractor for range workers: one WRDS connection per worker, reused across dates
+_WORKER_EXTRACTOR: WRDSExtractor | None = None
+
+
+def _init_range_worker(config: StageAConfig, log_level: int) -> None:
+    """Process pool initializer: set up logging and this worker's extractor."""
+    global _WORKER_EXTRACTOR
+    logging.basicConfig(
+        level=log_level,
+        format="%(asctime)s %(levelname)s [%(processName)s %(name)s] %(message)s",
+    )
+    _WORKER_EXTRACTOR = WRDSExtractor(config)
+    # Pool workers exit without running atexit hooks; Finalize runs on worker shutdown
+    multiprocessing.util.Finalize(None, _WORKER_EXTRACTOR.close, exitpriority=10)
+
+
+def _extract_date_in_worker(
+    config: StageAConfig,
+    trade_date: date,
+    symbols: list[str],
+    overwrite: bool,
+    data_types: list[str],
+    resume: bool,
+) -> dict[str, int]:
+    """Extract one date in a range worker, reusing the worker's connection."""
+    try:
+        return extract_stage_a(
+            config=config,
+            trade_date=trade_date,
+            symbols=symbols,
+            overwrite=overwrite,
+            data_types=data_types,
+            resume=resume,
+            extractor=_WORKER_EXTRACTOR,
+        )
+    except Exception:
+        # Drop a possibly broken connection; the next date reconnects
+        _WORKER_EXTRACTOR.close()
+        raise
 
 
 def extract_stage_a_range(
@@ -237,15 +305,21 @@ def extract_stage_a_range(
     overwrite: bool = False,
     data_types: list[str] | None = None,
     resume: bool = False,
+    max_workers: int | None = None,
 ) -> dict[date, dict[str, int]]:
     """
     Execute Stage A extraction for a date range.
     
     For each date in the range:
-    1. Check if it's a trading day (weekday)
+    1. Check if it's a trading day (NYSE calendar: weekdays minus holidays)
     2. Check if TAQ tables are available
     3. Extract data if both conditions are met
     
+    With more than one worker, dates are extracted concurrently in a process
+    pool; each worker holds one WRDS connection for all of its dates, so the
+    worker count is the WRDS connection budget. With one worker, dates run in
+    sequence over a single connection.
+    
     Args:
         config: Stage A configuration
         start_date: Start date (inclusive)
@@ -254,6 +328,7 @@ def extract_stage_a_range(
         overwrite: If True, overwrite existing data
         data_types: List of data types to extract (default: ["trades", "nbbo"])
         resume: If True, skip symbols that are already ingested
+        max_workers: Dates extracted concurrently (default: config.max_wrds_connections)
         
     Returns:
         Dictionary mapping dates to extraction results:
@@ -277,50 +352,82 @@ def extract_stage_a_range(
     all_dates = get_date_range(start_date, end_date)
     logger.info(f"Total dates in range: {len(all_dates)}")
     
-    # Filter to trading days (weekdays)
+    # Filter to trading days (weekdays that are not market holidays)
     trading_days = filter_trading_days(all_dates)
-    logger.info(f"Trading days (weekdays): {len(trading_days)}")
+    logger.info(f"Trading days: {len(trading_days)}")
     
-    # Check table availability for each trading day
-    logger.info("\nChecking TAQ table availability...")
-    valid_dates = []
+    if max_workers is None:
+        max_workers = config.max_wrds_connections
+    
+    start = time.perf_counter()
+    all_results: dict[date, dict[str, int]] = {}
     
     with WRDSExtractor(config) as extractor:
+        # Check table availability for each trading day
+        logger.info("\nChecking TAQ table availability...")
+        valid_dates = []
+        
         for check_date in trading_days:
             if extractor.check_tables_available(check_date, data_types):
                 valid_dates.append(check_date)
                 logger.info(f"  ✓ {check_date}: Tables available")
             else:
                 logger.info(f"  ✗ {check_date}: Tables not available (skipping)")
+        
+        logger.info(f"\nFound {len(valid_dates)} dates with available TAQ tables")
+        
+        if not valid_dates:
+            logger.warning("No valid dates found with available TAQ tables")
+            return {}
+        
+        workers = max(1, min(max_workers, len(valid_dates)))
+        if workers == 1:
+            # Sequential: reuse the availability-check connection for every date
+            for i, trade_date in enumerate(valid_dates, 1):
+                logger.info("\n" + "=" * 80)
+                logger.info(f"Processing date {i}/{len(valid_dates)}: {trade_date}")
+                logger.info("=" * 80)
+                
+                try:
+                    results = extract_stage_a(
+                        config=config,
+                        trade_date=trade_date,
+                        symbols=symbols,
+                        overwrite=overwrite,
+                        data_types=data_types,
+                        resume=resume,
+                        extractor=extractor,
+                    )
+                    all_results[trade_date] = results
+                except Exception as e:
+                    logger.error(f"Error extracting data for {trade_date}: {e}", exc_info=True)
+                    logger.warning(f"Skipping {trade_date} and continuing with next date...")
+                    all_results[trade_date] = {"trades": 0, "quotes": 0, "nbbo": 0}
+                    # Reconnect for the next date in case the connection broke
+                    extractor.close()
     
-    logger.info(f"\nFound {len(valid_dates)} dates with available TAQ tables")
-    
-    if not valid_dates:
-        logger.warning("No valid dates found with available TAQ tables")
-        return {}
-    
-    # Extract data for each valid date
-    all_results: dict[date, dict[str, int]] = {}
+    if workers > 1:
+        logger.info(f"\nExtracting {len(valid_dates)} dates with {workers} parallel workers (one WRDS connection each)")
+        with spawn_pool(
+            workers,
+            initializer=_init_range_worker,
+            initargs=(config, logging.getLogger().getEffectiveLevel()),
+        ) as pool:
+            futures = {
+                pool.submit(_extract_date_in_worker, config, trade_date, symbols, overwrite, data_types, resume): trade_date
+                for trade_date in valid_dates
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                trade_date = futures[future]
+                try:
+                    all_results[trade_date] = future.result()
+                    day_rows = sum(all_results[trade_date].get(dt, 0) for dt in data_types)
+                    logger.info(f"  ✓ {trade_date} ({done}/{len(valid_dates)}): {day_rows:,} rows")
+                except Exception as e:
+                    logger.error(f"  ✗ {trade_date} ({done}/{len(valid_dates)}): {e}")
+                    all_results[trade_date] = {"trades": 0, "quotes": 0, "nbbo": 0}
     
-    for i, trade_date in enumerate(valid_dates, 1):
-        logger.info("\n" + "=" * 80)
-        logger.info(f"Processing date {i}/{len(valid_dates)}: {trade_date}")
-        logger.info("=" * 80)
-        
-        try:
-            results = extract_stage_a(
-                config=config,
-                trade_date=trade_date,
-                symbols=symbols,
-                overwrite=overwrite,
-                data_types=data_types,
-                resume=resume,
-            )
-            all_results[trade_date] = results
-        except Exception as e:
-            logger.error(f"Error extracting data for {trade_date}: {e}", exc_info=True)
-            logger.warning(f"Skipping {trade_date} and continuing with next date...")
-            all_results[trade_date] = {"trades": 0, "quotes": 0, "nbbo": 0}
+    elapsed = time.perf_counter() - start
     
     # Summary
     logger.info("\n" + "=" * 80)
@@ -338,6 +445,11 @@ def extract_stage_a_range(
     for dt in data_types:
         logger.info(f"  {dt.capitalize()}: {total_rows[dt]:,} rows")
     
+    grand_total = sum(total_rows[dt] for dt in data_types)
+    logger.info(f"\nThroughput: {grand_total / max(elapsed, 1e-9):,.0f} rows/s, "
+                f"{len(all_results) / max(elapsed, 1e-9) * 3600:,.1f} dates/hour "
+                f"({elapsed:.1f}s with {workers} worker(s))")
+    
     logger.info("\nPer-date breakdown:")
     for trade_date, results in sorted(all_results.items()):
         row_str = ", ".join([f"{dt}: {results.get(dt, 0):,}" for dt in data_types])
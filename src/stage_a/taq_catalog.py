@@ -0,0 +1,191 @@
+"""Catalog of available WRDS TAQ tables, listed from information_schema and cached."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Daily TAQ table name per data type
+TABLE_PREFIXES = {
+    "trades": "ctm",
+    "quotes": "cqm",
+    "nbbo": "complete_nbbo",
+}
+
+# A listing of the current year can lack days published since it was fetched;
+# on a miss it is refetched once it is older than this
+REFRESH_AFTER_SECONDS = 60.0
+
+# (schema, year) -> (fetched_at epoch seconds, table names); shared by all extractors in the process
+_CATALOG_CACHE: dict[tuple[str, str], tuple[float, frozenset[str]]] = {}
+_CATALOG_CACHE_LOCK = threading.Lock()
+
+# (schema, table) -> column names in table order; daily tables never change once published
+_COLUMNS_CACHE: dict[tuple[str, str], list[str]] = {}
+
+
+def table_name_for(data_type: str, trade_date: date) -> Optional[str]:
+    """Daily TAQ table name for a data type (e.g. "ctm_20240610"), or None if unknown."""
+    prefix = TABLE_PREFIXES.get(data_type)
+    return f"{prefix}_{trade_date.strftime('%Y%m%d')}" if prefix else None
+
+
+def candidate_schemas(year: str) -> list[str]:
+    """Schemas that may hold a year's daily tables, in lookup order."""
+    return [f"taqm_{year}", "taqmsec"]
+
+
+class TAQCatalog:
+    """
+    Which daily TAQ tables exist, one information_schema query per (schema, year).
+
+    Listings are cached in-process and, if ``cache_dir`` is set, on disk. Past
+    years are complete, so their listings never expire; a listing that might
+    be missing recently published days is refetched when a lookup misses and
+    it is older than REFRESH_AFTER_SECONDS.
+    """
+
+    def __init__(self, raw_sql: Callable[[str], Any], cache_dir: Optional[Path] = None):
+        """
+        Args:
+            raw_sql: Runs a query and returns a DataFrame (e.g. wrds.Connection.raw_sql)
+            cache_dir: Directory for on-disk listings (None = in-process only)
+        """
+        self._raw_sql = raw_sql
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+    def find_schema(self, table_name: str, year: str) -> Optional[str]:
+        """
+        Schema holding a daily table, or None if it does not exist (yet).
+
+        Args:
+            table_name: Table name, e.g. "ctm_20240610"
+            year: Year of the table's date, e.g. "2024"
+
+        Returns:
+            Schema name or None
+        """
+        for schema in candidate_schemas(year):
+            if table_name in self.tables(schema, year):
+                return schema
+        # Refresh stale listings once before reporting a miss
+        for schema in candidate_schemas(year):
+            if table_name in self.tables(schema, year, refresh_stale=True):
+                return schema
+        return None
+
+    def tables(self, schema: str, year: str, refresh_stale: bool = False) -> frozenset[str]:
+        """
+        Daily TAQ table names of a year in a schema.
+
+        Args:
+            schema: Schema name
+            year: Year to list
+            refresh_stale: Refetch if the listing could be incomplete and is
+                older than REFRESH_AFTER_SECONDS
+
+        Returns:
+            Set of table names
+        """
+        key = (schema, year)
+        with _CATALOG_CACHE_LOCK:
+            cached = _CATALOG_CACHE.get(key)
+        if cached is None:
+            cached = self._read_disk(schema, year)
+        if cached is not None and not (refresh_stale and self._is_stale(year, cached[0])):
+            with _CATALOG_CACHE_LOCK:
+                _CATALOG_CACHE[key] = cached
+            return cached[1]
+
+        tables = self._fetch(schema, year)
+        cached = (time.time(), tables)
+        with _CATALOG_CACHE_LOCK:
+            _CATALOG_CACHE[key] = cached
+        self._write_disk(schema, year, cached)
+        return tables
+
+    def columns(self, schema: str, table_name: str) -> list[str]:
+        """
+        Column names of a table, in table order (cached in-process).
+
+        Args:
+            schema: Schema name
+            table_name: Table name
+
+        Returns:
+            Column names (empty if the catalog does not show the table)
+        """
+        key = (schema, table_name)
+        with _CATALOG_CACHE_LOCK:
+            cached = _COLUMNS_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        df = self._raw_sql(f"""
+        SELECT column_name
+        FROM information_schema.columns
+        WHERE table_schema = '{schema}'
+          AND table_name = '{table_name}'
+        ORDER BY ordinal_position
+        """)
+        columns = list(df["column_name"]) if len(df) > 0 else []
+        if columns:
+            with _CATALOG_CACHE_LOCK:
+                _COLUMNS_CACHE[key] = columns
+        return columns
+
+    @staticmethod
+    def _is_stale(year: str, fetched_at: float) -> bool:
+        # A listing fetched after the year ended is complete
+        fetched_year = time.gmtime(fetched_at).tm_year
+        if fetched_year > int(year):
+            return False
+        return time.time() - fetched_at > REFRESH_AFTER_SECONDS
+
+    def _fetch(self, schema: str, year: str) -> frozenset[str]:
+        patterns = " OR ".join(f"table_name LIKE '{prefix}_{year}%'" for prefix in TABLE_PREFIXES.values())
+        query = f"""
+        SELECT table_name
+        FROM information_schema.tables
+        WHERE table_schema = '{schema}'
+          AND ({patterns})
+        """
+        df = self._raw_sql(query)
+        tables = frozenset(df["table_name"]) if len(df) > 0 else frozenset()
+        logger.debug(f"Catalog: {len(tables)} TAQ tables in {schema} for {year}")
+        return tables
+
+    def _disk_path(self, schema: str, year: str) -> Path:
+        return self.cache_dir / f"{schema}_{year}.json"
+
+    def _read_disk(self, schema: str, year: str) -> Optional[tuple[float, frozenset[str]]]:
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self._disk_path(schema, year), "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return float(data["fetched_at"]), frozenset(data["tables"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_disk(self, schema: str, year: str, cached: tuple[float, frozenset[str]]) -> None:
+        if self.cache_dir is None:
+            return
+        path = self._disk_path(schema, year)
+        tmp_path = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"fetched_at": cached[0], "tables": sorted(cached[1])}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # The cache is an optimization; the listing is still used in-process
+            logger.warning(f"Could not write TAQ catalog cache {path}: {e}")
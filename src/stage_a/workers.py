@@ -0,0 +1,34 @@
+"""Process pools for the stages' parallel work."""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+
+def spawn_pool(
+    max_workers: Optional[int],
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: tuple[Any, ...] = (),
+) -> ProcessPoolExecutor:
+    """
+    Process pool whose workers are spawned, not forked.
+
+    Forking after Polars has started its thread pool can deadlock the child,
+    so every stage creates its worker processes here.
+
+    Args:
+        max_workers: Number of worker processes (None = CPU count)
+        initializer: Optional function run once in each worker
+        initargs: Arguments for initializer
+
+    Returns:
+        ProcessPoolExecutor (use as a context manager)
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=initializer,
+        initargs=initargs,
+    )
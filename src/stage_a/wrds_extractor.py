@@ -11,7 +11,17 @@ import polars as pl
 import wrds
 
 from .config import StageAConfig
-from .schemas import build_canonical_symbol, build_ts_event
+from .date_utils import session_times
+from .schemas import (
+    RAW_NBBO_SCHEMA,
+    RAW_QUOTE_SCHEMA,
+    RAW_TRADE_SCHEMA,
+    build_canonical_symbol,
+    build_ts_event,
+    cast_to_schema,
+    source_columns,
+)
+from .taq_catalog import TAQCatalog, candidate_schemas, table_name_for
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +38,7 @@ class WRDSExtractor:
     def __init__(self, config: StageAConfig):
         self.config = config
         self.db: wrds.Connection | None = None
+        self._catalog: TAQCatalog | None = None
     
     def connect(self):
         """Connect to WRDS."""
@@ -109,11 +120,16 @@ class WRDSExtractor:
         logger.info(f"✓ Total symbols: {len(all_symbols)} ({len(sp500_tickers)} stocks + {len(TOP_ETFS)} ETFs)")
         return all_symbols
     
-    def _find_schema(self, table_name: str, year: str) -> str:
-        """Find the correct schema for a table."""
-        schemas_to_try = [f"taqm_{year}", "taqmsec"]
-        
-        for schema in schemas_to_try:
+    @property
+    def catalog(self) -> TAQCatalog:
+        """Cached listing of available TAQ tables (queried over this connection)."""
+        if self._catalog is None:
+            self._catalog = TAQCatalog(lambda query: self.db.raw_sql(query), self.config.taq_catalog_cache_dir)
+        return self._catalog
+    
+    def _probe_schema(self, table_name: str, year: str) -> str | None:
+        """Find a table's schema by querying it directly (fallback if the catalog is unavailable)."""
+        for schema in candidate_schemas(year):
             try:
                 test_query = f"SELECT 1 FROM {schema}.{table_name} LIMIT 1"
                 self.db.raw_sql(test_query)
@@ -126,13 +142,81 @@ class WRDSExtractor:
                 else:
                     # Might still be valid, try it
                     return schema
+        return None
+    
+    def _lookup_schema(self, table_name: str, year: str) -> str | None:
+        """Schema holding a table, or None if it does not exist."""
+        if self.db is None:
+            self.connect()
+        try:
+            return self.catalog.find_schema(table_name, year)
+        except Exception as e:
+            logger.warning(f"TAQ catalog query failed ({e}), probing {table_name} directly")
+            return self._probe_schema(table_name, year)
+    
+    def _find_schema(self, table_name: str, year: str) -> str:
+        """Find the correct schema for a table."""
+        schema = self._lookup_schema(table_name, year)
+        if schema is None:
+            raise ValueError(f"Could not find table {table_name} in any schema (tried: {candidate_schemas(year)})")
+        return schema
+    
+    def _select_list(self, data_type: str, schema: str, table_name: str) -> tuple[str, list[str] | None]:
+        """
+        SELECT list for a dataset: the configured column profile, limited to
+        columns the table actually has (older tables lack some fields).
+        
+        If the table's columns cannot be listed, no unverified names are sent:
+        the query selects ``*`` and the returned projection is applied to each
+        fetched chunk instead (see _project).
         
-        raise ValueError(f"Could not find table {table_name} in any schema (tried: {schemas_to_try})")
+        Returns:
+            (SELECT list, columns to keep after fetching or None)
+        """
+        wanted = source_columns(data_type, self.config.column_profile, self.config.columns.get(data_type))
+        derived = self._derived_select() if self.config.server_side_derive else []
+        try:
+            available = set(self.catalog.columns(schema, table_name))
+        except Exception as e:
+            logger.warning(f"Could not list columns of {schema}.{table_name} ({e}), selecting all columns")
+            available = set()
+        if not available:
+            projection = wanted + (["symbol", "ts_event_ns"] if derived else [])
+            return ", ".join(["*"] + derived), projection
+        missing = [c for c in wanted if c not in available]
+        if missing:
+            logger.debug(f"{schema}.{table_name} has no {missing}, not selecting them")
+        wanted = [c for c in wanted if c in available]
+        return ", ".join(wanted + derived), None
+    
+    @staticmethod
+    def _project(df: pl.DataFrame, projection: list[str] | None) -> pl.DataFrame:
+        """Keep the projected columns the chunk has (no-op without a projection)."""
+        if projection is None:
+            return df
+        return df.select([c for c in projection if c in df.columns])
+    
+    def _derived_select(self) -> list[str]:
+        """
+        SQL for the canonical symbol and an epoch-nanosecond event time, so the
+        client only casts them (see _add_derived_fields).
+        """
+        timezone = self.config.timezone
+        return [
+            "CASE WHEN sym_suffix IS NULL OR btrim(sym_suffix) = '' THEN btrim(sym_root) "
+            "ELSE btrim(sym_root) || '.' || btrim(sym_suffix) END AS symbol",
+            # Whole microseconds from the local timestamp, then the sub-microsecond nanos
+            f"(EXTRACT(EPOCH FROM ((date + time_m) AT TIME ZONE '{timezone}')) * 1000000)::bigint * 1000 "
+            "+ COALESCE(time_m_nano, 0) AS ts_event_ns",
+        ]
     
     def check_tables_available(self, trade_date: date, data_types: list[str]) -> bool:
         """
         Check if TAQ tables are available for the given date and data types.
         
+        Uses the table catalog, so checking a whole date range costs one
+        listing query per schema per year rather than a query per table.
+        
         Args:
             trade_date: Trade date to check
             data_types: List of data types to check (e.g., ["trades", "nbbo"])
@@ -140,48 +224,19 @@ class WRDSExtractor:
         Returns:
             True if all requested tables exist, False otherwise
         """
-        if self.db is None:
-            self.connect()
-        
-        date_str = trade_date.strftime("%Y%m%d")
         year = trade_date.strftime("%Y")
         
-        # Map data types to table name patterns
-        table_patterns = {
-            "trades": f"ctm_{date_str}",
-            "quotes": f"cqm_{date_str}",
-            "nbbo": f"complete_nbbo_{date_str}",
-        }
-        
-        schemas_to_try = [f"taqm_{year}", "taqmsec"]
-        
         for data_type in data_types:
-            table_name = table_patterns.get(data_type)
+            table_name = table_name_for(data_type, trade_date)
             if not table_name:
                 logger.warning(f"Unknown data type: {data_type}, skipping table check")
                 continue
             
-            # Try to find the table in any schema
-            found = False
-            for schema in schemas_to_try:
-                try:
-                    test_query = f"SELECT 1 FROM {schema}.{table_name} LIMIT 1"
-                    self.db.raw_sql(test_query)
-                    found = True
-                    logger.debug(f"Found {data_type} table: {schema}.{table_name}")
-                    break
-                except Exception as e:
-                    error_msg = str(e).lower()
-                    if 'does not exist' in error_msg or 'undefined' in error_msg:
-                        continue
-                    else:
-                        # Other error might mean table exists but query failed
-                        found = True
-                        break
-            
-            if not found:
+            schema = self._lookup_schema(table_name, year)
+            if schema is None:
                 logger.debug(f"Table not found for {data_type} on {trade_date}")
                 return False
+            logger.debug(f"Found {data_type} table: {schema}.{table_name}")
         
         return True
     
@@ -202,6 +257,8 @@ class WRDSExtractor:
         
         schema = self._find_schema(table_name, year)
         full_table = f"{schema}.{table_name}"
+        session_open, session_close = session_times(trade_date)
+        select_list, projection = self._select_list("trades", schema, table_name)
         
         logger.info(f"Extracting trades from {full_table} for {len(symbols)} symbols")
         
@@ -212,11 +269,11 @@ class WRDSExtractor:
             ticker_str = "','".join(chunk_symbols)
             
             query = f"""
-            SELECT *
+            SELECT {select_list}
             FROM {full_table}
             WHERE tr_corr = '00'
-              AND time_m >= '09:30:00'
-              AND time_m <= '16:00:00'
+              AND time_m >= '{session_open}'
+              AND time_m <= '{session_close}'
               AND sym_root IN ('{ticker_str}')
             ORDER BY sym_root, tr_seqnum
             """
@@ -227,7 +284,7 @@ class WRDSExtractor:
                 
                 if len(df) > 0:
                     # Convert to Polars and add derived fields
-                    df_pl = pl.from_pandas(df)
+                    df_pl = self._project(pl.from_pandas(df), projection)
                     df_pl = self._enrich_trades(df_pl, trade_date, extract_run_id)
                     logger.info(f"  Chunk {i//chunk_size + 1}: {len(df_pl):,} trades")
                     yield df_pl
@@ -250,6 +307,8 @@ class WRDSExtractor:
         
         schema = self._find_schema(table_name, year)
         full_table = f"{schema}.{table_name}"
+        session_open, session_close = session_times(trade_date)
+        select_list, projection = self._select_list("quotes", schema, table_name)
         
         logger.info(f"Extracting quotes from {full_table} for {len(symbols)} symbols")
         
@@ -259,10 +318,10 @@ class WRDSExtractor:
             ticker_str = "','".join(chunk_symbols)
             
             query = f"""
-            SELECT *
+            SELECT {select_list}
             FROM {full_table}
-            WHERE time_m >= '09:30:00'
-              AND time_m <= '16:00:00'
+            WHERE time_m >= '{session_open}'
+              AND time_m <= '{session_close}'
               AND bid > 0
               AND ask > 0
               AND bid < ask
@@ -275,7 +334,7 @@ class WRDSExtractor:
                 df = self.db.raw_sql(query)
                 
                 if len(df) > 0:
-                    df_pl = pl.from_pandas(df)
+                    df_pl = self._project(pl.from_pandas(df), projection)
                     df_pl = self._enrich_quotes(df_pl, trade_date, extract_run_id)
                     logger.info(f"  Chunk {i//chunk_size + 1}: {len(df_pl):,} quotes")
                     yield df_pl
@@ -298,6 +357,8 @@ class WRDSExtractor:
         
         schema = self._find_schema(table_name, year)
         full_table = f"{schema}.{table_name}"
+        session_open, session_close = session_times(trade_date)
+        select_list, projection = self._select_list("nbbo", schema, table_name)
         
         logger.info(f"Extracting NBBO from {full_table} for {len(symbols)} symbols")
         
@@ -307,10 +368,10 @@ class WRDSExtractor:
             ticker_str = "','".join(chunk_symbols)
             
             query = f"""
-            SELECT *
+            SELECT {select_list}
             FROM {full_table}
-            WHERE time_m >= '09:30:00'
-              AND time_m <= '16:00:00'
+            WHERE time_m >= '{session_open}'
+              AND time_m <= '{session_close}'
               AND best_bid > 0
               AND best_ask > 0
               AND best_ask >= best_bid
@@ -323,7 +384,7 @@ class WRDSExtractor:
                 df = self.db.raw_sql(query)
                 
                 if len(df) > 0:
-                    df_pl = pl.from_pandas(df)
+                    df_pl = self._project(pl.from_pandas(df), projection)
                     df_pl = self._enrich_nbbo(df_pl, trade_date, extract_run_id)
                     logger.info(f"  Chunk {i//chunk_size + 1}: {len(df_pl):,} NBBO records")
                     yield df_pl
@@ -340,20 +401,7 @@ class WRDSExtractor:
         extract_run_id: str,
     ) -> pl.DataFrame:
         """Add derived fields to trades DataFrame."""
-        ingest_ts = datetime.utcnow()
-        
-        return df.with_columns([
-            pl.lit(trade_date).alias("trade_date"),
-            build_canonical_symbol(pl.col("sym_root"), pl.col("sym_suffix")).alias("symbol"),
-            build_ts_event(
-                pl.col("date"),
-                pl.col("time_m"),
-                pl.col("time_m_nano"),
-                self.config.timezone,
-            ).alias("ts_event"),
-            pl.lit(extract_run_id).alias("extract_run_id"),
-            pl.lit(ingest_ts).alias("ingest_ts"),
-        ])
+        return self._add_derived_fields(df, trade_date, extract_run_id, RAW_TRADE_SCHEMA)
     
     def _enrich_quotes(
         self,
@@ -362,20 +410,7 @@ class WRDSExtractor:
         extract_run_id: str,
     ) -> pl.DataFrame:
         """Add derived fields to quotes DataFrame."""
-        ingest_ts = datetime.utcnow()
-        
-        return df.with_columns([
-            pl.lit(trade_date).alias("trade_date"),
-            build_canonical_symbol(pl.col("sym_root"), pl.col("sym_suffix")).alias("symbol"),
-            build_ts_event(
-                pl.col("date"),
-                pl.col("time_m"),
-                pl.col("time_m_nano"),
-                self.config.timezone,
-            ).alias("ts_event"),
-            pl.lit(extract_run_id).alias("extract_run_id"),
-            pl.lit(ingest_ts).alias("ingest_ts"),
-        ])
+        return self._add_derived_fields(df, trade_date, extract_run_id, RAW_QUOTE_SCHEMA)
     
     def _enrich_nbbo(
         self,
@@ -384,18 +419,48 @@ class WRDSExtractor:
         extract_run_id: str,
     ) -> pl.DataFrame:
         """Add derived fields to NBBO DataFrame."""
+        return self._add_derived_fields(df, trade_date, extract_run_id, RAW_NBBO_SCHEMA)
+    
+    def _add_derived_fields(
+        self,
+        df: pl.DataFrame,
+        trade_date: date,
+        extract_run_id: str,
+        schema: dict[str, pl.DataType],
+    ) -> pl.DataFrame:
+        """
+        Add trade_date, symbol, ts_event, extract_run_id and ingest_ts, and
+        cast the result to the dataset's canonical schema (Decimal prices,
+        Int32 sizes, Categorical codes), as the Alpaca extractor does.
+        
+        If the query computed symbol and ts_event_ns server-side they are only
+        cast; otherwise they are built from the raw columns.
+        """
         ingest_ts = datetime.utcnow()
         
-        return df.with_columns([
+        if "ts_event_ns" in df.columns:
+            derived = [
+                pl.col("symbol").cast(pl.Utf8),
+                pl.from_epoch(pl.col("ts_event_ns").cast(pl.Int64), time_unit="ns")
+                .dt.replace_time_zone("UTC")
+                .dt.cast_time_unit("us")
+                .alias("ts_event"),
+            ]
+        else:
+            derived = [
+                build_canonical_symbol(pl.col("sym_root"), pl.col("sym_suffix")).alias("symbol"),
+                build_ts_event(
+                    pl.col("date"),
+                    pl.col("time_m"),
+                    pl.col("time_m_nano"),
+                    self.config.timezone,
+                ).alias("ts_event"),
+            ]
+        
+        df = df.with_columns([
             pl.lit(trade_date).alias("trade_date"),
-            build_canonical_symbol(pl.col("sym_root"), pl.col("sym_suffix")).alias("symbol"),
-            build_ts_event(
-                pl.col("date"),
-                pl.col("time_m"),
-                pl.col("time_m_nano"),
-                self.config.timezone,
-            ).alias("ts_event"),
+            *derived,
             pl.lit(extract_run_id).alias("extract_run_id"),
             pl.lit(ingest_ts).alias("ingest_ts"),
-        ])
-
+        ]).drop("ts_event_ns", strict=False)
+        return cast_to_schema(df, schema)
@@ -0,0 +1,193 @@
+"""Shared HTTP client for the Alpaca market data API (SIP and IEX feeds)."""
+
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# One host (data.alpaca.markets), so a single pool sized for concurrent requests
+DEFAULT_POOL_SIZE = 16
+
+
+def create_session(
+    api_key: str,
+    secret_key: str,
+    pool_size: int = DEFAULT_POOL_SIZE,
+) -> requests.Session:
+    """
+    Create a keep-alive session with a sized connection pool and gzip negotiation.
+
+    Transient connection errors and 5xx responses are retried by urllib3 with
+    backoff; 429 is left to the extractor's rate-limit handling.
+
+    Args:
+        api_key: Alpaca API key
+        secret_key: Alpaca secret key
+        pool_size: Maximum pooled connections per host
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "APCA-API-KEY-ID": api_key,
+        "APCA-API-SECRET-KEY": secret_key,
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    })
+    return session
+
+
+class AlpacaClient:
+    """
+    Pooled Alpaca data API client shared by every extractor in a run.
+
+    Holds one HTTP session (so SIP and IEX extractors reuse the same
+    connections) and remembers, per (symbol, endpoint, feed), whether the
+    requested feed returned 404 so later pages skip straight to the fallback
+    request instead of paying for a failed round trip each time.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        secret_key: str,
+        base_url: str = "https://data.alpaca.markets",
+        pool_size: int = DEFAULT_POOL_SIZE,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.session = create_session(api_key, secret_key, pool_size=pool_size)
+        # (symbol, endpoint, feed) -> True if the feed is available, False if it 404s
+        self._feed_available: dict[tuple[str, str, str], bool] = {}
+
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def get_stock_data(
+        self,
+        symbol: str,
+        endpoint: str,
+        params: dict,
+        feed: Optional[str] = None,
+    ) -> dict:
+        """
+        GET /v2/stocks/{symbol}/{endpoint} with cached feed fallback.
+
+        If a non-IEX feed returns 404 the request is retried without the feed
+        parameter, and that decision is cached for the symbol/endpoint.
+
+        Args:
+            symbol: Stock symbol
+            endpoint: "trades" or "quotes"
+            params: Query parameters (start, end, limit, page_token)
+            feed: Data feed ("sip", "iex") or None for the account default
+
+        Returns:
+            API response dictionary ({endpoint: []} if no data is available)
+
+        Raises:
+            requests.exceptions.HTTPError: If API request fails (except 404)
+        """
+        url = f"{self.base_url}/v2/stocks/{symbol}/{endpoint}"
+        params = dict(params)
+        cache_key = (symbol, endpoint, feed or "")
+
+        use_feed = bool(feed) and self._feed_available.get(cache_key, True)
+        if use_feed:
+            params["feed"] = feed
+
+        response = self.session.get(url, params=params)
+
+        if use_feed:
+            if response.status_code == 404 and feed != "iex":
+                logger.warning(f"{feed.upper()} feed not available for {symbol} {endpoint}, using default feed")
+                self._feed_available[cache_key] = False
+                params.pop("feed", None)
+                response = self.session.get(url, params=params)
+            elif response.ok:
+                self._feed_available[cache_key] = True
+
+        # Handle 404 gracefully - data might not be available
+        if response.status_code == 404:
+            logger.warning(f"No {endpoint} data available for {symbol} (404)")
+            logger.debug(f"URL: {url}, Params: {params}")
+            return {endpoint: []}
+
+        response.raise_for_status()
+        return response.json()
+
+    def get_multi_stock_data(
+        self,
+        symbols: list[str],
+        endpoint: str,
+        params: dict,
+        feed: Optional[str] = None,
+    ) -> dict:
+        """
+        GET /v2/stocks/{endpoint}?symbols=... (multi-symbol historical endpoint).
+
+        The response maps each symbol to its records, ordered by symbol; one
+        ``next_page_token`` pages through the whole batch. Feed fallback is
+        cached batch-wide under the pseudo-symbol ``"*"``.
+
+        Args:
+            symbols: Symbols to request together
+            endpoint: "trades" or "quotes"
+            params: Query parameters (start, end, limit, page_token)
+            feed: Data feed ("sip", "iex") or None for the account default
+
+        Returns:
+            API response dictionary ({endpoint: {}} if no data is available)
+
+        Raises:
+            requests.exceptions.HTTPError: If API request fails (except 404)
+        """
+        url = f"{self.base_url}/v2/stocks/{endpoint}"
+        params = dict(params, symbols=",".join(symbols))
+        cache_key = ("*", endpoint, feed or "")
+
+        use_feed = bool(feed) and self._feed_available.get(cache_key, True)
+        if use_feed:
+            params["feed"] = feed
+
+        response = self.session.get(url, params=params)
+
+        if use_feed:
+            if response.status_code == 404 and feed != "iex":
+                logger.warning(f"{feed.upper()} feed not available for multi-symbol {endpoint}, using default feed")
+                self._feed_available[cache_key] = False
+                params.pop("feed", None)
+                response = self.session.get(url, params=params)
+            elif response.ok:
+                self._feed_available[cache_key] = True
+
+        if response.status_code == 404:
+            logger.warning(f"No {endpoint} data available for batch of {len(symbols)} symbols (404)")
+            return {endpoint: {}}
+
+        response.raise_for_status()
+        return response.json()
@@ -1,18 +1,32 @@
-"""Alpaca API client for extracting historical SIP data."""
+"""Alpaca API client for extracting historical SIP and IEX data."""
 
 from __future__ import annotations
 
 import logging
+import time
 from datetime import date, datetime
 from typing import Iterator, Optional
-from zoneinfo import ZoneInfo
 
 import polars as pl
 import requests
-from dateutil import parser
+
+from ..stage_a.date_utils import session_bounds_utc
+from ..stage_a.schemas import RAW_NBBO_SCHEMA, RAW_TRADE_SCHEMA, cast_to_schema
+from .alpaca_client import DEFAULT_POOL_SIZE, AlpacaClient
 
 logger = logging.getLogger(__name__)
 
+# Alpaca output is cast to the TAQ schemas minus provenance columns, which the
+# stage adds per run (extract_run_id, ingest_ts). NBBO files also carry the
+# quote source and the *sizeshares aliases of the size columns.
+ALPACA_TRADE_SCHEMA = {k: v for k, v in RAW_TRADE_SCHEMA.items() if k not in ("extract_run_id", "ingest_ts")}
+ALPACA_NBBO_SCHEMA = {
+    **{k: v for k, v in RAW_NBBO_SCHEMA.items() if k not in ("extract_run_id", "ingest_ts")},
+    "qu_source": pl.Categorical,
+    "best_bidsizeshares": pl.Int32,
+    "best_asksizeshares": pl.Int32,
+}
+
 
 class AlpacaExtractor:
     """Extract historical trades and quotes from Alpaca API."""
@@ -23,6 +37,8 @@ class AlpacaExtractor:
         secret_key: str,
         base_url: str = "https://paper-api.alpaca.markets",
         feed: str = "sip",
+        client: Optional[AlpacaClient] = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
     ):
         """
         Initialize Alpaca API client.
@@ -31,17 +47,17 @@ class AlpacaExtractor:
             api_key: Alpaca API key
             secret_key: Alpaca secret key
             base_url: Base URL for Alpaca API (default: paper trading)
-            feed: Data feed to use ("sip" for consolidated SIP data)
+            feed: Data feed to use ("sip" for consolidated SIP data, "iex" for IEX)
+            client: Shared AlpacaClient; pass the same client to SIP and IEX
+                extractors to reuse pooled connections (created if None)
+            pool_size: Connection pool size when creating a new client
         """
         self.api_key = api_key
         self.secret_key = secret_key
-        self.base_url = base_url.rstrip("/")
         self.feed = feed
-        self.session = requests.Session()
-        self.session.headers.update({
-            "APCA-API-KEY-ID": api_key,
-            "APCA-API-SECRET-KEY": secret_key,
-        })
+        self.client = client or AlpacaClient(api_key, secret_key, base_url, pool_size=pool_size)
+        self.base_url = self.client.base_url
+        self.session = self.client.session
     
     def _get_trades(
         self,
@@ -67,34 +83,15 @@ class AlpacaExtractor:
         Raises:
             requests.exceptions.HTTPError: If API request fails
         """
-        url = f"{self.base_url}/v2/stocks/{symbol}/trades"
         params = {
             "start": start.isoformat(),
             "end": end.isoformat(),
             "limit": limit,
         }
-        # Try with feed parameter first
-        if self.feed:
-            params["feed"] = self.feed
         if page_token:
             params["page_token"] = page_token
         
-        response = self.session.get(url, params=params)
-        
-        # Handle 404 gracefully - try without feed parameter if SIP feed fails
-        if response.status_code == 404 and self.feed and self.feed != "iex":
-            logger.warning(f"SIP feed not available, trying without feed parameter...")
-            params.pop("feed", None)
-            response = self.session.get(url, params=params)
-        
-        # Handle 404 gracefully - data might not be available
-        if response.status_code == 404:
-            logger.warning(f"No trades data available for {symbol} on {start.date()} (404)")
-            logger.debug(f"URL: {url}, Params: {params}")
-            return {"trades": []}
-        
-        response.raise_for_status()
-        return response.json()
+        return self.client.get_stock_data(symbol, "trades", params, feed=self.feed)
     
     def _get_quotes(
         self,
@@ -120,34 +117,15 @@ class AlpacaExtractor:
         Raises:
             requests.exceptions.HTTPError: If API request fails (except 404)
         """
-        url = f"{self.base_url}/v2/stocks/{symbol}/quotes"
         params = {
             "start": start.isoformat(),
             "end": end.isoformat(),
             "limit": limit,
         }
-        # Try with feed parameter first
-        if self.feed:
-            params["feed"] = self.feed
         if page_token:
             params["page_token"] = page_token
         
-        response = self.session.get(url, params=params)
-        
-        # Handle 404 gracefully - try without feed parameter if SIP feed fails
-        if response.status_code == 404 and self.feed and self.feed != "iex":
-            logger.warning(f"SIP feed not available, trying without feed parameter...")
-            params.pop("feed", None)
-            response = self.session.get(url, params=params)
-        
-        # Handle 404 gracefully - data might not be available
-        if response.status_code == 404:
-            logger.warning(f"No quotes data available for {symbol} on {start.date()} (404)")
-            logger.debug(f"URL: {url}, Params: {params}")
-            return {"quotes": []}
-        
-        response.raise_for_status()
-        return response.json()
+        return self.client.get_stock_data(symbol, "quotes", params, feed=self.feed)
     
     def extract_trades(
         self,
@@ -166,19 +144,58 @@ class AlpacaExtractor:
         Yields:
             DataFrames with trade data
         """
-        tz = ZoneInfo(timezone)
+        for df, _ in self.iter_trades_pages(symbol, trade_date, timezone):
+            yield df
+    
+    def extract_quotes(
+        self,
+        symbol: str,
+        trade_date: date,
+        timezone: str = "America/New_York",
+    ) -> Iterator[pl.DataFrame]:
+        """
+        Extract all quotes (NBBO) for a symbol on a given date.
         
-        # Market hours: 9:30 AM - 4:00 PM ET
-        start_dt = datetime.combine(trade_date, datetime.min.time().replace(hour=9, minute=30), tzinfo=tz)
-        end_dt = datetime.combine(trade_date, datetime.min.time().replace(hour=16, minute=0), tzinfo=tz)
+        Args:
+            symbol: Stock symbol
+            trade_date: Trade date
+            timezone: Timezone for market hours
+            
+        Yields:
+            DataFrames with quote/NBBO data
+        """
+        for df, _ in self.iter_quotes_pages(symbol, trade_date, timezone):
+            yield df
+    
+    def iter_trades_pages(
+        self,
+        symbol: str,
+        trade_date: date,
+        timezone: str = "America/New_York",
+        page_token: Optional[str] = None,
+    ) -> Iterator[tuple[pl.DataFrame, Optional[str]]]:
+        """
+        Page through trades for a symbol on a given date.
         
-        # Convert to UTC for API
-        start_utc = start_dt.astimezone(ZoneInfo("UTC"))
-        end_utc = end_dt.astimezone(ZoneInfo("UTC"))
+        Each yielded page carries the ``next_page_token`` needed to continue
+        after it, so callers can checkpoint progress and resume mid-symbol.
         
-        logger.info(f"Fetching trades for {symbol} on {trade_date} ({start_dt} to {end_dt} ET)")
+        Args:
+            symbol: Stock symbol
+            trade_date: Trade date
+            timezone: Timezone for market hours
+            page_token: Token to resume from (None starts at market open)
+            
+        Yields:
+            (DataFrame, next_page_token) tuples; next_page_token is None on the last page
+        """
+        start_utc, end_utc = self._session_bounds_utc(trade_date, timezone)
+        
+        if page_token:
+            logger.info(f"Resuming trades for {symbol} on {trade_date} from saved page token")
+        else:
+            logger.info(f"Fetching trades for {symbol} on {trade_date} ({start_utc} to {end_utc} UTC)")
         
-        page_token = None
         total_records = 0
         
         while True:
@@ -193,18 +210,18 @@ class AlpacaExtractor:
                 df = self._trades_to_dataframe(trades, symbol, trade_date, timezone)
                 total_records += len(df)
                 
-                logger.debug(f"  Fetched {len(df):,} trades (total: {total_records:,})")
-                yield df
-                
                 # Check for next page
                 page_token = response.get("next_page_token")
+                
+                logger.debug(f"  Fetched {len(df):,} trades (total: {total_records:,})")
+                yield df, page_token
+                
                 if not page_token:
                     break
                     
             except requests.exceptions.HTTPError as e:
                 if e.response.status_code == 429:
                     logger.warning("Rate limit hit, waiting...")
-                    import time
                     time.sleep(1)
                     continue
                 elif e.response.status_code == 404:
@@ -216,36 +233,32 @@ class AlpacaExtractor:
         
         logger.info(f"Total trades extracted for {symbol}: {total_records:,}")
     
-    def extract_quotes(
+    def iter_quotes_pages(
         self,
         symbol: str,
         trade_date: date,
         timezone: str = "America/New_York",
-    ) -> Iterator[pl.DataFrame]:
+        page_token: Optional[str] = None,
+    ) -> Iterator[tuple[pl.DataFrame, Optional[str]]]:
         """
-        Extract all quotes (NBBO) for a symbol on a given date.
+        Page through quotes (NBBO) for a symbol on a given date.
         
         Args:
             symbol: Stock symbol
             trade_date: Trade date
             timezone: Timezone for market hours
+            page_token: Token to resume from (None starts at market open)
             
         Yields:
-            DataFrames with quote/NBBO data
+            (DataFrame, next_page_token) tuples; next_page_token is None on the last page
         """
-        tz = ZoneInfo(timezone)
-        
-        # Market hours: 9:30 AM - 4:00 PM ET
-        start_dt = datetime.combine(trade_date, datetime.min.time().replace(hour=9, minute=30), tzinfo=tz)
-        end_dt = datetime.combine(trade_date, datetime.min.time().replace(hour=16, minute=0), tzinfo=tz)
-        
-        # Convert to UTC for API
-        start_utc = start_dt.astimezone(ZoneInfo("UTC"))
-        end_utc = end_dt.astimezone(ZoneInfo("UTC"))
+        start_utc, end_utc = self._session_bounds_utc(trade_date, timezone)
         
-        logger.info(f"Fetching quotes for {symbol} on {trade_date} ({start_dt} to {end_dt} ET)")
+        if page_token:
+            logger.info(f"Resuming quotes for {symbol} on {trade_date} from saved page token")
+        else:
+            logger.info(f"Fetching quotes for {symbol} on {trade_date} ({start_utc} to {end_utc} UTC)")
         
-        page_token = None
         total_records = 0
         
         while True:
@@ -260,22 +273,22 @@ class AlpacaExtractor:
                 df = self._quotes_to_dataframe(quotes, symbol, trade_date, timezone)
                 total_records += len(df)
                 
-                logger.debug(f"  Fetched {len(df):,} quotes (total: {total_records:,})")
-                yield df
-                
                 # Check for next page
                 page_token = response.get("next_page_token")
+                
+                logger.debug(f"  Fetched {len(df):,} quotes (total: {total_records:,})")
+                yield df, page_token
+                
                 if not page_token:
                     break
                     
             except requests.exceptions.HTTPError as e:
                 if e.response.status_code == 429:
                     logger.warning("Rate limit hit, waiting...")
-                    import time
                     time.sleep(1)
                     continue
                 elif e.response.status_code == 404:
-                    logger.warning(f"No trades data available for {symbol} on {trade_date}")
+                    logger.warning(f"No quotes data available for {symbol} on {trade_date}")
                     break
                 else:
                     logger.error(f"HTTP error {e.response.status_code}: {e.response.text[:200]}")
@@ -283,6 +296,108 @@ class AlpacaExtractor:
         
         logger.info(f"Total quotes extracted for {symbol}: {total_records:,}")
     
+    def iter_trades_batch_pages(
+        self,
+        symbols: list[str],
+        trade_date: date,
+        timezone: str = "America/New_York",
+        limit: int = 10000,
+    ) -> Iterator[tuple[dict[str, pl.DataFrame], Optional[str]]]:
+        """
+        Page through trades for several symbols with the multi-symbol endpoint.
+        
+        Args:
+            symbols: Symbols to request together (best for thin names)
+            trade_date: Trade date
+            timezone: Timezone for market hours
+            limit: Maximum records per page across all symbols
+            
+        Yields:
+            ({symbol: DataFrame}, next_page_token) tuples; symbols arrive in sorted
+            order, so every symbol before the last one in a page is complete
+        """
+        yield from self._iter_batch_pages("trades", symbols, trade_date, timezone, limit)
+    
+    def iter_quotes_batch_pages(
+        self,
+        symbols: list[str],
+        trade_date: date,
+        timezone: str = "America/New_York",
+        limit: int = 10000,
+    ) -> Iterator[tuple[dict[str, pl.DataFrame], Optional[str]]]:
+        """
+        Page through quotes (NBBO) for several symbols with the multi-symbol endpoint.
+        
+        Args:
+            symbols: Symbols to request together (best for thin names)
+            trade_date: Trade date
+            timezone: Timezone for market hours
+            limit: Maximum records per page across all symbols
+            
+        Yields:
+            ({symbol: DataFrame}, next_page_token) tuples
+        """
+        yield from self._iter_batch_pages("quotes", symbols, trade_date, timezone, limit)
+    
+    def _iter_batch_pages(
+        self,
+        endpoint: str,
+        symbols: list[str],
+        trade_date: date,
+        timezone: str,
+        limit: int,
+    ) -> Iterator[tuple[dict[str, pl.DataFrame], Optional[str]]]:
+        """Shared pagination loop for the multi-symbol trades/quotes endpoints."""
+        start_utc, end_utc = self._session_bounds_utc(trade_date, timezone)
+        to_dataframe = self._trades_to_dataframe if endpoint == "trades" else self._quotes_to_dataframe
+        
+        logger.info(f"Fetching {endpoint} for batch of {len(symbols)} symbols on {trade_date}")
+        
+        page_token = None
+        total_records = 0
+        
+        while True:
+            params = {
+                "start": start_utc.isoformat(),
+                "end": end_utc.isoformat(),
+                "limit": limit,
+            }
+            if page_token:
+                params["page_token"] = page_token
+            
+            try:
+                response = self.client.get_multi_stock_data(symbols, endpoint, params, feed=self.feed)
+            except requests.exceptions.HTTPError as e:
+                if e.response.status_code == 429:
+                    logger.warning("Rate limit hit, waiting...")
+                    time.sleep(1)
+                    continue
+                logger.error(f"HTTP error {e.response.status_code}: {e.response.text[:200]}")
+                raise
+            
+            records_by_symbol = response.get(endpoint) or {}
+            page = {
+                symbol: to_dataframe(records, symbol, trade_date, timezone)
+                for symbol, records in sorted(records_by_symbol.items())
+                if records
+            }
+            page_rows = sum(len(df) for df in page.values())
+            total_records += page_rows
+            page_token = response.get("next_page_token")
+            
+            logger.debug(f"  Fetched {page_rows:,} {endpoint} across {len(page)} symbols (total: {total_records:,})")
+            yield page, page_token
+            
+            if not page_token:
+                break
+        
+        logger.info(f"Total {endpoint} extracted for batch: {total_records:,}")
+    
+    @staticmethod
+    def _session_bounds_utc(trade_date: date, timezone: str) -> tuple[datetime, datetime]:
+        """Return the regular session for trade_date in UTC (13:00 close on early-close days)."""
+        return session_bounds_utc(trade_date, timezone)
+    
     def _trades_to_dataframe(
         self,
         trades: list[dict],
@@ -293,6 +408,9 @@ class AlpacaExtractor:
         """
         Convert Alpaca trades API response to DataFrame matching TAQ schema.
         
+        Fields are mapped with vectorized expressions and the result is cast
+        once to RAW_TRADE_SCHEMA, so Alpaca files have exactly the TAQ dtypes.
+        
         Args:
             trades: List of trade records from API
             symbol: Stock symbol
@@ -305,50 +423,29 @@ class AlpacaExtractor:
         if not trades:
             return pl.DataFrame()
         
-        tz = ZoneInfo(timezone)
-        utc_tz = ZoneInfo("UTC")
-        
-        records = []
-        for trade in trades:
-            # Parse timestamp (Alpaca returns ISO format in UTC)
-            ts_utc = parser.parse(trade["t"]).replace(tzinfo=utc_tz)
-            ts_local = ts_utc.astimezone(tz)
-            
-            # Extract date and time components
-            date_val = ts_local.date()
-            time_m = ts_local.time().replace(microsecond=0)
-            time_m_nano = ts_local.microsecond * 1000  # Convert microseconds to nanoseconds
-            
-            records.append({
-                # Original fields (mapped from Alpaca)
-                "date": date_val,
-                "time_m": time_m,
-                "time_m_nano": time_m_nano,
-                "part_time": None,  # Not available from Alpaca
-                "part_time_nano": None,
-                "trf_time": None,
-                "trf_time_nano": None,
-                "sym_root": symbol,
-                "sym_suffix": None,
-                "ex": trade.get("x", ""),  # Exchange code
-                "price": float(trade.get("p", 0.0)),  # Price
-                "size": int(trade.get("s", 0)),  # Size
-                "tr_corr": None,  # Not available
-                "tr_id": None,
-                "tr_rf": None,
-                "tr_scond": None,
-                "tr_seqnum": None,
-                "tr_source": "ALPACA",  # Mark as from Alpaca
-                "tr_stop_ind": None,
-                "tte_ind": None,
-                # Derived fields
-                "trade_date": date_val,
-                "symbol": symbol,
-                "ts_event": ts_utc,  # UTC timestamp
-            })
-        
-        df = pl.DataFrame(records)
-        return df
+        raw = pl.DataFrame(trades, infer_schema_length=None)
+        ts_utc = _parse_alpaca_timestamp(pl.col("t"))
+        ts_local = ts_utc.dt.convert_time_zone(timezone)
+        
+        df = raw.select([
+            # Original fields (mapped from Alpaca)
+            ts_local.dt.date().alias("date"),
+            ts_local.dt.truncate("1us").dt.time().alias("time_m"),  # TAQ time_m is microsecond precision
+            (ts_utc.dt.nanosecond() % 1000).alias("time_m_nano"),  # Sub-microsecond remainder
+            pl.lit(symbol).alias("sym_root"),
+            _optional_col(raw, "x").alias("ex"),  # Exchange code
+            _optional_col(raw, "p").alias("price"),  # Price
+            _optional_col(raw, "s").alias("size"),  # Size
+            _optional_col(raw, "i").alias("tr_id"),  # Alpaca trade ID
+            _join_conditions(raw, "c").alias("tr_scond"),  # Sale conditions
+            pl.lit("ALPACA").alias("tr_source"),  # Mark as from Alpaca
+            # Derived fields
+            ts_local.dt.date().alias("trade_date"),
+            pl.lit(symbol).alias("symbol"),
+            ts_utc.alias("ts_event"),  # UTC timestamp
+        ])
+        
+        return cast_to_schema(df, ALPACA_TRADE_SCHEMA, keep_extra=False)
     
     def _quotes_to_dataframe(
         self,
@@ -372,45 +469,47 @@ class AlpacaExtractor:
         if not quotes:
             return pl.DataFrame()
         
-        tz = ZoneInfo(timezone)
-        utc_tz = ZoneInfo("UTC")
-        
-        records = []
-        for quote in quotes:
-            # Parse timestamp (Alpaca returns ISO format in UTC)
-            ts_utc = parser.parse(quote["t"]).replace(tzinfo=utc_tz)
-            ts_local = ts_utc.astimezone(tz)
-            
-            # Extract date and time components
-            date_val = ts_local.date()
-            time_m = ts_local.time().replace(microsecond=0)
-            time_m_nano = ts_local.microsecond * 1000
-            
-            records.append({
-                # Original fields (mapped from Alpaca)
-                "date": date_val,
-                "time_m": time_m,
-                "time_m_nano": time_m_nano,
-                "sym_root": symbol,
-                "sym_suffix": None,
-                "best_bid": float(quote.get("bp", 0.0)),  # Best bid price
-                "best_bidsiz": int(quote.get("bs", 0)),  # Best bid size
-                "best_ask": float(quote.get("ap", 0.0)),  # Best ask price
-                "best_asksiz": int(quote.get("as", 0)),  # Best ask size
-                "best_bidex": quote.get("bx", ""),  # Bid exchange
-                "best_askex": quote.get("ax", ""),  # Ask exchange
-                "nbbo_qu_cond": None,  # Not available from Alpaca
-                "qu_cond": None,
-                "natbbo_ind": None,
-                "qu_source": "ALPACA",
-                "best_bidsizeshares": int(quote.get("bs", 0)),  # Alias for compatibility
-                "best_asksizeshares": int(quote.get("as", 0)),
-                # Derived fields
-                "trade_date": date_val,
-                "symbol": symbol,
-                "ts_event": ts_utc,  # UTC timestamp
-            })
-        
-        df = pl.DataFrame(records)
-        return df
+        raw = pl.DataFrame(quotes, infer_schema_length=None)
+        ts_utc = _parse_alpaca_timestamp(pl.col("t"))
+        ts_local = ts_utc.dt.convert_time_zone(timezone)
+        
+        df = raw.select([
+            # Original fields (mapped from Alpaca)
+            ts_local.dt.date().alias("date"),
+            ts_local.dt.truncate("1us").dt.time().alias("time_m"),
+            (ts_utc.dt.nanosecond() % 1000).alias("time_m_nano"),
+            pl.lit(symbol).alias("sym_root"),
+            _optional_col(raw, "bp").alias("best_bid"),  # Best bid price
+            _optional_col(raw, "bs").alias("best_bidsiz"),  # Best bid size
+            _optional_col(raw, "ap").alias("best_ask"),  # Best ask price
+            _optional_col(raw, "as").alias("best_asksiz"),  # Best ask size
+            _optional_col(raw, "bx").alias("best_bidex"),  # Bid exchange
+            _optional_col(raw, "ax").alias("best_askex"),  # Ask exchange
+            _join_conditions(raw, "c").alias("nbbo_qu_cond"),  # Quote conditions
+            pl.lit("ALPACA").alias("qu_source"),  # Mark as from Alpaca
+            _optional_col(raw, "bs").alias("best_bidsizeshares"),  # Alias for compatibility
+            _optional_col(raw, "as").alias("best_asksizeshares"),
+            # Derived fields
+            ts_local.dt.date().alias("trade_date"),
+            pl.lit(symbol).alias("symbol"),
+            ts_utc.alias("ts_event"),  # UTC timestamp
+        ])
+        
+        return cast_to_schema(df, ALPACA_NBBO_SCHEMA, keep_extra=False)
+
+
+def _parse_alpaca_timestamp(col: pl.Expr) -> pl.Expr:
+    """Parse Alpaca RFC 3339 timestamps (UTC, up to nanosecond precision)."""
+    return col.str.to_datetime(time_unit="ns", time_zone="UTC")
+
+
+def _optional_col(raw: pl.DataFrame, name: str) -> pl.Expr:
+    """Column from the API payload, or null if no record in the page carried it."""
+    return pl.col(name) if name in raw.columns else pl.lit(None)
+
 
+def _join_conditions(raw: pl.DataFrame, name: str) -> pl.Expr:
+    """Concatenate an Alpaca condition list (e.g. ["@", "I"]) into a TAQ-style code string."""
+    if name not in raw.columns or raw.schema[name] == pl.Null:
+        return pl.lit(None, dtype=pl.Utf8)
+    return pl.col(name).cast(pl.List(pl.Utf8)).list.join("")
@@ -0,0 +1,196 @@
+"""Page-level checkpointing for resumable Alpaca extraction."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import os
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+import polars as pl
+
+from ..stage_a.compression import ProfileSpec
+from ..stage_a.parquet_writer import DEFAULT_ROW_GROUP_SIZE, write_partition_file
+from ..stage_a.partition_stats import stats_from_files, write_partition_stats
+from ..stage_a.partitions import symbol_partition_dir
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILE = "_CHECKPOINT.json"
+SUCCESS_FILE = "_SUCCESS"
+
+
+@dataclasses.dataclass
+class PageCheckpoint:
+    """Last durably committed position for one (date, symbol, data_type) partition."""
+
+    trade_date: str
+    symbol: str
+    data_type: str
+    next_page_token: Optional[str] = None  # Token to request the next uncommitted page
+    rows: int = 0  # Rows committed so far
+    parts: int = 0  # Number of part files committed so far
+    updated_at: Optional[str] = None
+
+
+def partition_dir_for(parquet_root: Path, data_type: str, trade_date: date, symbol: str) -> Path:
+    """Return the symbol partition directory for (data_type, trade_date, symbol)."""
+    return symbol_partition_dir(parquet_root, data_type, trade_date, symbol)
+
+
+def _fsync_dir(path: Path) -> None:
+    """Flush directory entries (renames) to disk; best-effort on platforms without O_DIRECTORY."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def load_checkpoint(partition_dir: Path) -> Optional[PageCheckpoint]:
+    """Load the checkpoint for a partition, or None if there is none (or it is unreadable)."""
+    checkpoint_path = partition_dir / CHECKPOINT_FILE
+    if not checkpoint_path.exists():
+        return None
+    try:
+        with open(checkpoint_path, "r", encoding="utf-8") as f:
+            return PageCheckpoint(**json.load(f))
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable checkpoint {checkpoint_path}: {e}")
+        return None
+
+
+def save_checkpoint(partition_dir: Path, checkpoint: PageCheckpoint) -> None:
+    """Atomically replace the checkpoint file (write temp, fsync, rename)."""
+    checkpoint.updated_at = datetime.now(tz=timezone.utc).isoformat()
+    checkpoint_path = partition_dir / CHECKPOINT_FILE
+    tmp_path = partition_dir / f"{CHECKPOINT_FILE}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(dataclasses.asdict(checkpoint), f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, checkpoint_path)
+    _fsync_dir(partition_dir)
+
+
+def clear_checkpoint(partition_dir: Path) -> None:
+    """Remove the checkpoint file once the partition is complete."""
+    checkpoint_path = partition_dir / CHECKPOINT_FILE
+    if checkpoint_path.exists():
+        checkpoint_path.unlink()
+
+
+def discard_uncommitted_parts(partition_dir: Path, committed_parts: int) -> None:
+    """
+    Delete part files that were written after the last checkpoint.
+
+    A crash between renaming a part file into place and saving the checkpoint
+    leaves a part the checkpoint does not account for; its pages will be
+    re-fetched, so the file must go to avoid duplicate rows.
+    """
+    for path in partition_dir.iterdir():
+        name = path.name
+        if name.endswith(".tmp"):
+            path.unlink()
+            continue
+        if name.startswith("part_") and name.endswith(".parquet"):
+            try:
+                part_num = int(name[len("part_"):-len(".parquet")])
+            except ValueError:
+                continue
+            if part_num >= committed_parts:
+                logger.debug(f"  Removing uncommitted part {path}")
+                path.unlink()
+
+
+class ResumablePartitionWriter:
+    """
+    Write API pages for one (date, symbol, data_type) partition in durable parts.
+
+    Pages are buffered until ``commit_rows`` rows accumulate, then written as
+    ``part_NNNN.parquet`` (temp file + fsync + rename) and the checkpoint is
+    advanced to the page token that follows the committed data. A crash loses
+    at most the buffered pages; resuming restarts from the checkpoint token.
+    """
+
+    def __init__(
+        self,
+        partition_dir: Path,
+        trade_date: date,
+        symbol: str,
+        data_type: str,
+        compression: ProfileSpec = "snappy",
+        row_group_size: Optional[int] = DEFAULT_ROW_GROUP_SIZE,
+        commit_rows: int = 1_000_000,
+        checkpoint: Optional[PageCheckpoint] = None,
+    ):
+        self.partition_dir = partition_dir
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.commit_rows = commit_rows
+        self.checkpoint = checkpoint or PageCheckpoint(
+            trade_date=trade_date.isoformat(),
+            symbol=symbol,
+            data_type=data_type,
+        )
+        self._buffer: list[pl.DataFrame] = []
+        self._buffered_rows = 0
+        self._buffered_token: Optional[str] = self.checkpoint.next_page_token
+
+        self.partition_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def resume_token(self) -> Optional[str]:
+        """Page token to resume fetching from (None means start of session)."""
+        return self.checkpoint.next_page_token
+
+    @property
+    def rows_written(self) -> int:
+        """Rows committed to disk so far (including previous runs)."""
+        return self.checkpoint.rows
+
+    def add_page(self, df: pl.DataFrame, next_page_token: Optional[str]) -> None:
+        """Buffer a page; commit when the buffer reaches ``commit_rows``."""
+        if not df.is_empty():
+            self._buffer.append(df)
+            self._buffered_rows += len(df)
+        self._buffered_token = next_page_token
+        if self._buffered_rows >= self.commit_rows:
+            self.commit()
+
+    def commit(self) -> None:
+        """Durably write buffered pages as one part file and advance the checkpoint."""
+        if self._buffer:
+            df = pl.concat(self._buffer, how="diagonal_relaxed")
+            part_path = self.partition_dir / f"part_{self.checkpoint.parts:04d}.parquet"
+            tmp_path = part_path.with_name(part_path.name + ".tmp")
+            write_partition_file(df, tmp_path, self.compression, self.row_group_size)
+            with open(tmp_path, "rb+") as f:
+                os.fsync(f.fileno())
+            os.replace(tmp_path, part_path)
+            self.checkpoint.parts += 1
+            self.checkpoint.rows += len(df)
+            logger.debug(f"    Committed {len(df):,} rows to {part_path.name}")
+
+        self.checkpoint.next_page_token = self._buffered_token
+        save_checkpoint(self.partition_dir, self.checkpoint)
+        self._buffer = []
+        self._buffered_rows = 0
+
+    def finish(self) -> int:
+        """Commit remaining pages, mark the partition complete, and drop the checkpoint."""
+        self.commit()
+        # Parts may span several runs, so the statistics are computed from the files
+        write_partition_stats(self.partition_dir, stats_from_files(self.partition_dir, self.checkpoint.data_type))
+        (self.partition_dir / SUCCESS_FILE).touch()
+        clear_checkpoint(self.partition_dir)
+        _fsync_dir(self.partition_dir)
+        return self.checkpoint.rows
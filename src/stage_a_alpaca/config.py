@@ -8,6 +8,8 @@ from typing import Optional
 
 import yaml
 
+from ..stage_a.compression import CompressionProfile, load_profiles
+
 
 @dataclasses.dataclass
 class StageAAlpacaConfig:
@@ -16,6 +18,7 @@ class StageAAlpacaConfig:
     # Paths
     parquet_raw_root: Path
     taq_parquet_root: Optional[Path] = None  # TAQ data root for symbol discovery
+    taq_manifest_writes: bool = False  # Let discovery rebuild missing/stale manifests in the TAQ tree
     
     # Alpaca API credentials
     alpaca_api_key: Optional[str] = None
@@ -27,8 +30,10 @@ class StageAAlpacaConfig:
     streaming_chunk_rows: int = 1_000_000  # Rows per streaming chunk
     
     # Parquet settings
-    compression: str = "snappy"
+    compression: str = "snappy"  # Codec ("zstd:9") or preset ("fast", "balanced", "archive")
+    compression_profiles: dict[str, CompressionProfile] = dataclasses.field(default_factory=dict)  # Per-dataset override
     partition_by_symbol: bool = True
+    row_group_size: Optional[int] = 100_000  # Rows per row group; files are sorted by ts_event (None = Polars default)
     
     # Timezone
     timezone: str = "America/New_York"
@@ -36,6 +41,9 @@ class StageAAlpacaConfig:
     # Alpaca API settings
     feed: str = "sip"  # Use SIP feed for consolidated data
     page_limit: int = 10000  # Max records per API call
+    http_pool_size: int = 16  # Pooled keep-alive connections to the data API
+    batch_size: int = 0  # Symbols per multi-symbol request (0 or 1 = one symbol per request)
+    batch_heavy_rows: int = 10000  # Rows after which a symbol leaves the batch for per-symbol paging
 
 
 def load_config(config_path: str) -> StageAAlpacaConfig:
@@ -81,15 +89,21 @@ def load_config(config_path: str) -> StageAAlpacaConfig:
     return StageAAlpacaConfig(
         parquet_raw_root=Path(stage_a_alpaca.get("parquet_raw_root", "/home/mingyuan/data/alpaca/parquet_raw")),
         taq_parquet_root=taq_parquet_root,
+        taq_manifest_writes=stage_a_alpaca.get("taq_manifest_writes", False),
         alpaca_api_key=api_key,
         alpaca_secret_key=secret_key,
         alpaca_base_url=stage_a_alpaca.get("alpaca_base_url", "https://data.alpaca.markets"),
         chunk_size=stage_a_alpaca.get("chunk_size", 50),
         streaming_chunk_rows=stage_a_alpaca.get("streaming_chunk_rows", 1_000_000),
         compression=stage_a_alpaca.get("compression", "snappy"),
+        compression_profiles=load_profiles(stage_a_alpaca.get("compression_profiles")),
         partition_by_symbol=stage_a_alpaca.get("partition_by_symbol", True),
+        row_group_size=stage_a_alpaca.get("row_group_size", 100_000),
         timezone=stage_a_alpaca.get("timezone", "America/New_York"),
         feed=stage_a_alpaca.get("feed", "sip"),
         page_limit=stage_a_alpaca.get("page_limit", 10000),
+        http_pool_size=stage_a_alpaca.get("http_pool_size", 16),
+        batch_size=stage_a_alpaca.get("batch_size", 0),
+        batch_heavy_rows=stage_a_alpaca.get("batch_heavy_rows", 10000),
     )
 
@@ -6,6 +6,8 @@ import sys
 from datetime import date
 from pathlib import Path
 
+from ..stage_a_alpaca_iex.stage_a_alpaca_iex import extract_stage_a_alpaca_iex
+from .alpaca_client import AlpacaClient
 from .config import load_config
 from .stage_a_alpaca import extract_stage_a_alpaca
 
@@ -99,6 +101,13 @@ def main():
         help="Resume extraction (skip already ingested symbols)",
     )
     
+    parser.add_argument(
+        "--with-iex",
+        action="store_true",
+        help="Also extract the IEX feed (stage_a_alpaca_iex config) for the same symbols and dates, "
+             "sharing one HTTP connection pool with the SIP run",
+    )
+    
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -123,6 +132,46 @@ def main():
     # Load config
     config = load_config(args.config)
     
+    iex_config = None
+    if args.with_iex:
+        from ..stage_a_alpaca_iex.config import load_config as load_iex_config
+        iex_config = load_iex_config(args.config)
+    
+    # One pooled client for every feed and date in this run
+    client = None
+    if config.alpaca_api_key and config.alpaca_secret_key:
+        client = AlpacaClient(
+            config.alpaca_api_key,
+            config.alpaca_secret_key,
+            config.alpaca_base_url,
+            pool_size=config.http_pool_size,
+        )
+    
+    def run_feeds(trade_date: date, run_symbols: list[str]) -> dict[str, int]:
+        """Extract SIP (and IEX if requested) for one date; IEX counts are keyed "<type> (iex)"."""
+        results = extract_stage_a_alpaca(
+            config=config,
+            trade_date=trade_date,
+            symbols=run_symbols,
+            overwrite=args.overwrite,
+            data_types=args.type,
+            resume=args.resume,
+            client=client,
+        )
+        if iex_config is not None:
+            iex_results = extract_stage_a_alpaca_iex(
+                config=iex_config,
+                trade_date=trade_date,
+                symbols=run_symbols,
+                overwrite=args.overwrite,
+                data_types=args.type,
+                resume=args.resume,
+                client=client,
+            )
+            for data_type, count in iex_results.items():
+                results[f"{data_type} (iex)"] = count
+        return results
+    
     # Parse or discover symbols (needs date for discovery)
     # For date ranges, we'll discover symbols per date in the loop
     if args.symbols:
@@ -144,6 +193,7 @@ def main():
             config.taq_parquet_root,
             discovery_date,
             data_type="trades",
+            write_manifest_on_scan=config.taq_manifest_writes,
         )
         
         if not symbols:
@@ -170,14 +220,7 @@ def main():
             logger.warning(f"No symbols available for {trade_date}. Skipping extraction.")
             return
         
-        results = extract_stage_a_alpaca(
-            config=config,
-            trade_date=trade_date,
-            symbols=symbols,
-            overwrite=args.overwrite,
-            data_types=args.type,
-            resume=args.resume,
-        )
+        results = run_feeds(trade_date, symbols)
         logger.info("\nExtraction Results:")
         for data_type, count in results.items():
             logger.info(f"  {data_type}: {count:,} rows")
@@ -198,6 +241,18 @@ def main():
         dates = filter_trading_days(get_date_range(start_date, end_date))
         logger.info(f"Processing {len(dates)} trading days from {start_date} to {end_date}")
         
+        # Discover symbols for all dates up front (concurrent, manifest-backed)
+        symbols_by_date = {}
+        if not args.symbols:
+            from .symbol_discovery import discover_symbols_for_dates
+            logger.info(f"Discovering symbols from TAQ data for {len(dates)} dates...")
+            symbols_by_date = discover_symbols_for_dates(
+                config.taq_parquet_root,
+                dates,
+                data_type="trades",
+                write_manifest_on_scan=config.taq_manifest_writes,
+            )
+        
         all_results = {}
         skipped_dates = []
         for trade_date in dates:
@@ -205,16 +260,10 @@ def main():
             logger.info(f"Processing {trade_date}")
             logger.info(f"{'=' * 80}")
             
-            # For date ranges, discover symbols for each date if not provided
+            # For date ranges, use the symbols discovered for this date if not provided
             current_symbols = symbols
             if not args.symbols:
-                # Re-discover symbols for this date
-                from .symbol_discovery import discover_symbols_from_taq
-                current_symbols = discover_symbols_from_taq(
-                    config.taq_parquet_root,
-                    trade_date,
-                    data_type="trades",
-                )
+                current_symbols = symbols_by_date.get(trade_date, [])
                 
                 if not current_symbols:
                     logger.warning(f"No symbols found for {trade_date}. Skipping.")
@@ -222,14 +271,7 @@ def main():
                     continue
             
             try:
-                results = extract_stage_a_alpaca(
-                    config=config,
-                    trade_date=trade_date,
-                    symbols=current_symbols,
-                    overwrite=args.overwrite,
-                    data_types=args.type,
-                    resume=args.resume,
-                )
+                results = run_feeds(trade_date, current_symbols)
                 
                 # Accumulate results
                 for data_type, count in results.items():
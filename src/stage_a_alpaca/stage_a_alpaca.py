@@ -3,16 +3,29 @@
 from __future__ import annotations
 
 import logging
+import shutil
 import uuid
+from collections import deque
 from datetime import date, datetime
 from pathlib import Path
 from typing import Literal
 
 import polars as pl
 
+from ..stage_a.compression import profile_for
+from ..stage_a.date_utils import is_trading_day
+from ..stage_a.manifest import update_manifest
+from .alpaca_client import AlpacaClient
 from .alpaca_extractor import AlpacaExtractor
+from .checkpoint import (
+    SUCCESS_FILE,
+    PageCheckpoint,
+    ResumablePartitionWriter,
+    discard_uncommitted_parts,
+    load_checkpoint,
+    partition_dir_for,
+)
 from .config import StageAAlpacaConfig
-from ..stage_a.parquet_writer import write_partitioned_streaming
 
 logger = logging.getLogger(__name__)
 
@@ -26,20 +39,31 @@ def extract_stage_a_alpaca(
     overwrite: bool = False,
     data_types: list[str] | None = None,
     resume: bool = False,
+    client: AlpacaClient | None = None,
+    raise_on_error: bool = False,
 ) -> dict[str, int]:
     """
     Execute Stage A Alpaca extraction for the given date and symbols.
     
+    Works for any Alpaca feed: the IEX stage calls this with its own config.
+    
     Args:
         config: Stage A Alpaca configuration
         trade_date: Trade date
         symbols: List of symbols to extract
         overwrite: If True, overwrite existing data
         data_types: List of data types to extract (default: ["trades", "nbbo"])
-        resume: If True, skip symbols that are already ingested
+        resume: If True, skip symbols that are already ingested and continue
+            partially extracted symbols from their last page checkpoint
+        client: Shared AlpacaClient, so several feeds/dates reuse one connection pool
+        raise_on_error: If True, raise once every symbol has been tried if any
+            of them failed; by default failures are logged and skipped
         
     Returns:
         Dictionary with row counts: {"trades": 1000, "nbbo": 1500}
+    
+    Raises:
+        RuntimeError: If raise_on_error is set and a symbol failed
     """
     # Set default data types if not provided
     if data_types is None:
@@ -51,9 +75,14 @@ def extract_stage_a_alpaca(
     if invalid_types:
         raise ValueError(f"Invalid data types: {invalid_types}. Valid types: {valid_types}")
     
+    if not is_trading_day(trade_date):
+        logger.warning(f"{trade_date} is not a trading day (weekend or market holiday), skipping")
+        return {dt: 0 for dt in data_types}
+    
     logger.info("=" * 80)
     logger.info(f"Stage A Alpaca: Extract raw data for {trade_date} ({len(symbols)} symbols)")
     logger.info(f"Data types: {', '.join(data_types)}")
+    logger.info(f"Feed: {config.feed}")
     logger.info("=" * 80)
     
     extract_run_id = str(uuid.uuid4())
@@ -68,9 +97,12 @@ def extract_stage_a_alpaca(
         secret_key=config.alpaca_secret_key,
         base_url=config.alpaca_base_url,
         feed=config.feed,
+        client=client,
+        pool_size=config.http_pool_size,
     )
     
     results = {}
+    failed: dict[str, list[str]] = {}
     from zoneinfo import ZoneInfo
     ingest_ts = datetime.now(tz=ZoneInfo("UTC"))
     
@@ -80,66 +112,64 @@ def extract_stage_a_alpaca(
         logger.info(f"Processing {data_type.upper()}")
         logger.info(f"{'=' * 80}")
         
-        total_rows = 0
+        symbol_rows: dict[str, int] = {}
+        symbol_errors: list[str] = []
+        symbols_to_page = symbols
+        
+        # Thin symbols first, many per request; heavy or checkpointed ones are returned for paging
+        if config.batch_size > 1:
+            symbols_to_page, batch_rows, batch_errors = _extract_batched(
+                extractor,
+                config,
+                data_type,
+                trade_date,
+                symbols,
+                extract_run_id,
+                ingest_ts,
+                overwrite=overwrite,
+                resume=resume,
+            )
+            symbol_rows.update(batch_rows)
+            symbol_errors.extend(batch_errors)
         
         # Process symbols in chunks
-        for i in range(0, len(symbols), config.chunk_size):
-            chunk_symbols = symbols[i:i + config.chunk_size]
+        for i in range(0, len(symbols_to_page), config.chunk_size):
+            chunk_symbols = symbols_to_page[i:i + config.chunk_size]
             logger.info(f"\nProcessing chunk {i // config.chunk_size + 1} ({len(chunk_symbols)} symbols)")
             
             for symbol in chunk_symbols:
                 try:
-                    # Check if already ingested (if resume mode)
-                    if resume and not overwrite:
-                        partition_path = (
-                            config.parquet_raw_root / data_type / 
-                            f"trade_date={trade_date.isoformat()}" / 
-                            f"symbol={symbol}"
-                        )
-                        if partition_path.exists() and any(partition_path.glob("*.parquet")):
-                            logger.info(f"  {symbol}: Already ingested, skipping")
-                            continue
-                    
-                    logger.info(f"  Extracting {symbol}...")
-                    
-                    # Extract data
-                    chunks = []
-                    if data_type == "trades":
-                        for df_chunk in extractor.extract_trades(symbol, trade_date, config.timezone):
-                            # Add metadata columns
-                            df_chunk = df_chunk.with_columns([
-                                pl.lit(extract_run_id).alias("extract_run_id"),
-                                pl.lit(ingest_ts).alias("ingest_ts"),
-                            ])
-                            chunks.append(df_chunk)
-                    elif data_type == "nbbo":
-                        for df_chunk in extractor.extract_quotes(symbol, trade_date, config.timezone):
-                            # Add metadata columns
-                            df_chunk = df_chunk.with_columns([
-                                pl.lit(extract_run_id).alias("extract_run_id"),
-                                pl.lit(ingest_ts).alias("ingest_ts"),
-                            ])
-                            chunks.append(df_chunk)
-                    
-                    if chunks:
-                        # Write to Parquet
-                        rows_written = write_partitioned_streaming(
-                            data_chunks=chunks,
-                            parquet_root=config.parquet_raw_root,
-                            dataset=data_type,
-                            trade_date=trade_date,
-                            compression=config.compression,
-                            partition_by_symbol=config.partition_by_symbol,
-                        )
-                        total_rows += rows_written
+                    rows_written = _extract_symbol_resumable(
+                        extractor,
+                        config,
+                        data_type,
+                        trade_date,
+                        symbol,
+                        extract_run_id,
+                        ingest_ts,
+                        overwrite=overwrite,
+                        resume=resume,
+                    )
+                    if rows_written is None:
+                        continue
+                    if rows_written > 0:
+                        symbol_rows[symbol] = rows_written
                         logger.info(f"    ✓ Wrote {rows_written:,} rows")
                     else:
                         logger.warning(f"    ⚠ No data found for {symbol}")
                         
                 except Exception as e:
                     logger.error(f"    ✗ Error processing {symbol}: {e}", exc_info=True)
+                    symbol_errors.append(symbol)
                     continue
         
+        if symbol_rows:
+            update_manifest(config.parquet_raw_root, data_type, trade_date, symbol_rows)
+        
+        if symbol_errors:
+            failed[data_type] = sorted(symbol_errors)
+        
+        total_rows = sum(symbol_rows.values())
         results[data_type] = total_rows
         logger.info(f"\n{data_type.upper()} Summary: {total_rows:,} total rows")
     
@@ -148,6 +178,260 @@ def extract_stage_a_alpaca(
     logger.info("=" * 80)
     for data_type, count in results.items():
         logger.info(f"  {data_type}: {count:,} rows")
+    for data_type, failed_symbols in failed.items():
+        logger.warning(f"  ✗ {data_type}: {len(failed_symbols)} symbol(s) failed: {', '.join(failed_symbols)}")
+    
+    if failed and raise_on_error:
+        raise RuntimeError(
+            f"{sum(len(v) for v in failed.values())} symbol partition(s) failed for {trade_date}; "
+            "rerun with resume to retry them"
+        )
     
     return results
 
+
+
+def _resume_state(
+    partition_dir: Path,
+    overwrite: bool = False,
+    resume: bool = False,
+) -> tuple[bool, PageCheckpoint | None]:
+    """
+    Decide how to treat an existing partition.
+    
+    Returns:
+        (skip, checkpoint): skip is True if the partition is already complete;
+        checkpoint is set if a previous run stopped part way through it
+    """
+    if not resume or overwrite or not partition_dir.exists():
+        return False, None
+    if (partition_dir / SUCCESS_FILE).exists():
+        return True, None
+    checkpoint = load_checkpoint(partition_dir)
+    if checkpoint is None and any(partition_dir.glob("*.parquet")):
+        # Written before checkpointing existed: treat as complete
+        return True, None
+    return False, checkpoint
+
+
+def _extract_symbol_resumable(
+    extractor: AlpacaExtractor,
+    config: StageAAlpacaConfig,
+    data_type: str,
+    trade_date: date,
+    symbol: str,
+    extract_run_id: str,
+    ingest_ts: datetime,
+    overwrite: bool = False,
+    resume: bool = False,
+) -> int | None:
+    """
+    Extract one (date, symbol, data_type) partition, resuming from its checkpoint.
+    
+    In resume mode a partition with ``_SUCCESS`` (or legacy parquet files and no
+    checkpoint) is skipped, and a partition with a checkpoint continues from the
+    last committed ``next_page_token``. Otherwise the partition is rebuilt.
+    
+    Returns:
+        Rows in the partition after this call, or None if it was skipped
+    """
+    partition_dir = partition_dir_for(config.parquet_raw_root, data_type, trade_date, symbol)
+    skip, checkpoint = _resume_state(partition_dir, overwrite=overwrite, resume=resume)
+    if skip:
+        logger.info(f"  {symbol}: Already ingested, skipping")
+        return None
+    
+    if checkpoint is not None:
+        discard_uncommitted_parts(partition_dir, checkpoint.parts)
+        logger.info(
+            f"  Resuming {symbol} from checkpoint "
+            f"({checkpoint.rows:,} rows in {checkpoint.parts} part(s) already committed)..."
+        )
+    else:
+        if partition_dir.exists():
+            shutil.rmtree(partition_dir)
+        logger.info(f"  Extracting {symbol}...")
+    
+    writer = ResumablePartitionWriter(
+        partition_dir,
+        trade_date,
+        symbol,
+        data_type,
+        compression=profile_for(config.compression, config.compression_profiles, data_type),
+        row_group_size=config.row_group_size,
+        commit_rows=config.streaming_chunk_rows,
+        checkpoint=checkpoint,
+    )
+    
+    if checkpoint is not None and checkpoint.next_page_token is None:
+        # All pages were committed before the crash; only the marker is missing
+        pages = iter(())
+    elif data_type == "trades":
+        pages = extractor.iter_trades_pages(
+            symbol, trade_date, config.timezone, page_token=writer.resume_token
+        )
+    else:  # nbbo
+        pages = extractor.iter_quotes_pages(
+            symbol, trade_date, config.timezone, page_token=writer.resume_token
+        )
+    
+    for df_page, next_page_token in pages:
+        # Add metadata columns
+        df_page = df_page.with_columns([
+            pl.lit(extract_run_id, dtype=pl.Categorical).alias("extract_run_id"),
+            pl.lit(ingest_ts).alias("ingest_ts"),
+        ])
+        writer.add_page(df_page, next_page_token)
+    
+    rows_written = writer.finish()
+    if rows_written == 0:
+        # Leave nothing behind so a later run retries the symbol
+        shutil.rmtree(partition_dir)
+    return rows_written
+
+
+# Symbols found too heavy for batching, per (feed, data_type), remembered across dates in a run
+_HEAVY_SYMBOLS: dict[tuple[str, str], set[str]] = {}
+
+
+def _extract_batched(
+    extractor: AlpacaExtractor,
+    config: StageAAlpacaConfig,
+    data_type: str,
+    trade_date: date,
+    symbols: list[str],
+    extract_run_id: str,
+    ingest_ts: datetime,
+    overwrite: bool = False,
+    resume: bool = False,
+) -> tuple[list[str], dict[str, int], list[str]]:
+    """
+    Extract thin symbols through the multi-symbol endpoint, ``batch_size`` per request.
+    
+    The response is ordered by symbol, so a symbol is complete once a later one
+    appears (or paging ends) and is then written to its own partition. A symbol
+    that accumulates more than ``batch_heavy_rows`` rows while still incomplete
+    is demoted to per-symbol (checkpointed) paging, and symbols after it in the
+    batch go back into the queue.
+    
+    Returns:
+        (symbols still needing per-symbol paging, rows written per symbol,
+        symbols whose write failed)
+    """
+    heavy = _HEAVY_SYMBOLS.setdefault((config.feed, data_type), set())
+    to_page: list[str] = []
+    candidates: list[str] = []
+    
+    for symbol in symbols:
+        partition_dir = partition_dir_for(config.parquet_raw_root, data_type, trade_date, symbol)
+        skip, checkpoint = _resume_state(partition_dir, overwrite=overwrite, resume=resume)
+        if skip:
+            logger.info(f"  {symbol}: Already ingested, skipping")
+        elif checkpoint is not None or symbol in heavy:
+            to_page.append(symbol)
+        else:
+            candidates.append(symbol)
+    
+    if data_type == "trades":
+        iter_batch_pages = extractor.iter_trades_batch_pages
+    else:  # nbbo
+        iter_batch_pages = extractor.iter_quotes_batch_pages
+    
+    logger.info(f"Batched mode: {len(candidates)} symbols in batches of {config.batch_size}, "
+                f"{len(to_page)} paged individually")
+    
+    symbol_rows: dict[str, int] = {}
+    errors: list[str] = []
+    pending = deque(sorted(candidates))
+    
+    while pending:
+        batch = [pending.popleft() for _ in range(min(config.batch_size, len(pending)))]
+        frames: dict[str, list[pl.DataFrame]] = {}
+        row_counts: dict[str, int] = {}
+        demoted = None
+        
+        pages = iter_batch_pages(batch, trade_date, config.timezone, limit=config.page_limit)
+        try:
+            for page, next_page_token in pages:
+                for symbol, df in page.items():
+                    frames.setdefault(symbol, []).append(df)
+                    row_counts[symbol] = row_counts.get(symbol, 0) + len(df)
+                
+                # Only the last symbol of a page can still be incomplete
+                if page and next_page_token:
+                    last_symbol = max(page)
+                    if row_counts[last_symbol] > config.batch_heavy_rows:
+                        demoted = last_symbol
+                        break
+        except Exception as e:
+            logger.error(f"    ✗ Batch request failed ({e}); paging {len(batch)} symbols individually")
+            to_page.extend(batch)
+            continue
+        finally:
+            pages.close()
+        
+        if demoted is not None:
+            logger.info(f"  {demoted}: too heavy for batching, paging individually")
+            heavy.add(demoted)
+            to_page.append(demoted)
+            # Symbols after the demoted one were not fetched yet
+            pending.extendleft(reversed([s for s in batch if s > demoted]))
+            completed = [s for s in batch if s < demoted]
+        else:
+            completed = batch
+        
+        for symbol in completed:
+            if symbol not in frames:
+                logger.warning(f"    ⚠ No data found for {symbol}")
+                continue
+            try:
+                rows_written = _write_batched_symbol(
+                    config,
+                    data_type,
+                    trade_date,
+                    symbol,
+                    frames[symbol],
+                    extract_run_id,
+                    ingest_ts,
+                )
+                symbol_rows[symbol] = rows_written
+                logger.info(f"  {symbol}: ✓ Wrote {rows_written:,} rows (batched)")
+            except Exception as e:
+                logger.error(f"    ✗ Error writing {symbol}: {e}", exc_info=True)
+                errors.append(symbol)
+    
+    return to_page, symbol_rows, errors
+
+
+def _write_batched_symbol(
+    config: StageAAlpacaConfig,
+    data_type: str,
+    trade_date: date,
+    symbol: str,
+    frames: list[pl.DataFrame],
+    extract_run_id: str,
+    ingest_ts: datetime,
+) -> int:
+    """Write a symbol fully fetched in a batch as a single committed part."""
+    partition_dir = partition_dir_for(config.parquet_raw_root, data_type, trade_date, symbol)
+    if partition_dir.exists():
+        shutil.rmtree(partition_dir)
+    
+    df = pl.concat(frames, how="diagonal_relaxed").with_columns([
+        pl.lit(extract_run_id, dtype=pl.Categorical).alias("extract_run_id"),
+        pl.lit(ingest_ts).alias("ingest_ts"),
+    ])
+    
+    # One add_page with no token: the commit covers the whole symbol, so a
+    # checkpoint left by a crash before _SUCCESS correctly means "complete"
+    writer = ResumablePartitionWriter(
+        partition_dir,
+        trade_date,
+        symbol,
+        data_type,
+        compression=profile_for(config.compression, config.compression_profiles, data_type),
+        row_group_size=config.row_group_size,
+        commit_rows=len(df) + 1,
+    )
+    writer.add_page(df, None)
+    return writer.finish()
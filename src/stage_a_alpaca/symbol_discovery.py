@@ -3,60 +3,116 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
 
+from ..stage_a.manifest import read_manifest, scan_date_partition, write_manifest
+from ..stage_a.partitions import date_partition_dir
+
 logger = logging.getLogger(__name__)
 
+# Concurrent date lookups; discovery is metadata I/O bound (NAS round trips)
+DEFAULT_DISCOVERY_WORKERS = 8
+
+# (root, data_type, date) -> (date dir mtime_ns, symbols), valid while the mtime is unchanged
+_DISCOVERY_CACHE: dict[tuple[str, str, date], tuple[int, list[str]]] = {}
+_DISCOVERY_CACHE_LOCK = threading.Lock()
+
 
 def discover_symbols_from_taq(
     taq_parquet_root: Path,
     trade_date: date,
     data_type: str = "trades",
+    write_manifest_on_scan: bool = False,
 ) -> list[str]:
     """
     Discover symbols from TAQ parquet directory structure.
-    
+
     Looks for symbol subdirectories under:
     {taq_parquet_root}/{data_type}/trade_date={date}/symbol=XXX/
-    
+
+    The partition manifest is used when it is current (read_manifest rejects
+    one whose recorded date directory mtime no longer matches); otherwise the
+    date directory is scanned once. Results are cached in-process and
+    revalidated with one stat of the date directory.
+
     Args:
         taq_parquet_root: Root directory for TAQ parquet files
         trade_date: Trade date to look for
         data_type: Data type to check (default: "trades")
-        
+        write_manifest_on_scan: Rebuild the manifest in the TAQ tree after a
+            scan, so the next lookup is a single file read. Off by default as
+            it writes into another source's tree
+
     Returns:
         List of discovered symbols
     """
-    date_str = trade_date.isoformat()
-    date_dir = taq_parquet_root / data_type / f"trade_date={date_str}"
-    
-    if not date_dir.exists():
+    date_dir = date_partition_dir(taq_parquet_root, data_type, trade_date)
+
+    try:
+        dir_mtime_ns = os.stat(date_dir).st_mtime_ns
+    except FileNotFoundError:
         logger.warning(f"TAQ directory does not exist: {date_dir}")
         return []
-    
-    symbols = []
-    symbol_dirs = [d for d in date_dir.iterdir() if d.is_dir() and d.name.startswith("symbol=")]
-    
-    for sym_dir in symbol_dirs:
-        # Extract symbol from directory name
-        sym_name = sym_dir.name.replace("symbol=", "")
-        
-        # Handle tuple notation: ('AAPL',) or ("AAPL",)
-        if sym_name.startswith("('") and sym_name.endswith("',)"):
-            symbol = sym_name[2:-3]
-        elif sym_name.startswith('("') and sym_name.endswith('",)'):
-            symbol = sym_name[2:-3]
-        else:
-            symbol = sym_name
-        
-        # Check if directory has parquet files
-        parquet_files = list(sym_dir.glob("*.parquet"))
-        if parquet_files:
-            symbols.append(symbol)
-    
-    symbols.sort()  # Return sorted list
-    logger.info(f"Discovered {len(symbols)} symbols from {date_dir}")
-    
-    return symbols
 
+    cache_key = (str(taq_parquet_root), data_type, trade_date)
+    with _DISCOVERY_CACHE_LOCK:
+        cached = _DISCOVERY_CACHE.get(cache_key)
+    if cached is not None and cached[0] == dir_mtime_ns:
+        return list(cached[1])
+
+    manifest = read_manifest(taq_parquet_root, data_type, trade_date)
+    if manifest is not None:
+        symbols = sorted(manifest)
+        source = "manifest"
+    else:
+        scanned = scan_date_partition(date_dir)
+        symbols = sorted(scanned)
+        source = "directory scan"
+        if write_manifest_on_scan:
+            try:
+                write_manifest(taq_parquet_root, data_type, trade_date, scanned)
+            except OSError as e:
+                logger.warning(f"⚠ Could not write manifest for {date_dir}: {e}")
+
+    with _DISCOVERY_CACHE_LOCK:
+        _DISCOVERY_CACHE[cache_key] = (dir_mtime_ns, symbols)
+
+    logger.info(f"Discovered {len(symbols)} symbols from {date_dir} ({source})")
+
+    return list(symbols)
+
+
+def discover_symbols_for_dates(
+    taq_parquet_root: Path,
+    trade_dates: list[date],
+    data_type: str = "trades",
+    max_workers: int = DEFAULT_DISCOVERY_WORKERS,
+    write_manifest_on_scan: bool = False,
+) -> dict[date, list[str]]:
+    """
+    Discover symbols for many dates concurrently.
+
+    Args:
+        taq_parquet_root: Root directory for TAQ parquet files
+        trade_dates: Trade dates to look up
+        data_type: Data type to check (default: "trades")
+        max_workers: Maximum concurrent date lookups
+        write_manifest_on_scan: Rebuild missing or stale TAQ manifests
+
+    Returns:
+        Dictionary mapping each trade date to its sorted symbol list
+        (empty if the date has no TAQ data)
+    """
+    if not trade_dates:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(trade_dates))) as pool:
+        symbol_lists = pool.map(
+            lambda d: discover_symbols_from_taq(taq_parquet_root, d, data_type, write_manifest_on_scan),
+            trade_dates,
+        )
+        return dict(zip(trade_dates, symbol_lists))
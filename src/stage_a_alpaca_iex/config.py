@@ -8,6 +8,8 @@ from typing import Optional
 
 import yaml
 
+from ..stage_a.compression import CompressionProfile, load_profiles
+
 
 @dataclasses.dataclass
 class StageAAlpacaIexConfig:
@@ -26,8 +28,10 @@ class StageAAlpacaIexConfig:
     streaming_chunk_rows: int = 1_000_000  # Rows per streaming chunk
     
     # Parquet settings
-    compression: str = "snappy"
+    compression: str = "snappy"  # Codec ("zstd:9") or preset ("fast", "balanced", "archive")
+    compression_profiles: dict[str, CompressionProfile] = dataclasses.field(default_factory=dict)  # Per-dataset override
     partition_by_symbol: bool = True
+    row_group_size: Optional[int] = 100_000  # Rows per row group; files are sorted by ts_event (None = Polars default)
     
     # Timezone
     timezone: str = "America/New_York"
@@ -35,6 +39,9 @@ class StageAAlpacaIexConfig:
     # Alpaca API settings
     feed: str = "iex"  # Use IEX feed (available on free tier)
     page_limit: int = 10000  # Max records per API call
+    http_pool_size: int = 16  # Pooled keep-alive connections to the data API
+    batch_size: int = 0  # Symbols per multi-symbol request (0 or 1 = one symbol per request)
+    batch_heavy_rows: int = 10000  # Rows after which a symbol leaves the batch for per-symbol paging
 
 
 def load_config(config_path: str) -> StageAAlpacaIexConfig:
@@ -88,9 +95,14 @@ def load_config(config_path: str) -> StageAAlpacaIexConfig:
         chunk_size=stage_a_alpaca_iex.get("chunk_size", 50),
         streaming_chunk_rows=stage_a_alpaca_iex.get("streaming_chunk_rows", 1_000_000),
         compression=stage_a_alpaca_iex.get("compression", "snappy"),
+        compression_profiles=load_profiles(stage_a_alpaca_iex.get("compression_profiles")),
         partition_by_symbol=stage_a_alpaca_iex.get("partition_by_symbol", True),
+        row_group_size=stage_a_alpaca_iex.get("row_group_size", 100_000),
         timezone=stage_a_alpaca_iex.get("timezone", "America/New_York"),
         feed=stage_a_alpaca_iex.get("feed", "iex"),
         page_limit=stage_a_alpaca_iex.get("page_limit", 10000),
+        http_pool_size=stage_a_alpaca_iex.get("http_pool_size", 16),
+        batch_size=stage_a_alpaca_iex.get("batch_size", 0),
+        batch_heavy_rows=stage_a_alpaca_iex.get("batch_heavy_rows", 10000),
     )
 
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import dataclasses
 from pathlib import Path
+from typing import Optional
 
 import yaml
 
+from ..stage_a.compression import CompressionProfile, load_profiles
+
 
 @dataclasses.dataclass
 class StageACsvConfig:
@@ -20,8 +23,11 @@ class StageACsvConfig:
     chunk_size: int = 1_000_000  # Rows per chunk when reading CSV files
     
     # Parquet settings
-    compression: str = "snappy"
+    compression: str = "snappy"  # Codec ("zstd:9") or preset ("fast", "balanced", "archive")
+    compression_profiles: dict[str, CompressionProfile] = dataclasses.field(default_factory=dict)  # Per-dataset override
     partition_by_symbol: bool = True
+    row_group_size: Optional[int] = 100_000  # Rows per row group; files are sorted by ts_event (None = Polars default)
+    staged_writes: bool = False  # Stage each date partition beside its final dir and publish it with renames
     
     # Timezone
     timezone: str = "America/New_York"
@@ -45,7 +51,10 @@ def load_config(config_path: str) -> StageACsvConfig:
         csv_root=Path(stage_a_csv.get("csv_root", "/home/mingyuan/data/csv")),
         chunk_size=stage_a_csv.get("chunk_size", 1_000_000),
         compression=stage_a_csv.get("compression", "snappy"),
+        compression_profiles=load_profiles(stage_a_csv.get("compression_profiles")),
         partition_by_symbol=stage_a_csv.get("partition_by_symbol", True),
+        row_group_size=stage_a_csv.get("row_group_size", 100_000),
+        staged_writes=stage_a_csv.get("staged_writes", False),
         timezone=stage_a_csv.get("timezone", "America/New_York"),
         csv_prefix_trades=stage_a_csv.get("csv_prefix_trades", "taq_trade"),
         csv_prefix_quotes=stage_a_csv.get("csv_prefix_quotes", "taq_quote"),
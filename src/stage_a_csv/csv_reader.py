@@ -5,10 +5,18 @@ from __future__ import annotations
 import logging
 from datetime import date, datetime
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
 import polars as pl
 
-from ..stage_a.schemas import build_canonical_symbol, build_ts_event
+from ..stage_a.schemas import (
+    RAW_NBBO_SCHEMA,
+    RAW_QUOTE_SCHEMA,
+    RAW_TRADE_SCHEMA,
+    build_canonical_symbol,
+    build_ts_event,
+    cast_to_schema,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -28,9 +36,9 @@ def read_trades_csv(
         ignore_errors=True,
     )
     
-    ingest_ts = datetime.now()
+    ingest_ts = datetime.now(tz=ZoneInfo("UTC"))
     
-    return df.with_columns([
+    return cast_to_schema(df.with_columns([
         pl.lit(trade_date).alias("trade_date"),
         build_canonical_symbol(pl.col("sym_root"), pl.col("sym_suffix")).alias("symbol"),
         build_ts_event(
@@ -41,7 +49,7 @@ def read_trades_csv(
         ).alias("ts_event"),
         pl.lit(extract_run_id).alias("extract_run_id"),
         pl.lit(ingest_ts).alias("ingest_ts"),
-    ])
+    ]), RAW_TRADE_SCHEMA)
 
 
 def read_quotes_csv(
@@ -59,9 +67,9 @@ def read_quotes_csv(
         ignore_errors=True,
     )
     
-    ingest_ts = datetime.now()
+    ingest_ts = datetime.now(tz=ZoneInfo("UTC"))
     
-    return df.with_columns([
+    return cast_to_schema(df.with_columns([
         pl.lit(trade_date).alias("trade_date"),
         build_canonical_symbol(pl.col("sym_root"), pl.col("sym_suffix")).alias("symbol"),
         build_ts_event(
@@ -72,7 +80,7 @@ def read_quotes_csv(
         ).alias("ts_event"),
         pl.lit(extract_run_id).alias("extract_run_id"),
         pl.lit(ingest_ts).alias("ingest_ts"),
-    ])
+    ]), RAW_QUOTE_SCHEMA)
 
 
 def read_nbbo_csv(
@@ -90,9 +98,9 @@ def read_nbbo_csv(
         ignore_errors=True,
     )
     
-    ingest_ts = datetime.now()
+    ingest_ts = datetime.now(tz=ZoneInfo("UTC"))
     
-    return df.with_columns([
+    return cast_to_schema(df.with_columns([
         pl.lit(trade_date).alias("trade_date"),
         build_canonical_symbol(pl.col("sym_root"), pl.col("sym_suffix")).alias("symbol"),
         build_ts_event(
@@ -103,7 +111,7 @@ def read_nbbo_csv(
         ).alias("ts_event"),
         pl.lit(extract_run_id).alias("extract_run_id"),
         pl.lit(ingest_ts).alias("ingest_ts"),
-    ])
+    ]), RAW_NBBO_SCHEMA)
 
 
 def check_csv_exists(csv_root: Path, trade_date: date, data_type: str, prefix: str) -> Path | None:
@@ -5,9 +5,21 @@ from __future__ import annotations
 import logging
 from datetime import date
 from pathlib import Path
+from typing import Optional
 
 import polars as pl
 
+from ..stage_a.compression import ProfileSpec
+from ..stage_a.manifest import update_manifest
+from ..stage_a.parquet_writer import (
+    DEFAULT_ROW_GROUP_SIZE,
+    FsOpCounter,
+    publish_staged,
+    staging_dir_for,
+)
+from ..stage_a.partition_stats import PartitionStats
+from ..stage_a.partitions import date_partition_dir, partition_key_symbol, symbol_dir_name
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,26 +28,34 @@ def write_chunked_from_csv(
     parquet_root: Path,
     dataset: str,
     trade_date: date,
-    compression: str = "snappy",
+    compression: ProfileSpec = "snappy",
     partition_by_symbol: bool = True,
     chunk_size: int = 1_000_000,
     enrich_fn=None,
     symbols_to_extract: list[str] | None = None,
+    row_group_size: Optional[int] = DEFAULT_ROW_GROUP_SIZE,
+    staged: bool = False,
 ) -> int:
     """
     Read CSV in chunks and write to Parquet incrementally.
     
+    With staged=True the files go to a staging directory beside the date
+    directory and are published when complete, as in
+    stage_a.parquet_writer.write_chunks_incrementally.
+    
     Args:
         csv_path: Path to CSV file
         parquet_root: Root directory for Parquet files
         dataset: Dataset name
         trade_date: Trade date
-        compression: Compression algorithm
+        compression: Compression profile, preset name or codec
         partition_by_symbol: Whether to partition by symbol
         chunk_size: Rows per chunk
         enrich_fn: Optional function to enrich each chunk (takes DataFrame, returns DataFrame)
         symbols_to_extract: Optional list of symbols to extract. If provided, only these symbols will be written.
                            If None, all symbols will be written.
+        row_group_size: Target rows per row group (None = Polars default)
+        staged: Stage the date partition and publish it when complete
         
     Returns:
         Total number of rows written
@@ -53,75 +73,83 @@ def write_chunked_from_csv(
     total_count = lf.select(pl.len()).collect().item()
     logger.info(f"Total rows in CSV: {total_count:,}")
     
-    date_str = trade_date.isoformat()
-    final_dir = parquet_root / dataset / f"trade_date={date_str}"
-    final_dir.mkdir(parents=True, exist_ok=True)
+    final_dir = date_partition_dir(parquet_root, dataset, trade_date)
+    fs = FsOpCounter()
+    write_dir = staging_dir_for(final_dir) if staged else final_dir
+    fs.mkdir(write_dir)
     
     # Process in chunks
     offset = 0
     chunk_num = 0
     total_written = 0
+    symbol_rows: dict[str, int] = {}
+    symbol_stats: dict[str, PartitionStats] = {}
     
-    while offset < total_count:
-        logger.info(f"Processing chunk {chunk_num + 1}: rows {offset:,} to {min(offset + chunk_size, total_count):,}")
-        
-        chunk = lf.slice(offset, chunk_size).collect()
-        
-        if chunk.is_empty():
-            break
-        
-        # Apply enrichment if provided (this adds the 'symbol' column)
-        if enrich_fn:
-            chunk = enrich_fn(chunk)
-        
-        # Filter to only missing symbols if specified (after enrichment so we have 'symbol' column)
-        if symbols_to_extract is not None and len(symbols_to_extract) > 0 and "symbol" in chunk.columns:
-            chunk = chunk.filter(pl.col("symbol").is_in(symbols_to_extract))
+    try:
+        while offset < total_count:
+            logger.info(f"Processing chunk {chunk_num + 1}: rows {offset:,} to {min(offset + chunk_size, total_count):,}")
+            
+            chunk = lf.slice(offset, chunk_size).collect()
+            
             if chunk.is_empty():
-                logger.debug(f"  Chunk {chunk_num + 1}: No rows for missing symbols, skipping")
-                offset += chunk_size
-                chunk_num += 1
-                continue
-        
-        if partition_by_symbol and "symbol" in chunk.columns:
-            # Write per symbol
-            for symbol_key, symbol_df in chunk.partition_by("symbol", as_dict=True).items():
-                # Clean symbol key - remove tuple notation if present
-                if isinstance(symbol_key, tuple):
-                    symbol = symbol_key[0] if len(symbol_key) > 0 else str(symbol_key)
-                elif isinstance(symbol_key, str):
-                    if symbol_key.startswith("('") and symbol_key.endswith("',)"):
-                        # Handle string representation of tuple: "('AAPL',)"
-                        symbol = symbol_key[2:-3]
-                    elif symbol_key.startswith('("') and symbol_key.endswith('",)'):
-                        # Handle string representation with double quotes: '("AAPL",)'
-                        symbol = symbol_key[2:-3]
-                    else:
-                        symbol = symbol_key
-                else:
-                    symbol = str(symbol_key)
-                
-                symbol_dir = final_dir / f"symbol={symbol}"
-                symbol_dir.mkdir(parents=True, exist_ok=True)
-                chunk_file = symbol_dir / f"part_{chunk_num:04d}.parquet"
-                symbol_df.write_parquet(chunk_file, compression=compression)
-                total_written += len(symbol_df)
-        else:
-            # Write single chunk
-            chunk_file = final_dir / f"part_{chunk_num:04d}.parquet"
-            chunk.write_parquet(chunk_file, compression=compression)
-            total_written += len(chunk)
+                break
+            
+            # Apply enrichment if provided (this adds the 'symbol' column)
+            if enrich_fn:
+                chunk = enrich_fn(chunk)
+            
+            # Filter to only missing symbols if specified (after enrichment so we have 'symbol' column)
+            if symbols_to_extract is not None and len(symbols_to_extract) > 0 and "symbol" in chunk.columns:
+                chunk = chunk.filter(pl.col("symbol").is_in(symbols_to_extract))
+                if chunk.is_empty():
+                    logger.debug(f"  Chunk {chunk_num + 1}: No rows for missing symbols, skipping")
+                    offset += chunk_size
+                    chunk_num += 1
+                    continue
+            
+            if partition_by_symbol and "symbol" in chunk.columns:
+                # Write per symbol
+                for symbol_key, symbol_df in chunk.partition_by("symbol", as_dict=True).items():
+                    symbol = partition_key_symbol(symbol_key)
+                    
+                    symbol_dir = write_dir / symbol_dir_name(symbol)
+                    if symbol not in symbol_rows:
+                        fs.mkdir(symbol_dir)
+                    chunk_file = symbol_dir / f"part_{chunk_num:04d}.parquet"
+                    fs.write(symbol_df, chunk_file, compression, row_group_size)
+                    symbol_rows[symbol] = symbol_rows.get(symbol, 0) + len(symbol_df)
+                    symbol_stats[symbol] = symbol_stats.get(symbol, PartitionStats()).merge(
+                        PartitionStats.from_frame(symbol_df, dataset)
+                    )
+                    total_written += len(symbol_df)
+            else:
+                # Write single chunk
+                chunk_file = write_dir / f"part_{chunk_num:04d}.parquet"
+                fs.write(chunk, chunk_file, compression, row_group_size)
+                total_written += len(chunk)
+            
+            chunk_num += 1
+            offset += chunk_size
+            
+            if offset % (chunk_size * 10) == 0:
+                logger.info(f"Progress: {offset:,} / {total_count:,} rows processed, {total_written:,} written")
         
-        chunk_num += 1
-        offset += chunk_size
+        for symbol, stats in symbol_stats.items():
+            fs.write_stats(write_dir / symbol_dir_name(symbol), stats)
         
-        if offset % (chunk_size * 10) == 0:
-            logger.info(f"Progress: {offset:,} / {total_count:,} rows processed, {total_written:,} written")
+        if staged:
+            publish_staged(write_dir, final_dir, fs)
+        else:
+            # Create _SUCCESS marker
+            fs.touch(final_dir / "_SUCCESS")
+    except BaseException:
+        if staged:
+            fs.rmtree(write_dir)
+        raise
     
-    # Create _SUCCESS marker
-    success_marker = final_dir / "_SUCCESS"
-    success_marker.touch()
+    if symbol_rows:
+        update_manifest(parquet_root, dataset, trade_date, symbol_rows)
     
     logger.info(f"✓ Wrote {total_written:,} rows from CSV to {final_dir}")
+    logger.debug(f"  Filesystem: {fs.summary()}")
     return total_written
-
@@ -4,17 +4,18 @@ from __future__ import annotations
 
 import logging
 import uuid
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from typing import Literal
 
 import polars as pl
 
+from ..stage_a.compression import profile_for
 from ..stage_a.ingestion_checker import (
     check_ingestion_status,
     delete_partitions_for_symbols,
     get_missing_data,
 )
-from ..stage_a.schemas import build_canonical_symbol, build_ts_event
+from ..stage_a.schemas import RAW_SCHEMAS, build_canonical_symbol, build_ts_event, cast_to_schema
 from .config import StageACsvConfig
 from .csv_reader import check_csv_exists
 from .csv_writer import write_chunked_from_csv
@@ -140,47 +141,23 @@ def extract_stage_a_csv(
         if missing_symbols:
             logger.info(f"Filtering CSV to only extract {len(missing_symbols)} symbols: {missing_symbols[:10]}{'...' if len(missing_symbols) > 10 else ''}")
         
-        # Define enrichment function
+        # Define enrichment function: derived fields, then the canonical dtypes
+        schema = RAW_SCHEMAS[data_type]
+        ingest_ts = datetime.now(tz=timezone.utc)
+        
         def enrich_chunk(chunk_df):
-            if data_type == "trades":
-                return chunk_df.with_columns([
-                    pl.lit(trade_date).alias("trade_date"),
-                    build_canonical_symbol(pl.col("sym_root"), pl.col("sym_suffix")).alias("symbol"),
-                    build_ts_event(
-                        pl.col("date"),
-                        pl.col("time_m"),
-                        pl.col("time_m_nano"),
-                        config.timezone,
-                    ).alias("ts_event"),
-                    pl.lit(extract_run_id).alias("extract_run_id"),
-                    pl.lit(datetime.now()).alias("ingest_ts"),
-                ])
-            elif data_type == "quotes":
-                return chunk_df.with_columns([
-                    pl.lit(trade_date).alias("trade_date"),
-                    build_canonical_symbol(pl.col("sym_root"), pl.col("sym_suffix")).alias("symbol"),
-                    build_ts_event(
-                        pl.col("date"),
-                        pl.col("time_m"),
-                        pl.col("time_m_nano"),
-                        config.timezone,
-                    ).alias("ts_event"),
-                    pl.lit(extract_run_id).alias("extract_run_id"),
-                    pl.lit(datetime.now()).alias("ingest_ts"),
-                ])
-            else:  # nbbo
-                return chunk_df.with_columns([
-                    pl.lit(trade_date).alias("trade_date"),
-                    build_canonical_symbol(pl.col("sym_root"), pl.col("sym_suffix")).alias("symbol"),
-                    build_ts_event(
-                        pl.col("date"),
-                        pl.col("time_m"),
-                        pl.col("time_m_nano"),
-                        config.timezone,
-                    ).alias("ts_event"),
-                    pl.lit(extract_run_id).alias("extract_run_id"),
-                    pl.lit(datetime.now()).alias("ingest_ts"),
-                ])
+            return cast_to_schema(chunk_df.with_columns([
+                pl.lit(trade_date).alias("trade_date"),
+                build_canonical_symbol(pl.col("sym_root"), pl.col("sym_suffix")).alias("symbol"),
+                build_ts_event(
+                    pl.col("date"),
+                    pl.col("time_m"),
+                    pl.col("time_m_nano"),
+                    config.timezone,
+                ).alias("ts_event"),
+                pl.lit(extract_run_id).alias("extract_run_id"),
+                pl.lit(ingest_ts).alias("ingest_ts"),
+            ]), schema)
         
         # Read from CSV and write to Parquet (streaming mode)
         rows_written = write_chunked_from_csv(
@@ -188,11 +165,13 @@ def extract_stage_a_csv(
             config.parquet_raw_root,
             data_type,
             trade_date,
-            compression=config.compression,
+            compression=profile_for(config.compression, config.compression_profiles, data_type),
             partition_by_symbol=config.partition_by_symbol,
+            row_group_size=config.row_group_size,
             chunk_size=config.chunk_size,
             enrich_fn=enrich_chunk,
             symbols_to_extract=missing_symbols,
+            staged=config.staged_writes,
         )
         
         results[data_type] = rows_written
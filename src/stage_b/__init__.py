@@ -0,0 +1 @@
+"""Stage B: Enrich trades with the prevailing NBBO (ASOF join)."""
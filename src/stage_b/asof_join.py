@@ -0,0 +1,122 @@
+"""ASOF join of trades onto the prevailing NBBO."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+# NBBO fields attached to each trade (whichever the source provides)
+NBBO_FIELDS = [
+    "best_bid",
+    "best_bidsiz",
+    "best_ask",
+    "best_asksiz",
+    "best_bidex",
+    "best_askex",
+    "nbbo_qu_cond",
+    "secstat_ind",
+    "luld_indicator",
+    "luld_bbo_cqs",
+    "luld_bbo_uts",
+]
+
+
+def _lazy_columns(lf: pl.LazyFrame) -> list[str]:
+    """Column names of a LazyFrame (collect_schema on newer Polars, .columns on older)."""
+    if hasattr(lf, "collect_schema"):
+        return lf.collect_schema().names()
+    return lf.columns
+
+
+def nbbo_valid_expr() -> pl.Expr:
+    """True where the NBBO is a usable market: positive prices and not crossed."""
+    bid = pl.col("best_bid").cast(pl.Float64)
+    ask = pl.col("best_ask").cast(pl.Float64)
+    return (bid > 0) & (ask > 0) & (ask >= bid)
+
+
+def scan_partition(partition_dir: Path, columns: list[str] | None = None) -> pl.LazyFrame:
+    """
+    Lazily scan the parquet files of one (date, symbol) partition.
+
+    Args:
+        partition_dir: Symbol partition directory
+        columns: Columns to read; names missing from the files are ignored
+
+    Returns:
+        LazyFrame over the partition (projection pushed down to the reader)
+    """
+    files = sorted(partition_dir.glob("*.parquet"))
+    if not files:
+        raise FileNotFoundError(f"No parquet files in {partition_dir}")
+    lf = pl.scan_parquet(files)
+    if columns is not None:
+        available = pl.read_parquet_schema(files[0])
+        lf = lf.select([c for c in columns if c in available])
+    return lf
+
+
+def prepare_nbbo(nbbo: pl.LazyFrame, drop_invalid: bool = False) -> pl.LazyFrame:
+    """
+    Sort NBBO states by event time and derive the fields attached to trades.
+
+    Args:
+        nbbo: NBBO rows for one symbol (must include ts_event, best_bid, best_ask)
+        drop_invalid: Drop crossed or non-positive states so trades match the
+            last valid NBBO instead
+
+    Returns:
+        LazyFrame with nbbo_ts_event, NBBO fields, mid, spread and nbbo_valid
+    """
+    nbbo = nbbo.with_columns(nbbo_valid_expr().alias("nbbo_valid"))
+    if drop_invalid:
+        nbbo = nbbo.filter(pl.col("nbbo_valid"))
+
+    bid = pl.col("best_bid").cast(pl.Float64)
+    ask = pl.col("best_ask").cast(pl.Float64)
+    return (
+        nbbo.with_columns([
+            ((bid + ask) / 2).alias("mid"),
+            (ask - bid).alias("spread"),
+        ])
+        .rename({"ts_event": "nbbo_ts_event"})
+        # Stable sort keeps the last state among equal timestamps last, which
+        # is the one a backward ASOF join picks
+        .sort("nbbo_ts_event", maintain_order=True)
+    )
+
+
+def enrich_trades(
+    trades: pl.LazyFrame,
+    nbbo: pl.LazyFrame,
+    drop_invalid_nbbo: bool = False,
+) -> pl.LazyFrame:
+    """
+    Attach the most recent NBBO at or before each trade (backward ASOF on ts_event).
+
+    Trades before the first NBBO of the day keep null NBBO fields.
+
+    Args:
+        trades: Trade rows for one symbol
+        nbbo: NBBO rows for the same symbol (NBBO_FIELDS plus ts_event)
+        drop_invalid_nbbo: Ignore crossed/non-positive NBBO states
+
+    Returns:
+        LazyFrame with all trade columns plus nbbo_ts_event, NBBO_FIELDS,
+        mid, spread and nbbo_valid, ordered by ts_event
+    """
+    sort_keys = ["ts_event"]
+    if "tr_seqnum" in _lazy_columns(trades):
+        sort_keys.append("tr_seqnum")
+    trades = trades.sort(sort_keys, maintain_order=True)
+
+    return trades.join_asof(
+        prepare_nbbo(nbbo, drop_invalid=drop_invalid_nbbo),
+        left_on="ts_event",
+        right_on="nbbo_ts_event",
+        strategy="backward",
+    )
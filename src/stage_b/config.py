@@ -0,0 +1,46 @@
+"""Configuration management for Stage B enrichment."""
+
+from __future__ import annotations
+
+import dataclasses
+from pathlib import Path
+from typing import Optional
+
+import yaml
+
+
+@dataclasses.dataclass
+class StageBConfig:
+    """Configuration for Stage B enrichment."""
+
+    # Paths
+    parquet_raw_root: Path  # Stage A output (trades + nbbo)
+    parquet_derived_root: Path  # Stage B output (enriched_trades)
+
+    # Processing settings
+    max_workers: Optional[int] = None  # Worker processes (None = CPU count)
+    drop_invalid_nbbo: bool = False  # Skip crossed/non-positive NBBO states before joining
+
+    # Parquet settings
+    compression: str = "snappy"
+
+    # Timezone
+    timezone: str = "America/New_York"
+
+
+def load_config(config_path: str) -> StageBConfig:
+    """Load configuration from YAML file."""
+    with open(config_path, "r", encoding="utf-8") as f:
+        raw = yaml.safe_load(f)
+
+    stage_b = raw.get("stage_b", {})
+    stage_a = raw.get("stage_a", {})
+
+    return StageBConfig(
+        parquet_raw_root=Path(stage_b.get("parquet_raw_root", stage_a.get("parquet_raw_root", "/Volumes/Data/parquet_raw"))),
+        parquet_derived_root=Path(stage_b.get("parquet_derived_root", "/Volumes/Data/parquet_derived")),
+        max_workers=stage_b.get("max_workers"),
+        drop_invalid_nbbo=stage_b.get("drop_invalid_nbbo", False),
+        compression=stage_b.get("compression", "snappy"),
+        timezone=stage_b.get("timezone", "America/New_York"),
+    )
@@ -0,0 +1,131 @@
+"""CLI entry point for Stage B enrichment."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from .config import load_config
+from .stage_b import enrich_stage_b, enrich_stage_b_range
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
+    handlers=[
+        logging.StreamHandler(),
+    ],
+)
+logger = logging.getLogger(__name__)
+
+
+def parse_symbols(symbols_str: str) -> list[str]:
+    """Parse comma-separated symbols or read from file."""
+    if Path(symbols_str).exists():
+        # Read from file (one symbol per line)
+        with open(symbols_str, "r") as f:
+            return [line.strip().upper() for line in f if line.strip()]
+    else:
+        # Comma-separated list
+        return [s.strip().upper() for s in symbols_str.split(",") if s.strip()]
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Stage B: Enrich trades with the prevailing NBBO (ASOF join)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Enrich all symbols for a single date
+  python -m src.stage_b.enrich --date 2024-06-10 --config config.yaml
+
+  # Enrich a date range with 8 worker processes
+  python -m src.stage_b.enrich --start-date 2024-06-10 --end-date 2024-06-14 --config config.yaml --workers 8
+
+  # Rebuild specific symbols even if their inputs are unchanged
+  python -m src.stage_b.enrich --date 2024-06-10 --symbols AAPL,MSFT --config config.yaml --overwrite
+        """,
+    )
+
+    parser.add_argument(
+        "--date",
+        help="Single trade date in YYYY-MM-DD format (mutually exclusive with --start-date/--end-date)",
+    )
+    parser.add_argument(
+        "--start-date",
+        help="Start date for date range (YYYY-MM-DD, inclusive). Requires --end-date",
+    )
+    parser.add_argument(
+        "--end-date",
+        help="End date for date range (YYYY-MM-DD, inclusive). Requires --start-date",
+    )
+    parser.add_argument(
+        "--symbols",
+        default=None,
+        help="Comma-separated symbols or path to file with one symbol per line. "
+             "If not provided, all symbols with raw trades are processed",
+    )
+    parser.add_argument(
+        "--config",
+        required=True,
+        help="Path to config YAML file",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (overrides stage_b.max_workers)",
+    )
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Rebuild partitions even if their inputs are unchanged",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable verbose logging",
+    )
+
+    args = parser.parse_args()
+
+    if args.date is None and not (args.start_date and args.end_date):
+        parser.error("Must provide either --date OR both --start-date and --end-date")
+    if args.date is not None and (args.start_date or args.end_date):
+        parser.error("--date cannot be used with --start-date or --end-date")
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    try:
+        config = load_config(args.config)
+        logger.info(f"Loaded config from {args.config}")
+        logger.info(f"  Raw root: {config.parquet_raw_root}")
+        logger.info(f"  Derived root: {config.parquet_derived_root}")
+    except Exception as e:
+        logger.error(f"Error loading config: {e}")
+        sys.exit(1)
+
+    if args.workers is not None:
+        config.max_workers = args.workers
+
+    symbols = parse_symbols(args.symbols) if args.symbols else None
+
+    try:
+        if args.date:
+            trade_date = datetime.fromisoformat(args.date).date()
+            enrich_stage_b(config, trade_date, symbols=symbols, overwrite=args.overwrite)
+        else:
+            start_date = datetime.fromisoformat(args.start_date).date()
+            end_date = datetime.fromisoformat(args.end_date).date()
+            enrich_stage_b_range(config, start_date, end_date, symbols=symbols, overwrite=args.overwrite)
+    except Exception as e:
+        logger.error(f"Stage B failed: {e}", exc_info=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
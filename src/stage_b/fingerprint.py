@@ -0,0 +1,49 @@
+"""Input fingerprints for skipping derived partitions whose inputs have not changed."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_FILE = "_FINGERPRINT"
+
+
+def compute_fingerprint(input_files: Iterable[Path], params: Optional[dict] = None) -> str:
+    """
+    Hash input file metadata (path, size, mtime) and processing parameters.
+
+    File contents are not read: raw partitions are only ever replaced by
+    rewriting files, which changes size or mtime.
+
+    Args:
+        input_files: Files the output is derived from
+        params: Parameters that change the output (e.g. code version, options)
+
+    Returns:
+        Hex digest
+    """
+    h = hashlib.sha256()
+    for path in sorted(str(p) for p in input_files):
+        st = os.stat(path)
+        h.update(f"{path}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    h.update(json.dumps(params or {}, sort_keys=True, default=str).encode())
+    return h.hexdigest()
+
+
+def read_fingerprint(partition_dir: Path) -> Optional[str]:
+    """Return the fingerprint stored with an output partition, if any."""
+    try:
+        return (partition_dir / FINGERPRINT_FILE).read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        return None
+
+
+def write_fingerprint(partition_dir: Path, fingerprint: str) -> None:
+    """Store the fingerprint with an output partition."""
+    (partition_dir / FINGERPRINT_FILE).write_text(fingerprint + "\n", encoding="utf-8")
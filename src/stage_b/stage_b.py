@@ -0,0 +1,210 @@
+"""Stage B: Build enriched_trades by ASOF-joining trades onto NBBO."""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import os
+import shutil
+import time
+import uuid
+from concurrent.futures import as_completed
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+from ..stage_a.compression import write_parquet_file
+from ..stage_a.date_utils import filter_trading_days, get_date_range
+from ..stage_a.manifest import update_manifest
+from ..stage_a.partitions import date_partition_dir, list_symbol_partitions, symbol_dir_name
+from ..stage_a.workers import spawn_pool
+from .asof_join import NBBO_FIELDS, enrich_trades, scan_partition
+from .config import StageBConfig
+from .fingerprint import compute_fingerprint, read_fingerprint, write_fingerprint
+
+logger = logging.getLogger(__name__)
+
+DATASET = "enriched_trades"
+
+# Bump when the enrichment logic changes so existing partitions are rebuilt
+STAGE_B_VERSION = 1
+
+
+@dataclasses.dataclass
+class EnrichTask:
+    """One (trade_date, symbol) partition to enrich; picklable for worker processes."""
+
+    trade_date: date
+    symbol: str
+    trades_dir: Path
+    nbbo_dir: Path
+    output_dir: Path
+    compression: str = "snappy"  # Codec or preset (see stage_a.compression.parse_profile)
+    drop_invalid_nbbo: bool = False
+    overwrite: bool = False
+
+
+def enrich_partition(task: EnrichTask) -> tuple[str, Optional[int]]:
+    """
+    Enrich one (date, symbol) partition.
+
+    The output is built in a sibling temp directory and swapped into place, so
+    readers never see a half-written partition. Skipped when the stored input
+    fingerprint matches (unless overwrite).
+
+    Args:
+        task: Partition to process
+
+    Returns:
+        (symbol, rows written), rows is None if the partition was up to date
+    """
+    input_files = sorted(task.trades_dir.glob("*.parquet")) + sorted(task.nbbo_dir.glob("*.parquet"))
+    fingerprint = compute_fingerprint(
+        input_files,
+        {"version": STAGE_B_VERSION, "drop_invalid_nbbo": task.drop_invalid_nbbo},
+    )
+    if not task.overwrite and read_fingerprint(task.output_dir) == fingerprint:
+        return task.symbol, None
+
+    trades = scan_partition(task.trades_dir)
+    nbbo = scan_partition(task.nbbo_dir, columns=["ts_event", *NBBO_FIELDS])
+    df = enrich_trades(trades, nbbo, drop_invalid_nbbo=task.drop_invalid_nbbo).collect()
+
+    tmp_dir = task.output_dir.with_name(f".{task.output_dir.name}.tmp-{uuid.uuid4().hex[:8]}")
+    tmp_dir.mkdir(parents=True)
+    try:
+        write_parquet_file(df, tmp_dir / "part_0000.parquet", task.compression)
+        write_fingerprint(tmp_dir, fingerprint)
+        (tmp_dir / "_SUCCESS").touch()
+        if task.output_dir.exists():
+            shutil.rmtree(task.output_dir)
+        os.replace(tmp_dir, task.output_dir)
+    finally:
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+
+    return task.symbol, len(df)
+
+
+def enrich_stage_b(
+    config: StageBConfig,
+    trade_date: date,
+    symbols: list[str] | None = None,
+    overwrite: bool = False,
+) -> dict[str, int]:
+    """
+    Run Stage B for one trade date.
+
+    Every symbol with both trades and NBBO partitions is enriched in a process
+    pool (one task per symbol, so memory is bounded by the largest symbol, not
+    the whole day). Partitions whose inputs are unchanged are skipped.
+
+    Args:
+        config: Stage B configuration
+        trade_date: Trade date to process
+        symbols: Symbols to process (None = all symbols with trades)
+        overwrite: Rebuild partitions even if their inputs are unchanged
+
+    Returns:
+        Dictionary with "rows", "written", "skipped" and "failed" counts
+    """
+    trades_parts = list_symbol_partitions(date_partition_dir(config.parquet_raw_root, "trades", trade_date))
+    nbbo_parts = list_symbol_partitions(date_partition_dir(config.parquet_raw_root, "nbbo", trade_date))
+    output_date_dir = date_partition_dir(config.parquet_derived_root, DATASET, trade_date)
+
+    wanted = sorted(trades_parts) if symbols is None else [s for s in symbols if s in trades_parts]
+    missing_nbbo = [s for s in wanted if s not in nbbo_parts]
+    if missing_nbbo:
+        logger.warning(f"  {len(missing_nbbo)} symbols have trades but no NBBO, skipping: "
+                       f"{missing_nbbo[:10]}{'...' if len(missing_nbbo) > 10 else ''}")
+
+    tasks = [
+        EnrichTask(
+            trade_date=trade_date,
+            symbol=symbol,
+            trades_dir=trades_parts[symbol],
+            nbbo_dir=nbbo_parts[symbol],
+            output_dir=output_date_dir / symbol_dir_name(symbol),
+            compression=config.compression,
+            drop_invalid_nbbo=config.drop_invalid_nbbo,
+            overwrite=overwrite,
+        )
+        for symbol in wanted
+        if symbol in nbbo_parts
+    ]
+
+    logger.info("=" * 80)
+    logger.info(f"Stage B: Enrich trades for {trade_date} ({len(tasks)} symbols)")
+    logger.info("=" * 80)
+
+    results = {"rows": 0, "written": 0, "skipped": 0, "failed": 0}
+    if not tasks:
+        logger.warning(f"No partitions to enrich for {trade_date}")
+        return results
+
+    output_date_dir.mkdir(parents=True, exist_ok=True)
+    symbol_rows: dict[str, int] = {}
+    start = time.perf_counter()
+
+    with spawn_pool(config.max_workers) as pool:
+        futures = {pool.submit(enrich_partition, task): task.symbol for task in tasks}
+        for future in as_completed(futures):
+            symbol = futures[future]
+            try:
+                _, rows = future.result()
+            except Exception as e:
+                results["failed"] += 1
+                logger.error(f"  ✗ {symbol}: {e}")
+                continue
+            if rows is None:
+                results["skipped"] += 1
+                logger.debug(f"  {symbol}: inputs unchanged, skipping")
+            else:
+                results["written"] += 1
+                results["rows"] += rows
+                symbol_rows[symbol] = rows
+                logger.info(f"  ✓ {symbol}: {rows:,} rows")
+
+    if symbol_rows:
+        update_manifest(config.parquet_derived_root, DATASET, trade_date, symbol_rows)
+
+    elapsed = time.perf_counter() - start
+    logger.info(
+        f"✓ {trade_date}: {results['rows']:,} rows in {results['written']} partitions "
+        f"({results['skipped']} unchanged, {results['failed']} failed) in {elapsed:.1f}s"
+    )
+    return results
+
+
+def enrich_stage_b_range(
+    config: StageBConfig,
+    start_date: date,
+    end_date: date,
+    symbols: list[str] | None = None,
+    overwrite: bool = False,
+) -> dict[date, dict[str, int]]:
+    """
+    Run Stage B for each trading day in a date range.
+
+    Args:
+        config: Stage B configuration
+        start_date: Start date (inclusive)
+        end_date: End date (inclusive)
+        symbols: Symbols to process (None = all symbols with trades)
+        overwrite: Rebuild partitions even if their inputs are unchanged
+
+    Returns:
+        Dictionary mapping trade date to its results
+    """
+    dates = filter_trading_days(get_date_range(start_date, end_date))
+    logger.info(f"Stage B: {len(dates)} trading days from {start_date} to {end_date}")
+
+    all_results = {}
+    for trade_date in dates:
+        all_results[trade_date] = enrich_stage_b(config, trade_date, symbols=symbols, overwrite=overwrite)
+
+    total_rows = sum(r["rows"] for r in all_results.values())
+    logger.info("=" * 80)
+    logger.info(f"Stage B complete: {total_rows:,} rows across {len(dates)} days")
+    logger.info("=" * 80)
+    return all_results
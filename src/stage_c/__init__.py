@@ -0,0 +1 @@
+"""Stage C: Build time bars from raw trades and NBBO."""
@@ -0,0 +1,325 @@
+"""Vectorized bar construction from raw trades and NBBO."""
+
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, timedelta
+
+import polars as pl
+
+from ..stage_a.date_utils import session_bounds_utc
+
+logger = logging.getLogger(__name__)
+
+# Bar columns and dtypes, in output order
+BAR_SCHEMA = {
+    "trade_date": pl.Date,
+    "symbol": pl.Utf8,
+    "bar_start": pl.Datetime(time_zone="UTC"),
+    # Trades
+    "open": pl.Float64,
+    "high": pl.Float64,
+    "low": pl.Float64,
+    "close": pl.Float64,
+    "volume": pl.Int64,
+    "notional": pl.Float64,  # sum(price * size), so VWAP rolls up exactly
+    "vwap": pl.Float64,
+    "num_trades": pl.Int64,
+    # NBBO at bar close (carried forward from the last update)
+    "best_bid_close": pl.Float64,
+    "best_ask_close": pl.Float64,
+    "mid_close": pl.Float64,
+    "spread_close": pl.Float64,
+    # NBBO over the bar
+    "avg_spread": pl.Float64,  # Time-weighted over valid NBBO states
+    "nbbo_seconds": pl.Float64,  # Seconds of valid NBBO in the bar (avg_spread weight)
+    "quote_updates": pl.Int64,
+}
+
+
+def bar_grid(session_start: datetime, session_end: datetime, every: str) -> pl.DataFrame:
+    """
+    Every bar start covering [session_start, session_end).
+
+    Bars are aligned to the clock (e.g. 1m bars start on the minute), so the
+    first bar starts at session_start truncated to ``every``.
+
+    Returns:
+        DataFrame with a single bar_start column (UTC, microseconds)
+    """
+    bounds = pl.DataFrame({"t": [session_start, session_end]}).with_columns(
+        pl.col("t").cast(pl.Datetime("us", "UTC")).dt.truncate(every)
+    )
+    first, last = bounds["t"][0], bounds["t"][1]
+    if last == session_end:
+        # Session ends on a bar boundary: no bar starts at the close
+        last = last - timedelta(microseconds=1)
+    return pl.DataFrame({
+        "bar_start": pl.datetime_range(first, last, interval=every, time_zone="UTC", eager=True),
+    }).with_columns(pl.col("bar_start").cast(pl.Datetime("us", "UTC")))
+
+
+def trade_bars(trades: pl.DataFrame, every: str) -> pl.DataFrame:
+    """
+    Trade OHLCV, notional, VWAP and trade count per bar.
+
+    Args:
+        trades: Trades with ts_event, price and size
+        every: Bar size (Polars duration string, e.g. "1m")
+
+    Returns:
+        One row per bar that has trades
+    """
+    price = pl.col("price").cast(pl.Float64)
+    size = pl.col("size").cast(pl.Int64)
+    return (
+        trades.select([
+            pl.col("ts_event").cast(pl.Datetime("us", "UTC")),
+            price.alias("price"),
+            size.alias("size"),
+        ])
+        .sort("ts_event", maintain_order=True)
+        .group_by_dynamic("ts_event", every=every, closed="left", label="left")
+        .agg([
+            pl.col("price").first().alias("open"),
+            pl.col("price").max().alias("high"),
+            pl.col("price").min().alias("low"),
+            pl.col("price").last().alias("close"),
+            pl.col("size").sum().alias("volume"),
+            (pl.col("price") * pl.col("size")).sum().alias("notional"),
+            pl.len().cast(pl.Int64).alias("num_trades"),
+        ])
+        .rename({"ts_event": "bar_start"})
+        .with_columns((pl.col("notional") / pl.col("volume")).alias("vwap"))
+    )
+
+
+def nbbo_bars(
+    nbbo: pl.DataFrame,
+    grid: pl.DataFrame,
+    every: str,
+    session_end: datetime,
+) -> pl.DataFrame:
+    """
+    NBBO close values, time-weighted spread and update counts per bar.
+
+    Each NBBO state lasts until the next update. A synthetic row carrying the
+    prevailing state is inserted at every bar boundary, so each state's
+    duration is split exactly across the bars it spans.
+
+    Args:
+        nbbo: NBBO updates with ts_event, best_bid and best_ask
+        grid: Bar starts (from bar_grid)
+        every: Bar size
+        session_end: End of the last bar's coverage (UTC)
+
+    Returns:
+        One row per grid bar (NBBO columns null before the first update)
+    """
+    bid = pl.col("best_bid").cast(pl.Float64)
+    ask = pl.col("best_ask").cast(pl.Float64)
+    updates = (
+        nbbo.select([
+            pl.col("ts_event").cast(pl.Datetime("us", "UTC")),
+            bid.alias("best_bid"),
+            ask.alias("best_ask"),
+        ])
+        .with_columns(pl.lit(1, dtype=pl.Int64).alias("is_update"))
+        .sort("ts_event", maintain_order=True)
+    )
+
+    # State prevailing at each bar start (strictly before it: an update exactly
+    # on the boundary follows the boundary row and takes over from there)
+    boundaries = (
+        grid.rename({"bar_start": "ts_event"})
+        .join_asof(
+            updates.drop("is_update").with_columns(
+                (pl.col("ts_event") + pl.duration(microseconds=1)).alias("ts_effective")
+            ).drop("ts_event"),
+            left_on="ts_event",
+            right_on="ts_effective",
+            strategy="backward",
+        )
+        .drop("ts_effective")
+        .with_columns(pl.lit(0, dtype=pl.Int64).alias("is_update"))
+    )
+
+    spread = pl.col("best_ask") - pl.col("best_bid")
+    valid = (pl.col("best_bid") > 0) & (pl.col("best_ask") > 0) & (spread >= 0)
+    end = pl.lit(session_end).cast(pl.Datetime("us", "UTC"))
+
+    segments = (
+        pl.concat([boundaries, updates.select(boundaries.columns)], how="vertical")
+        .sort(["ts_event", "is_update"], maintain_order=True)
+        .filter(pl.col("ts_event") < end)
+        .with_columns(
+            (pl.col("ts_event").shift(-1).fill_null(end) - pl.col("ts_event"))
+            .dt.total_microseconds()
+            .alias("duration_us")
+        )
+        .with_columns(
+            pl.when(valid).then(pl.col("duration_us")).otherwise(0).alias("valid_us"),
+            spread.alias("spread"),
+        )
+    )
+
+    return (
+        segments.group_by_dynamic("ts_event", every=every, closed="left", label="left")
+        .agg([
+            pl.col("best_bid").last().alias("best_bid_close"),
+            pl.col("best_ask").last().alias("best_ask_close"),
+            (pl.col("spread") * pl.col("valid_us")).sum().alias("_spread_us"),
+            pl.col("valid_us").sum().alias("_valid_us"),
+            pl.col("is_update").sum().alias("quote_updates"),
+        ])
+        .rename({"ts_event": "bar_start"})
+        .with_columns([
+            ((pl.col("best_bid_close") + pl.col("best_ask_close")) / 2).alias("mid_close"),
+            (pl.col("best_ask_close") - pl.col("best_bid_close")).alias("spread_close"),
+            pl.when(pl.col("_valid_us") > 0)
+            .then(pl.col("_spread_us") / pl.col("_valid_us"))
+            .otherwise(None)
+            .alias("avg_spread"),
+            (pl.col("_valid_us") / 1_000_000).alias("nbbo_seconds"),
+        ])
+        .drop(["_spread_us", "_valid_us"])
+    )
+
+
+def build_symbol_bars(
+    trades: pl.DataFrame | None,
+    nbbo: pl.DataFrame | None,
+    trade_date: date,
+    symbol: str,
+    every: str = "1m",
+    timezone: str = "America/New_York",
+) -> pl.DataFrame:
+    """
+    Build bars for one symbol and day on the full session grid.
+
+    Bars without trades have null OHLC/VWAP and zero volume; NBBO close
+    values carry forward from the last update.
+
+    Args:
+        trades: Raw trades (ts_event, price, size), or None
+        nbbo: Raw NBBO (ts_event, best_bid, best_ask), or None
+        trade_date: Trade date
+        symbol: Symbol
+        every: Bar size (Polars duration string)
+        timezone: Exchange timezone for session bounds
+
+    Returns:
+        DataFrame with BAR_SCHEMA columns, one row per bar
+    """
+    session_start, session_end = session_bounds_utc(trade_date, timezone)
+    grid = bar_grid(session_start, session_end, every)
+    in_session = pl.col("ts_event").is_between(
+        pl.lit(session_start).cast(pl.Datetime("us", "UTC")),
+        pl.lit(session_end).cast(pl.Datetime("us", "UTC")),
+        closed="left",
+    )
+
+    bars = grid
+    if trades is not None and not trades.is_empty():
+        trades = trades.with_columns(pl.col("ts_event").cast(pl.Datetime("us", "UTC"))).filter(in_session)
+        bars = bars.join(trade_bars(trades, every), on="bar_start", how="left")
+    if nbbo is not None and not nbbo.is_empty():
+        nbbo = nbbo.with_columns(pl.col("ts_event").cast(pl.Datetime("us", "UTC"))).filter(
+            pl.col("ts_event") < pl.lit(session_end).cast(pl.Datetime("us", "UTC"))
+        )
+        bars = bars.join(nbbo_bars(nbbo, grid, every, session_end), on="bar_start", how="left")
+
+    bars = bars.with_columns([
+        pl.lit(trade_date).alias("trade_date"),
+        pl.lit(symbol).alias("symbol"),
+    ])
+    bars = bars.select([
+        (pl.col(name).cast(dtype) if name in bars.columns else pl.lit(None, dtype=dtype)).alias(name)
+        for name, dtype in BAR_SCHEMA.items()
+    ])
+    return bars.sort("bar_start").with_columns([
+        pl.col(["best_bid_close", "best_ask_close", "mid_close", "spread_close"]).forward_fill(),
+        pl.col(["volume", "notional", "num_trades", "nbbo_seconds", "quote_updates"]).fill_null(0),
+    ])
+
+
+def bar_duration(every: str) -> timedelta:
+    """
+    Parse a bar size such as "1s", "5m", "1h" or "1d" into a timedelta.
+
+    Raises:
+        ValueError: If the bar size is not <int><s|m|h|d>
+    """
+    units = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days"}
+    count, unit = every[:-1], every[-1:]
+    if unit not in units or not count.isdigit() or int(count) <= 0:
+        raise ValueError(f"Invalid bar size: {every!r} (expected e.g. 1s, 1m, 5m, 1h, 1d)")
+    return timedelta(**{units[unit]: int(count)})
+
+
+def rollup_levels(bar_sizes: list[str]) -> list[str]:
+    """
+    Order bar sizes finest first and check each level can be built from the previous.
+
+    A coarser bar is an exact union of finer bars only if its size is a
+    multiple of the finer size (bars are clock-aligned, so boundaries match).
+
+    Raises:
+        ValueError: If a size is invalid or not a multiple of the next finer size
+    """
+    levels = sorted(set(bar_sizes), key=bar_duration)
+    for finer, coarser in zip(levels, levels[1:]):
+        if bar_duration(coarser) % bar_duration(finer):
+            raise ValueError(f"Bar size {coarser} is not a multiple of {finer}; cannot roll up")
+    return levels
+
+
+def rollup_bars(bars: pl.DataFrame, every: str) -> pl.DataFrame:
+    """
+    Aggregate finer bars into coarser ones without touching ticks.
+
+    Every column of BAR_SCHEMA composes exactly: OHLC from the first/last
+    non-null open/close and max/min, additive totals are summed, VWAP is
+    recomputed from notional and volume, NBBO closes take the last bar's
+    (already carried-forward) values, and avg_spread is re-weighted by
+    nbbo_seconds.
+
+    Args:
+        bars: Finer bars (BAR_SCHEMA), any number of symbols
+        every: Coarser bar size (a multiple of the finer size)
+
+    Returns:
+        Coarser bars with BAR_SCHEMA columns, sorted by (symbol, bar_start)
+    """
+    rolled = (
+        bars.sort(["symbol", "bar_start"])
+        .group_by_dynamic("bar_start", every=every, closed="left", label="left", group_by="symbol")
+        .agg([
+            pl.col("trade_date").first(),
+            pl.col("open").drop_nulls().first(),
+            pl.col("high").max(),
+            pl.col("low").min(),
+            pl.col("close").drop_nulls().last(),
+            pl.col("volume").sum(),
+            pl.col("notional").sum(),
+            pl.col("num_trades").sum(),
+            pl.col("best_bid_close").last(),
+            pl.col("best_ask_close").last(),
+            pl.col("mid_close").last(),
+            pl.col("spread_close").last(),
+            (pl.col("avg_spread").fill_null(0) * pl.col("nbbo_seconds")).sum().alias("_spread_s"),
+            pl.col("nbbo_seconds").sum(),
+            pl.col("quote_updates").sum(),
+        ])
+        .with_columns([
+            pl.when(pl.col("volume") > 0)
+            .then(pl.col("notional") / pl.col("volume"))
+            .otherwise(None)
+            .alias("vwap"),
+            pl.when(pl.col("nbbo_seconds") > 0)
+            .then(pl.col("_spread_s") / pl.col("nbbo_seconds"))
+            .otherwise(None)
+            .alias("avg_spread"),
+        ])
+    )
+    return rolled.select([pl.col(name).cast(dtype) for name, dtype in BAR_SCHEMA.items()])
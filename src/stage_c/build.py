@@ -0,0 +1,122 @@
+"""CLI entry point for Stage C bar building."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from datetime import datetime
+
+from .config import load_config
+from .stage_c import build_stage_c, build_stage_c_range
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
+    handlers=[
+        logging.StreamHandler(),
+    ],
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Stage C: Build time bars from raw trades and NBBO",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Build the configured bar levels (stage_c.bar_sizes) for a single date
+  python -m src.stage_c.build --date 2024-06-10 --config config.yaml
+
+  # Build 1-second bars and roll them up to 1m, 5m, 1h and 1d
+  python -m src.stage_c.build --date 2024-06-10 --config config.yaml --bar-sizes 1s 1m 5m 1h 1d
+
+  # Build a date range with 8 worker processes
+  python -m src.stage_c.build --start-date 2024-06-10 --end-date 2024-06-14 --config config.yaml --workers 8
+
+  # Rebuild even if the raw inputs are unchanged
+  python -m src.stage_c.build --date 2024-06-10 --config config.yaml --overwrite
+        """,
+    )
+
+    parser.add_argument(
+        "--date",
+        help="Single trade date in YYYY-MM-DD format (mutually exclusive with --start-date/--end-date)",
+    )
+    parser.add_argument(
+        "--start-date",
+        help="Start date for date range (YYYY-MM-DD, inclusive). Requires --end-date",
+    )
+    parser.add_argument(
+        "--end-date",
+        help="End date for date range (YYYY-MM-DD, inclusive). Requires --start-date",
+    )
+    parser.add_argument(
+        "--config",
+        required=True,
+        help="Path to config YAML file",
+    )
+    parser.add_argument(
+        "--bar-sizes",
+        nargs="+",
+        default=None,
+        help="Bar levels to build, e.g. 1s 1m 5m 1h 1d (overrides stage_c.bar_sizes)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (overrides stage_c.max_workers)",
+    )
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Rebuild days even if their inputs are unchanged",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Enable verbose logging",
+    )
+
+    args = parser.parse_args()
+
+    if args.date is None and not (args.start_date and args.end_date):
+        parser.error("Must provide either --date OR both --start-date and --end-date")
+    if args.date is not None and (args.start_date or args.end_date):
+        parser.error("--date cannot be used with --start-date or --end-date")
+
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    try:
+        config = load_config(args.config)
+        logger.info(f"Loaded config from {args.config}")
+        logger.info(f"  Raw root: {config.parquet_raw_root}")
+        logger.info(f"  Derived root: {config.parquet_derived_root}")
+    except Exception as e:
+        logger.error(f"Error loading config: {e}")
+        sys.exit(1)
+
+    if args.workers is not None:
+        config.max_workers = args.workers
+    if args.bar_sizes is not None:
+        config.bar_sizes = args.bar_sizes
+
+    try:
+        if args.date:
+            trade_date = datetime.fromisoformat(args.date).date()
+            build_stage_c(config, trade_date, overwrite=args.overwrite)
+        else:
+            start_date = datetime.fromisoformat(args.start_date).date()
+            end_date = datetime.fromisoformat(args.end_date).date()
+            build_stage_c_range(config, start_date, end_date, overwrite=args.overwrite)
+    except Exception as e:
+        logger.error(f"Stage C failed: {e}", exc_info=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Configuration management for Stage C bar building."""
+
+from __future__ import annotations
+
+import dataclasses
+from pathlib import Path
+from typing import Optional
+
+import yaml
+
+from ..stage_a.compression import CompressionProfile, load_profiles
+
+
+@dataclasses.dataclass
+class StageCConfig:
+    """Configuration for Stage C bar building."""
+
+    # Paths
+    parquet_raw_root: Path  # Stage A output (trades + nbbo)
+    parquet_derived_root: Path  # Stage C output (bars_*)
+
+    # Bar levels: the finest is built from ticks, each coarser one from the level below
+    bar_sizes: list[str] = dataclasses.field(default_factory=lambda: ["1m"])
+
+    # Processing settings
+    max_workers: Optional[int] = None  # Worker processes (None = CPU count)
+
+    # Parquet settings
+    compression: str = "snappy"  # Codec ("zstd:9") or preset ("fast", "balanced", "archive")
+    compression_profiles: dict[str, CompressionProfile] = dataclasses.field(default_factory=dict)  # Per-dataset override
+
+    # Timezone (session bounds are 09:30-16:00 local time, 13:00 close on early-close days)
+    timezone: str = "America/New_York"
+
+
+def load_config(config_path: str) -> StageCConfig:
+    """Load configuration from YAML file."""
+    with open(config_path, "r", encoding="utf-8") as f:
+        raw = yaml.safe_load(f)
+
+    stage_c = raw.get("stage_c", {})
+    stage_b = raw.get("stage_b", {})
+    stage_a = raw.get("stage_a", {})
+
+    return StageCConfig(
+        parquet_raw_root=Path(stage_c.get("parquet_raw_root", stage_a.get("parquet_raw_root", "/Volumes/Data/parquet_raw"))),
+        parquet_derived_root=Path(stage_c.get("parquet_derived_root", stage_b.get("parquet_derived_root", "/Volumes/Data/parquet_derived"))),
+        bar_sizes=stage_c.get("bar_sizes", ["1m"]),
+        max_workers=stage_c.get("max_workers"),
+        compression=stage_c.get("compression", "snappy"),
+        compression_profiles=load_profiles(stage_c.get("compression_profiles")),
+        timezone=stage_c.get("timezone", "America/New_York"),
+    )
@@ -0,0 +1,218 @@
+"""Stage C: Build time bars from raw trades and NBBO, rolling up coarser levels."""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from concurrent.futures import as_completed
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+import polars as pl
+
+from ..stage_a.compression import profile_for, write_parquet_file
+from ..stage_a.date_utils import filter_trading_days, get_date_range, is_trading_day
+from ..stage_a.partitions import date_partition_dir, list_symbol_partitions
+from ..stage_a.workers import spawn_pool
+from ..stage_b.asof_join import scan_partition
+from ..stage_b.fingerprint import compute_fingerprint, read_fingerprint, write_fingerprint
+from .bars import build_symbol_bars, rollup_bars, rollup_levels
+from .config import StageCConfig
+
+logger = logging.getLogger(__name__)
+
+# Bump when the bar definitions change so existing days are rebuilt
+STAGE_C_VERSION = 2
+
+TRADE_COLUMNS = ["ts_event", "price", "size"]
+NBBO_COLUMNS = ["ts_event", "best_bid", "best_ask"]
+
+
+def dataset_for(bar_size: str) -> str:
+    """Derived dataset name for a bar size (e.g. "5m" -> "bars_5m")."""
+    return f"bars_{bar_size}"
+
+
+def build_partition_bars(
+    trade_date: date,
+    symbol: str,
+    trades_dir: Optional[Path],
+    nbbo_dir: Optional[Path],
+    every: str = "1m",
+    timezone: str = "America/New_York",
+) -> pl.DataFrame:
+    """
+    Build bars for one (date, symbol) partition (runs in a worker process).
+
+    Only the columns the bars need are read from the raw partitions.
+
+    Args:
+        trade_date: Trade date
+        symbol: Symbol
+        trades_dir: Raw trades partition directory, or None
+        nbbo_dir: Raw NBBO partition directory, or None
+        every: Bar size
+        timezone: Exchange timezone
+
+    Returns:
+        Bars for the symbol on the full session grid
+    """
+    trades = scan_partition(trades_dir, columns=TRADE_COLUMNS).collect() if trades_dir else None
+    nbbo = scan_partition(nbbo_dir, columns=NBBO_COLUMNS).collect() if nbbo_dir else None
+    return build_symbol_bars(trades, nbbo, trade_date, symbol, every=every, timezone=timezone)
+
+
+def build_stage_c(
+    config: StageCConfig,
+    trade_date: date,
+    overwrite: bool = False,
+) -> dict[str, int]:
+    """
+    Build every configured bar level for one trade date.
+
+    The finest level is built from raw ticks, symbols in parallel in a process
+    pool; each coarser level is then rolled up from the level below it, never
+    from ticks, so extra levels cost a small fraction of the raw scan. Each
+    level is written as its own dataset, one file per day sorted by
+    (symbol, bar_start). Days whose raw inputs are unchanged since the last
+    build are skipped.
+
+    Args:
+        config: Stage C configuration
+        trade_date: Trade date to process
+        overwrite: Rebuild even if inputs are unchanged
+
+    Returns:
+        Dictionary mapping dataset name (e.g. "bars_1m") to rows written
+        (empty if skipped or no data)
+    """
+    levels = rollup_levels(config.bar_sizes)
+    trades_parts = list_symbol_partitions(date_partition_dir(config.parquet_raw_root, "trades", trade_date))
+    nbbo_parts = list_symbol_partitions(date_partition_dir(config.parquet_raw_root, "nbbo", trade_date))
+    symbols = sorted(set(trades_parts) | set(nbbo_parts))
+    output_dirs = {
+        level: date_partition_dir(config.parquet_derived_root, dataset_for(level), trade_date)
+        for level in levels
+    }
+
+    logger.info("=" * 80)
+    logger.info(f"Stage C: Build bars {', '.join(levels)} for {trade_date} ({len(symbols)} symbols)")
+    logger.info("=" * 80)
+
+    if not is_trading_day(trade_date):
+        logger.warning(f"{trade_date} is not a trading day (weekend or market holiday), skipping")
+        return {}
+
+    if not symbols:
+        logger.warning(f"No raw partitions for {trade_date}")
+        return {}
+
+    input_files = [
+        f
+        for parts in (trades_parts, nbbo_parts)
+        for part_dir in parts.values()
+        for f in part_dir.glob("*.parquet")
+    ]
+    fingerprint = compute_fingerprint(
+        input_files,
+        {"version": STAGE_C_VERSION, "finest": levels[0], "timezone": config.timezone},
+    )
+    if not overwrite and all(read_fingerprint(d) == fingerprint for d in output_dirs.values()):
+        logger.info(f"  Bars for {trade_date} are up to date, skipping")
+        return {}
+
+    start = time.perf_counter()
+    frames: list[pl.DataFrame] = []
+    failed = 0
+
+    with spawn_pool(config.max_workers) as pool:
+        futures = {
+            pool.submit(
+                build_partition_bars,
+                trade_date,
+                symbol,
+                trades_parts.get(symbol),
+                nbbo_parts.get(symbol),
+                levels[0],
+                config.timezone,
+            ): symbol
+            for symbol in symbols
+        }
+        for future in as_completed(futures):
+            symbol = futures[future]
+            try:
+                frames.append(future.result())
+            except Exception as e:
+                failed += 1
+                logger.error(f"  ✗ {symbol}: {e}")
+
+    if not frames:
+        logger.warning(f"No bars built for {trade_date}")
+        return {}
+
+    logger.info(f"  Built {levels[0]} bars for {len(frames)} symbols ({failed} failed) "
+                f"in {time.perf_counter() - start:.1f}s")
+
+    results = {}
+    bars = pl.concat(frames, how="vertical").sort(["symbol", "bar_start"])
+    for i, level in enumerate(levels):
+        if i > 0:
+            level_start = time.perf_counter()
+            bars = rollup_bars(bars, level)
+            logger.info(f"  Rolled up {levels[i - 1]} -> {level} in {time.perf_counter() - level_start:.2f}s")
+
+        output_dir = output_dirs[level]
+        output_dir.mkdir(parents=True, exist_ok=True)
+        out_path = output_dir / "part_0000.parquet"
+        tmp_path = out_path.with_name(out_path.name + ".tmp")
+        write_parquet_file(bars, tmp_path, profile_for(config.compression, config.compression_profiles, dataset_for(level)))
+        os.replace(tmp_path, out_path)
+        if failed == 0:
+            # A partial day must not look up to date on the next run
+            write_fingerprint(output_dir, fingerprint)
+        (output_dir / "_SUCCESS").touch()
+        results[dataset_for(level)] = len(bars)
+        logger.info(f"  ✓ Wrote {len(bars):,} rows to {output_dir}")
+
+    logger.info(f"✓ {trade_date}: {len(levels)} bar levels in {time.perf_counter() - start:.1f}s")
+    return results
+
+
+def build_stage_c_range(
+    config: StageCConfig,
+    start_date: date,
+    end_date: date,
+    overwrite: bool = False,
+) -> dict[date, dict[str, int]]:
+    """
+    Build every configured bar level for each trading day in a date range.
+
+    Args:
+        config: Stage C configuration
+        start_date: Start date (inclusive)
+        end_date: End date (inclusive)
+        overwrite: Rebuild even if inputs are unchanged
+
+    Returns:
+        Dictionary mapping trade date to rows written per dataset
+    """
+    dates = filter_trading_days(get_date_range(start_date, end_date))
+    logger.info(f"Stage C: {len(dates)} trading days from {start_date} to {end_date}")
+
+    results = {}
+    for trade_date in dates:
+        results[trade_date] = build_stage_c(config, trade_date, overwrite=overwrite)
+
+    totals: dict[str, int] = {}
+    for day_results in results.values():
+        for dataset, rows in day_results.items():
+            totals[dataset] = totals.get(dataset, 0) + rows
+
+    logger.info("=" * 80)
+    logger.info(f"Stage C complete: {len(dates)} days")
+    for dataset, rows in totals.items():
+        logger.info(f"  {dataset}: {rows:,} rows")
+    logger.info("=" * 80)
+    return results
@@ -28,7 +28,16 @@ from streamlit_app.data_checker import (
     find_common_sources_for_symbols,
     find_symbols_across_dates,
 )
-from streamlit_app.data_loader import load_trades, load_nbbo
+from streamlit_app.data_loader import (
+    LoadRequest,
+    load_many,
+    load_partition_stats,
+    slice_time_window,
+    sort_by_time,
+)
+from streamlit_app.read_cache import configure_read_cache, get_read_cache
+from streamlit_app.prefetch import get_prefetcher, plan_prefetch
+from stage_a.partition_stats import PartitionStats
 from streamlit_app.visualizations import (
     plot_price_panel,
     plot_spread_bps_timeline,
@@ -144,6 +153,43 @@ def load_app_config(config_path: str = "config.yaml") -> StreamlitAppConfig:
     return load_config(config_path)
 
 
+def summary_row(
+    data_root: Path,
+    source: str,
+    trade_date: date,
+    symbol: str,
+    trades: pl.DataFrame | None,
+    nbbo: pl.DataFrame | None,
+) -> dict:
+    """
+    Summary table columns for one (source, date, symbol).
+    
+    Read from the partitions' statistics sidecars; partitions written before
+    sidecars existed fall back to the loaded frames.
+    """
+    trade_stats = load_partition_stats(data_root, source, "trades", trade_date, [symbol])
+    if trade_stats is None and trades is not None and len(trades) > 0:
+        trade_stats = PartitionStats.from_frame(trades, "trades")
+    nbbo_stats = load_partition_stats(data_root, source, "nbbo", trade_date, [symbol])
+    if nbbo_stats is None and nbbo is not None and len(nbbo) > 0:
+        nbbo_stats = PartitionStats.from_frame(nbbo, "nbbo")
+    
+    row = {"Total Trades": "N/A", "Total Volume": "N/A", "Notional": "N/A",
+           "NBBO Records": "N/A", "Mean Spread": "N/A", "Median Spread": "N/A"}
+    if trade_stats is not None and trade_stats.rows > 0:
+        row["Total Trades"] = f"{trade_stats.rows:,}"
+        if trade_stats.volume is not None:
+            row["Total Volume"] = f"{trade_stats.volume:,}"
+        if trade_stats.notional is not None:
+            row["Notional"] = f"${trade_stats.notional:,.0f}"
+    if nbbo_stats is not None and nbbo_stats.rows > 0:
+        row["NBBO Records"] = f"{nbbo_stats.rows:,}"
+        if nbbo_stats.mean_spread is not None:
+            row["Mean Spread"] = f"${nbbo_stats.mean_spread:.4f}"
+            row["Median Spread"] = f"${nbbo_stats.median_spread:.4f}"
+    return row
+
+
 
 
 def main():
@@ -159,6 +205,13 @@ def main():
         st.error(f"Error loading configuration: {e}")
         st.stop()
     
+    # Local copies of NAS partition files (shared by all sessions of this process)
+    if config.read_cache_dir is not None:
+        try:
+            configure_read_cache(config.read_cache_dir, config.read_cache_max_bytes)
+        except OSError as e:
+            logger.warning(f"Read cache disabled: {e}")
+    
     # Get data root from config
     data_root = config.data_root
     available_sources = list(config.data_sources.keys())
@@ -552,122 +605,142 @@ def main():
     # For others: {source: {"trades": df, "nbbo": df}}
     data_by_source = {}
     
+    # Background prefetch belongs to a selection: a new selection cancels what the
+    # previous one queued so it does not compete with this load, while reruns of the
+    # same selection (e.g. slider moves) leave it running
+    prefetcher = get_prefetcher(st.session_state) if config.prefetch_days > 0 else None
+    
     with st.spinner("Loading data..."):
         if symbol_mode == "Single Symbol":
-            # Single Symbol mode: load data for each date and source separately
+            # Single Symbol mode: load every (source, date, data type) in parallel
+            load_requests = [
+                LoadRequest(source, load_date, data_type, selected_symbols[0])
+                for source in selected_sources
+                for load_date in selected_dates_list
+                for data_type in ("trades", "nbbo")
+            ]
+            selection_changed = st.session_state.get("prefetch_selection") != tuple(load_requests)
+            if prefetcher is not None and selection_changed:
+                prefetcher.cancel()
+            loaded, load_timings, load_wall = load_many(
+                data_root, load_requests, timezone=config.timezone, cache=st.session_state.get("loaded_frames")
+            )
+            # Keep this selection's frames so reruns (e.g. slider moves) don't reload them
+            st.session_state.loaded_frames = loaded
             for source in selected_sources:
                 data_by_source[source] = {}
                 for load_date in selected_dates_list:
                     data_by_source[source][load_date] = {"trades": None, "nbbo": None}
-                    symbol_param = selected_symbols[0]
-                    
-                    # Load trades for this date/source
-                    trades_date = load_trades(
-                        data_root, source, load_date, symbol=symbol_param, timezone=config.timezone
-                    )
-                    if trades_date is not None and len(trades_date) > 0:
-                        data_by_source[source][load_date]["trades"] = trades_date
-                    
-                    # Load NBBO for this date/source
-                    nbbo_date = load_nbbo(
-                        data_root, source, load_date, symbol=symbol_param, timezone=config.timezone
-                    )
-                    if nbbo_date is not None and len(nbbo_date) > 0:
-                        data_by_source[source][load_date]["nbbo"] = nbbo_date
+            for request, df in loaded.items():
+                if df is not None and len(df) > 0:
+                    data_by_source[request.source][request.trade_date][request.data_type] = df
+            
+            # Warm the cache for adjacent trading days and the symbol's other sources
+            if prefetcher is not None and selection_changed:
+                other_sources = [
+                    s for s in available_sources
+                    if sources_available.get(s, False) and s not in selected_sources
+                ]
+                prefetcher.schedule(
+                    data_root,
+                    selected_symbols[0],
+                    plan_prefetch(
+                        selected_dates_list, available_dates, selected_sources, other_sources,
+                        days=config.prefetch_days,
+                    ),
+                )
+                st.session_state.prefetch_selection = tuple(load_requests)
             
-            # For backward compatibility and time range calculation, combine all data into primary trades/nbbo
-            # Combine all dates and sources into single DataFrames for global min/max time
-            all_trades = []
-            all_nbbo = []
-            for source in selected_sources:
-                for load_date in selected_dates_list:
-                    t = data_by_source[source][load_date]["trades"]
-                    n = data_by_source[source][load_date]["nbbo"]
-                    if t is not None: all_trades.append(t)
-                    if n is not None: all_nbbo.append(n)
-            
-            # Combine trades
-            if all_trades:
-                if len(all_trades) == 1:
-                    trades = all_trades[0]
-                else:
-                    try:
-                        # Find common columns across all DataFrames
-                        common_cols = set(all_trades[0].columns)
-                        for df in all_trades[1:]:
-                            common_cols = common_cols.intersection(set(df.columns))
-                        common_cols = sorted(list(common_cols))
-                        
-                        # Select only common columns and use vertical_relaxed to handle type differences
-                        aligned_trades = [df.select(common_cols) for df in all_trades]
-                        trades = pl.concat(aligned_trades, how="vertical_relaxed")
-                    except Exception as e:
-                        logger.warning(f"Error concatenating trades: {e}, using first DataFrame")
-                        trades = all_trades[0]
+            # Combined frames are built (and sorted) once per selection and reused across reruns
+            combined_key = tuple(load_requests)
+            combined = st.session_state.get("combined_frames")
+            if combined is not None and combined[0] == combined_key:
+                trades, nbbo = combined[1]
             else:
-                trades = None
-            
-            # Combine NBBO
-            if all_nbbo:
-                if len(all_nbbo) == 1:
-                    nbbo = all_nbbo[0]
-                else:
-                    try:
-                        # Find common columns across all DataFrames
-                        common_cols = set(all_nbbo[0].columns)
-                        for df in all_nbbo[1:]:
-                            common_cols = common_cols.intersection(set(df.columns))
-                        common_cols = sorted(list(common_cols))
+                # For backward compatibility and time range calculation, combine all data into primary trades/nbbo
+                # Combine all dates and sources into single DataFrames for global min/max time
+                all_trades = []
+                all_nbbo = []
+                for source in selected_sources:
+                    for load_date in selected_dates_list:
+                        t = data_by_source[source][load_date]["trades"]
+                        n = data_by_source[source][load_date]["nbbo"]
+                        if t is not None: all_trades.append(t)
+                        if n is not None: all_nbbo.append(n)
+                
+                # Combine trades
+                if all_trades:
+                    if len(all_trades) == 1:
+                        trades = all_trades[0]
+                    else:
+                        try:
+                            # Find common columns across all DataFrames
+                            common_cols = set(all_trades[0].columns)
+                            for df in all_trades[1:]:
+                                common_cols = common_cols.intersection(set(df.columns))
+                            common_cols = sorted(list(common_cols))
                         
-                        # Select only common columns and use vertical_relaxed to handle type differences
-                        aligned_nbbo = [df.select(common_cols) for df in all_nbbo]
-                        nbbo = pl.concat(aligned_nbbo, how="vertical_relaxed")
-                    except Exception as e:
-                        logger.warning(f"Error concatenating NBBO: {e}, using first DataFrame")
+                            # New partitions of every source share the raw schemas, but partitions
+                            # written before the canonical casts have Float64 prices and Alpaca NBBO
+                            # has extra columns: keep common columns and relax dtypes
+                            aligned_trades = [df.select(common_cols) for df in all_trades]
+                            trades = pl.concat(aligned_trades, how="vertical_relaxed")
+                        except Exception as e:
+                            logger.warning(f"Error concatenating trades: {e}, using first DataFrame")
+                            trades = all_trades[0]
+                else:
+                    trades = None
+                
+                # Combine NBBO
+                if all_nbbo:
+                    if len(all_nbbo) == 1:
                         nbbo = all_nbbo[0]
-            else:
-                nbbo = None
+                    else:
+                        try:
+                            # Find common columns across all DataFrames
+                            common_cols = set(all_nbbo[0].columns)
+                            for df in all_nbbo[1:]:
+                                common_cols = common_cols.intersection(set(df.columns))
+                            common_cols = sorted(list(common_cols))
+                        
+                            # Same as trades: older partitions and source-specific columns differ
+                            aligned_nbbo = [df.select(common_cols) for df in all_nbbo]
+                            nbbo = pl.concat(aligned_nbbo, how="vertical_relaxed")
+                        except Exception as e:
+                            logger.warning(f"Error concatenating NBBO: {e}, using first DataFrame")
+                            nbbo = all_nbbo[0]
+                else:
+                    nbbo = None
+                
+                trades = sort_by_time(trades) if trades is not None else None
+                nbbo = sort_by_time(nbbo) if nbbo is not None else None
+                st.session_state.combined_frames = (combined_key, (trades, nbbo))
         else:
-            # Multiple Symbols or Cross Comparison mode: load data normally
+            # Multiple Symbols or Cross Comparison mode: load every (source, data type) in parallel
+            # Pass single symbol as string, multiple as tuple (list in the loaders)
+            symbol_param = selected_symbols[0] if len(selected_symbols) == 1 else tuple(selected_symbols)
+            load_requests = []
             for source in selected_sources:
                 data_by_source[source] = {"trades": None, "nbbo": None}
                 
-                # Check if data is available (different logic for Single Symbol vs Multiple Symbols)
-                # For Multiple Symbols mode, use the availability check
-                trades_available = any(
-                    symbol_availability.get(sym, {}).get(source, False)
-                    for sym in selected_symbols
-                )
-                nbbo_available = any(
-                    nbbo_symbol_availability.get(sym, {}).get(source, False)
-                    for sym in selected_symbols
-                )
-                
-                if trades_available:
-                    # Pass single symbol as string, multiple as list
-                    symbol_param = selected_symbols[0] if len(selected_symbols) == 1 else selected_symbols
-                    trades = load_trades(
-                        data_root,
-                        source,
-                        selected_date,
-                        symbol=symbol_param,
-                        timezone=config.timezone,
-                    )
-                    if trades is not None and len(trades) > 0:
-                        data_by_source[source]["trades"] = trades
-                
-                if nbbo_available:
-                    # Pass single symbol as string, multiple as list
-                    symbol_param = selected_symbols[0] if len(selected_symbols) == 1 else selected_symbols
-                    nbbo = load_nbbo(
-                        data_root,
-                        source,
-                        selected_date,
-                        symbol=symbol_param,
-                        timezone=config.timezone,
-                    )
-                    if nbbo is not None and len(nbbo) > 0:
-                        data_by_source[source]["nbbo"] = nbbo
+                # Only load data types the availability check found for this source
+                if any(symbol_availability.get(sym, {}).get(source, False) for sym in selected_symbols):
+                    load_requests.append(LoadRequest(source, selected_date, "trades", symbol_param))
+                if any(nbbo_symbol_availability.get(sym, {}).get(source, False) for sym in selected_symbols):
+                    load_requests.append(LoadRequest(source, selected_date, "nbbo", symbol_param))
+            
+            if prefetcher is not None and st.session_state.get("prefetch_selection") != tuple(load_requests):
+                prefetcher.cancel()
+                st.session_state.prefetch_selection = tuple(load_requests)
+            
+            loaded, load_timings, load_wall = load_many(
+                data_root, load_requests, timezone=config.timezone, cache=st.session_state.get("loaded_frames")
+            )
+            # Keep this selection's frames so reruns (e.g. slider moves) don't reload them
+            st.session_state.loaded_frames = loaded
+            for request, df in loaded.items():
+                if df is not None and len(df) > 0:
+                    data_by_source[request.source][request.data_type] = df
             
             # For backward compatibility, use first source's data as primary
             if selected_sources:
@@ -678,6 +751,18 @@ def main():
                 trades = None
                 nbbo = None
     
+    # Load timing breakdown (slowest first)
+    with st.sidebar.expander("⏱️ Load Timing", expanded=False):
+        sequential = sum(t.seconds for t in load_timings)
+        st.caption(f"{len(load_timings)} loads in {load_wall:.2f}s ({sequential:.2f}s if run one after another)")
+        for t in sorted(load_timings, key=lambda t: t.seconds, reverse=True):
+            r = t.request
+            took = "cached" if t.cached else f"{t.seconds:.2f}s"
+            st.caption(f"{r.source.upper()} {r.trade_date} {r.data_type}: {took}, {t.rows:,} rows")
+        read_cache = get_read_cache()
+        if read_cache is not None:
+            st.caption(f"Read cache: {read_cache.hits:,} hits, {read_cache.misses:,} misses")
+    
     # Store data_by_source in session state for visualization
     # For Single Symbol mode, convert date keys to strings to avoid serialization issues
     # Also ensure we're storing the data correctly
@@ -922,14 +1007,7 @@ def main():
                     pl.col("ts_event").str.strptime(pl.Datetime(time_unit="us"), "%Y-%m-%d %H:%M:%S%.f")
                 )
             
-            # Convert to timestamp (microseconds since epoch) for comparison
-            start_ts = int(start_time.timestamp() * 1_000_000)
-            end_ts = int(end_time.timestamp() * 1_000_000)
-            
-            trades = trades.filter(
-                (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
-                (pl.col("ts_event").dt.timestamp("us") <= end_ts)
-            )
+            trades = slice_time_window(trades, start_time, end_time)
             trades_after = len(trades)
             if trades_after == 0 and trades_before > 0:
                 logger.warning(f"Time range filter removed all trades. Before: {trades_before}, After: {trades_after}, Range: {start_time} to {end_time}")
@@ -949,14 +1027,7 @@ def main():
                     pl.col("ts_event").str.strptime(pl.Datetime(time_unit="us"), "%Y-%m-%d %H:%M:%S%.f")
                 )
             
-            # Convert to timestamp (microseconds since epoch) for comparison
-            start_ts = int(start_time.timestamp() * 1_000_000)
-            end_ts = int(end_time.timestamp() * 1_000_000)
-            
-            nbbo = nbbo.filter(
-                (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
-                (pl.col("ts_event").dt.timestamp("us") <= end_ts)
-            )
+            nbbo = slice_time_window(nbbo, start_time, end_time)
             nbbo_after = len(nbbo)
             if nbbo_after == 0 and nbbo_before > 0:
                 logger.warning(f"Time range filter removed all NBBO. Before: {nbbo_before}, After: {nbbo_after}, Range: {start_time} to {end_time}")
@@ -1086,23 +1157,9 @@ def main():
                     "Symbol": selected_symbols[0],
                     "Source": source.upper(),
                 }
-                
-                if source_trades is not None and len(source_trades) > 0:
-                    row["Total Trades"] = f"{len(source_trades):,}"
-                    if "size" in source_trades.columns:
-                        total_volume = source_trades["size"].sum()
-                        row["Total Volume"] = f"{total_volume:,}"
-                    else:
-                        row["Total Volume"] = "N/A"
-                else:
-                    row["Total Trades"] = "N/A"
-                    row["Total Volume"] = "N/A"
-                
-                if source_nbbo is not None and len(source_nbbo) > 0:
-                    row["NBBO Records"] = f"{len(source_nbbo):,}"
-                else:
-                    row["NBBO Records"] = "N/A"
-                
+                row.update(summary_row(
+                    data_root, source, plot_date, selected_symbols[0], source_trades, source_nbbo
+                ))
                 table_data.append(row)
         
         if table_data:
@@ -1117,23 +1174,9 @@ def main():
             source_nbbo = data_by_source.get(source, {}).get("nbbo")
             
             row = {"Source": source.upper()}
-            
-            if source_trades is not None and len(source_trades) > 0:
-                row["Total Trades"] = f"{len(source_trades):,}"
-                if "size" in source_trades.columns:
-                    total_volume = source_trades["size"].sum()
-                    row["Total Volume"] = f"{total_volume:,}"
-                else:
-                    row["Total Volume"] = "N/A"
-            else:
-                row["Total Trades"] = "N/A"
-                row["Total Volume"] = "N/A"
-            
-            if source_nbbo is not None and len(source_nbbo) > 0:
-                row["NBBO Records"] = f"{len(source_nbbo):,}"
-            else:
-                row["NBBO Records"] = "N/A"
-            
+            row.update(summary_row(
+                data_root, source, selected_date, selected_symbols[0], source_trades, source_nbbo
+            ))
             table_data.append(row)
         
         if table_data:
@@ -1224,12 +1267,7 @@ def main():
             # Filter by time range
             if source_trades is not None and len(source_trades) > 0 and start_time is not None and end_time is not None:
                 try:
-                    start_ts = int(start_time.timestamp() * 1_000_000)
-                    end_ts = int(end_time.timestamp() * 1_000_000)
-                    source_trades = source_trades.filter(
-                        (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
-                        (pl.col("ts_event").dt.timestamp("us") <= end_ts)
-                    )
+                    source_trades = slice_time_window(source_trades, start_time, end_time)
                     # Collect trade prices
                     if "price" in source_trades.columns:
                         all_prices.extend(source_trades["price"].to_list())
@@ -1238,12 +1276,7 @@ def main():
             
             if source_nbbo is not None and len(source_nbbo) > 0 and start_time is not None and end_time is not None:
                 try:
-                    start_ts = int(start_time.timestamp() * 1_000_000)
-                    end_ts = int(end_time.timestamp() * 1_000_000)
-                    source_nbbo = source_nbbo.filter(
-                        (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
-                        (pl.col("ts_event").dt.timestamp("us") <= end_ts)
-                    )
+                    source_nbbo = slice_time_window(source_nbbo, start_time, end_time)
                     # Collect NBBO prices
                     if "best_bid" in source_nbbo.columns:
                         all_prices.extend(source_nbbo["best_bid"].to_list())
@@ -1335,24 +1368,14 @@ def main():
                                     if source_trades is not None and len(source_trades) > 0 and start_time is not None and end_time is not None:
                                         try:
                                             day_start_time, day_end_time = get_day_time_range(plot_date, start_time, end_time)
-                                            start_ts = int(day_start_time.timestamp() * 1_000_000)
-                                            end_ts = int(day_end_time.timestamp() * 1_000_000)
-                                            source_trades = source_trades.filter(
-                                                (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
-                                                (pl.col("ts_event").dt.timestamp("us") <= end_ts)
-                                            )
+                                            source_trades = slice_time_window(source_trades, day_start_time, day_end_time)
                                         except Exception as e:
                                             pass
                                     
                                     if source_nbbo is not None and len(source_nbbo) > 0 and start_time is not None and end_time is not None:
                                         try:
                                             day_start_time, day_end_time = get_day_time_range(plot_date, start_time, end_time)
-                                            start_ts = int(day_start_time.timestamp() * 1_000_000)
-                                            end_ts = int(day_end_time.timestamp() * 1_000_000)
-                                            source_nbbo = source_nbbo.filter(
-                                                (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
-                                                (pl.col("ts_event").dt.timestamp("us") <= end_ts)
-                                            )
+                                            source_nbbo = slice_time_window(source_nbbo, day_start_time, day_end_time)
                                         except Exception as e:
                                             pass
                                     
@@ -1396,24 +1419,14 @@ def main():
                                 if source_trades is not None and len(source_trades) > 0 and start_time is not None and end_time is not None:
                                     try:
                                         day_start_time, day_end_time = get_day_time_range(plot_date, start_time, end_time)
-                                        start_ts = int(day_start_time.timestamp() * 1_000_000)
-                                        end_ts = int(day_end_time.timestamp() * 1_000_000)
-                                        source_trades = source_trades.filter(
-                                            (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
-                                            (pl.col("ts_event").dt.timestamp("us") <= end_ts)
-                                        )
+                                        source_trades = slice_time_window(source_trades, day_start_time, day_end_time)
                                     except Exception as e:
                                         pass
                                 
                                 if source_nbbo is not None and len(source_nbbo) > 0 and start_time is not None and end_time is not None:
                                     try:
                                         day_start_time, day_end_time = get_day_time_range(plot_date, start_time, end_time)
-                                        start_ts = int(day_start_time.timestamp() * 1_000_000)
-                                        end_ts = int(day_end_time.timestamp() * 1_000_000)
-                                        source_nbbo = source_nbbo.filter(
-                                            (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
-                                            (pl.col("ts_event").dt.timestamp("us") <= end_ts)
-                                        )
+                                        source_nbbo = slice_time_window(source_nbbo, day_start_time, day_end_time)
                                     except Exception as e:
                                         pass
                                 
@@ -1491,23 +1504,13 @@ def main():
                         
                         if filtered_trades is not None and len(filtered_trades) > 0 and start_time is not None and end_time is not None:
                             try:
-                                start_ts = int(start_time.timestamp() * 1_000_000)
-                                end_ts = int(end_time.timestamp() * 1_000_000)
-                                filtered_trades = filtered_trades.filter(
-                                    (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
-                                    (pl.col("ts_event").dt.timestamp("us") <= end_ts)
-                                )
+                                filtered_trades = slice_time_window(filtered_trades, start_time, end_time)
                             except Exception:
                                 pass
                         
                         if filtered_nbbo is not None and len(filtered_nbbo) > 0 and start_time is not None and end_time is not None:
                             try:
-                                start_ts = int(start_time.timestamp() * 1_000_000)
-                                end_ts = int(end_time.timestamp() * 1_000_000)
-                                filtered_nbbo = filtered_nbbo.filter(
-                                    (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
-                                    (pl.col("ts_event").dt.timestamp("us") <= end_ts)
-                                )
+                                filtered_nbbo = slice_time_window(filtered_nbbo, start_time, end_time)
                             except Exception:
                                 pass
                         
@@ -1652,12 +1655,7 @@ def main():
                         if source_nbbo is not None and len(source_nbbo) > 0 and start_time is not None and end_time is not None:
                             try:
                                 day_start_time, day_end_time = get_day_time_range(plot_date, start_time, end_time)
-                                start_ts = int(day_start_time.timestamp() * 1_000_000)
-                                end_ts = int(day_end_time.timestamp() * 1_000_000)
-                                source_nbbo = source_nbbo.filter(
-                                    (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
-                                    (pl.col("ts_event").dt.timestamp("us") <= end_ts)
-                                )
+                                source_nbbo = slice_time_window(source_nbbo, day_start_time, day_end_time)
                             except Exception: pass
                         
                         if source_nbbo is not None and len(source_nbbo) > 0:
@@ -1689,12 +1687,7 @@ def main():
                     if source_nbbo is not None and len(source_nbbo) > 0 and start_time is not None and end_time is not None:
                         try:
                             day_start_time, day_end_time = get_day_time_range(plot_date, start_time, end_time)
-                            start_ts = int(day_start_time.timestamp() * 1_000_000)
-                            end_ts = int(day_end_time.timestamp() * 1_000_000)
-                            source_nbbo = source_nbbo.filter(
-                                (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
-                                (pl.col("ts_event").dt.timestamp("us") <= end_ts)
-                            )
+                            source_nbbo = slice_time_window(source_nbbo, day_start_time, day_end_time)
                         except Exception: pass
                     
                     if source_nbbo is not None and len(source_nbbo) > 0:
@@ -1733,12 +1726,7 @@ def main():
             filtered_nbbo = nbbo_for_viz
             if filtered_nbbo is not None and len(filtered_nbbo) > 0 and start_time is not None and end_time is not None:
                 try:
-                    start_ts = int(start_time.timestamp() * 1_000_000)
-                    end_ts = int(end_time.timestamp() * 1_000_000)
-                    filtered_nbbo = filtered_nbbo.filter(
-                        (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
-                        (pl.col("ts_event").dt.timestamp("us") <= end_ts)
-                    )
+                    filtered_nbbo = slice_time_window(filtered_nbbo, start_time, end_time)
                 except Exception:
                     pass
             
@@ -1816,12 +1804,7 @@ def main():
                         if source_nbbo is not None and len(source_nbbo) > 0 and start_time is not None and end_time is not None:
                             try:
                                 day_start_time, day_end_time = get_day_time_range(plot_date, start_time, end_time)
-                                start_ts = int(day_start_time.timestamp() * 1_000_000)
-                                end_ts = int(day_end_time.timestamp() * 1_000_000)
-                                source_nbbo = source_nbbo.filter(
-                                    (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
-                                    (pl.col("ts_event").dt.timestamp("us") <= end_ts)
-                                )
+                                source_nbbo = slice_time_window(source_nbbo, day_start_time, day_end_time)
                             except Exception: pass
                         
                         if source_nbbo is not None and len(source_nbbo) > 0:
@@ -1849,12 +1832,7 @@ def main():
                     if source_nbbo is not None and len(source_nbbo) > 0 and start_time is not None and end_time is not None:
                         try:
                             day_start_time, day_end_time = get_day_time_range(plot_date, start_time, end_time)
-                            start_ts = int(day_start_time.timestamp() * 1_000_000)
-                            end_ts = int(day_end_time.timestamp() * 1_000_000)
-                            source_nbbo = source_nbbo.filter(
-                                (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
-                                (pl.col("ts_event").dt.timestamp("us") <= end_ts)
-                            )
+                            source_nbbo = slice_time_window(source_nbbo, day_start_time, day_end_time)
                         except Exception: pass
                     
                     if source_nbbo is not None and len(source_nbbo) > 0:
@@ -1887,12 +1865,7 @@ def main():
             filtered_nbbo = nbbo_for_viz
             if filtered_nbbo is not None and len(filtered_nbbo) > 0 and start_time is not None and end_time is not None:
                 try:
-                    start_ts = int(start_time.timestamp() * 1_000_000)
-                    end_ts = int(end_time.timestamp() * 1_000_000)
-                    filtered_nbbo = filtered_nbbo.filter(
-                        (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
-                        (pl.col("ts_event").dt.timestamp("us") <= end_ts)
-                    )
+                    filtered_nbbo = slice_time_window(filtered_nbbo, start_time, end_time)
                 except Exception:
                     pass
             
@@ -1967,12 +1940,7 @@ def main():
                         if source_trades is not None and len(source_trades) > 0 and start_time is not None and end_time is not None:
                             try:
                                 day_start_time, day_end_time = get_day_time_range(plot_date, start_time, end_time)
-                                start_ts = int(day_start_time.timestamp() * 1_000_000)
-                                end_ts = int(day_end_time.timestamp() * 1_000_000)
-                                source_trades = source_trades.filter(
-                                    (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
-                                    (pl.col("ts_event").dt.timestamp("us") <= end_ts)
-                                )
+                                source_trades = slice_time_window(source_trades, day_start_time, day_end_time)
                             except Exception:
                                 pass
                         
@@ -2016,12 +1984,7 @@ def main():
                         if source_nbbo is not None and len(source_nbbo) > 0 and start_time is not None and end_time is not None:
                             try:
                                 day_start_time, day_end_time = get_day_time_range(plot_date, start_time, end_time)
-                                start_ts = int(day_start_time.timestamp() * 1_000_000)
-                                end_ts = int(day_end_time.timestamp() * 1_000_000)
-                                source_nbbo = source_nbbo.filter(
-                                    (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
-                                    (pl.col("ts_event").dt.timestamp("us") <= end_ts)
-                                )
+                                source_nbbo = slice_time_window(source_nbbo, day_start_time, day_end_time)
                             except Exception:
                                 pass
                         
@@ -2058,24 +2021,14 @@ def main():
                     if source_trades is not None and len(source_trades) > 0 and start_time is not None and end_time is not None:
                         try:
                             day_start_time, day_end_time = get_day_time_range(plot_date, start_time, end_time)
-                            start_ts = int(day_start_time.timestamp() * 1_000_000)
-                            end_ts = int(day_end_time.timestamp() * 1_000_000)
-                            source_trades = source_trades.filter(
-                                (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
-                                (pl.col("ts_event").dt.timestamp("us") <= end_ts)
-                            )
+                            source_trades = slice_time_window(source_trades, day_start_time, day_end_time)
                         except Exception:
                             pass
                     
                     if source_nbbo is not None and len(source_nbbo) > 0 and start_time is not None and end_time is not None:
                         try:
                             day_start_time, day_end_time = get_day_time_range(plot_date, start_time, end_time)
-                            start_ts = int(day_start_time.timestamp() * 1_000_000)
-                            end_ts = int(day_end_time.timestamp() * 1_000_000)
-                            source_nbbo = source_nbbo.filter(
-                                (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
-                                (pl.col("ts_event").dt.timestamp("us") <= end_ts)
-                            )
+                            source_nbbo = slice_time_window(source_nbbo, day_start_time, day_end_time)
                         except Exception:
                             pass
                     
@@ -2216,23 +2169,13 @@ def main():
             
             if filtered_trades is not None and len(filtered_trades) > 0 and start_time is not None and end_time is not None:
                 try:
-                    start_ts = int(start_time.timestamp() * 1_000_000)
-                    end_ts = int(end_time.timestamp() * 1_000_000)
-                    filtered_trades = filtered_trades.filter(
-                        (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
-                        (pl.col("ts_event").dt.timestamp("us") <= end_ts)
-                    )
+                    filtered_trades = slice_time_window(filtered_trades, start_time, end_time)
                 except Exception:
                     pass
             
             if filtered_nbbo is not None and len(filtered_nbbo) > 0 and start_time is not None and end_time is not None:
                 try:
-                    start_ts = int(start_time.timestamp() * 1_000_000)
-                    end_ts = int(end_time.timestamp() * 1_000_000)
-                    filtered_nbbo = filtered_nbbo.filter(
-                        (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
-                        (pl.col("ts_event").dt.timestamp("us") <= end_ts)
-                    )
+                    filtered_nbbo = slice_time_window(filtered_nbbo, start_time, end_time)
                 except Exception:
                     pass
             
@@ -21,6 +21,13 @@ class StreamlitAppConfig:
     
     # Timezone
     timezone: str = "America/New_York"
+    
+    # Local read cache for partition files (None = read from the data roots directly)
+    read_cache_dir: Optional[Path] = None
+    read_cache_max_bytes: int = 20 * 1024**3
+    
+    # Trading days on each side of the selection prefetched into the read cache (0 = off)
+    prefetch_days: int = 1
 
 
 def load_config(config_path: str = "config.yaml") -> StreamlitAppConfig:
@@ -83,9 +90,15 @@ def load_config(config_path: str = "config.yaml") -> StreamlitAppConfig:
     if "stage_a" in raw:
         timezone = raw["stage_a"].get("timezone", timezone)
     
+    app = raw.get("streamlit_app", {}) or {}
+    read_cache_dir = app.get("read_cache_dir")
+    
     return StreamlitAppConfig(
         data_root=data_root,
         data_sources=data_sources,
         timezone=timezone,
+        read_cache_dir=Path(read_cache_dir).expanduser() if read_cache_dir else None,
+        read_cache_max_bytes=int(float(app.get("read_cache_max_gb", 20)) * 1024**3),
+        prefetch_days=app.get("prefetch_days", 1),
     )
 
@@ -7,6 +7,9 @@ from datetime import date, timedelta
 from pathlib import Path
 from typing import Literal, Optional
 
+from stage_a.manifest import read_manifest, scan_date_partition
+from stage_a.partitions import date_partition_dir, symbol_dir_name
+
 logger = logging.getLogger(__name__)
 
 DataType = Literal["trades", "quotes", "nbbo"]
@@ -34,31 +37,16 @@ def check_data_available(
     """
     # Construct path: {data_root}/{data_source}/parquet_raw/{data_type}/trade_date={date}/symbol={symbol}/
     parquet_root = data_root / data_source / "parquet_raw"
-    date_str = trade_date.isoformat()
-    date_dir = parquet_root / data_type / f"trade_date={date_str}"
+    date_dir = date_partition_dir(parquet_root, data_type, trade_date)
     
     if not date_dir.exists():
         return False
     
     if symbol:
-        # Check if symbol directory exists
-        symbol_dirs = list(date_dir.glob("symbol=*"))
-        for sym_dir in symbol_dirs:
-            # Extract symbol from directory name (handle tuple notation)
-            sym_name = sym_dir.name.replace("symbol=", "")
-            if sym_name.startswith("('") and sym_name.endswith("',)"):
-                extracted_symbol = sym_name[2:-3]
-            elif sym_name.startswith('("') and sym_name.endswith('",)'):
-                extracted_symbol = sym_name[2:-3]
-            else:
-                extracted_symbol = sym_name
-            
-            if extracted_symbol == symbol:
-                # Check if parquet files exist
-                parquet_files = list(sym_dir.glob("*.parquet")) or list(sym_dir.glob("**/*.parquet"))
-                return len(parquet_files) > 0
-        
-        return False
+        # Symbol directories are always symbol=SYM, so check the path directly
+        sym_dir = date_dir / symbol_dir_name(symbol)
+        parquet_files = list(sym_dir.glob("*.parquet")) or list(sym_dir.glob("**/*.parquet"))
+        return len(parquet_files) > 0
     else:
         # Check if any parquet files exist in date directory
         parquet_files = list(date_dir.glob("**/*.parquet"))
@@ -168,6 +156,9 @@ def find_available_symbols(
     """
     Find all available symbols for a given date and data source.
     
+    Reads the date's manifest when it is current; otherwise the date
+    directory is scanned once (see stage_a.manifest.scan_date_partition).
+    
     Args:
         data_root: Root data directory
         data_source: Data source name
@@ -178,31 +169,10 @@ def find_available_symbols(
         List of available symbols (sorted)
     """
     parquet_root = data_root / data_source / "parquet_raw"
-    date_str = trade_date.isoformat()
-    date_dir = parquet_root / data_type / f"trade_date={date_str}"
-    
-    if not date_dir.exists():
-        return []
-    
-    symbols = set()
-    symbol_dirs = list(date_dir.glob("symbol=*"))
-    
-    for sym_dir in symbol_dirs:
-        # Extract symbol from directory name
-        sym_name = sym_dir.name.replace("symbol=", "")
-        if sym_name.startswith("('") and sym_name.endswith("',)"):
-            extracted_symbol = sym_name[2:-3]
-        elif sym_name.startswith('("') and sym_name.endswith('",)'):
-            extracted_symbol = sym_name[2:-3]
-        else:
-            extracted_symbol = sym_name
-        
-        # Verify parquet files exist
-        parquet_files = list(sym_dir.glob("*.parquet")) or list(sym_dir.glob("**/*.parquet"))
-        if parquet_files:
-            symbols.add(extracted_symbol)
-    
-    return sorted(list(symbols))
+    symbols = read_manifest(parquet_root, data_type, trade_date)
+    if symbols is None:
+        symbols = scan_date_partition(date_partition_dir(parquet_root, data_type, trade_date))
+    return sorted(symbols)
 
 
 def suggest_alternatives(
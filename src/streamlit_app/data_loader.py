@@ -2,15 +2,152 @@
 
 from __future__ import annotations
 
+import dataclasses
 import logging
-from datetime import date
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
 from typing import Optional
 
 import polars as pl
 
+from stage_a.partition_stats import PartitionStats, read_partition_stats
+from stage_a.partitions import date_partition_dir, symbol_dir_name
+from streamlit_app.read_cache import get_read_cache
+
 logger = logging.getLogger(__name__)
 
+# Concurrent (source, date, data type) loads; scans are NAS I/O bound and
+# Polars releases the GIL while reading
+DEFAULT_LOAD_WORKERS = 8
+
+
+def _concat_frames(frames: list[pl.DataFrame | pl.LazyFrame]) -> pl.DataFrame:
+    """
+    Concatenate per-file frames whose code columns may be encoded differently.
+    
+    Partitions written before the raw schemas stored code columns (exchange,
+    condition codes, symbol, ...) as Categorical have them as String; any
+    column that is Categorical in some file is cast to Categorical in the
+    others so old and new partitions load together.
+    
+    Args:
+        frames: DataFrames or LazyFrames (one per parquet file)
+        
+    Returns:
+        Concatenated (collected) DataFrame
+    """
+    schemas = [frame.schema for frame in frames]
+    categorical = {
+        name for schema in schemas for name, dtype in schema.items() if dtype == pl.Categorical
+    }
+    harmonized = []
+    for frame, schema in zip(frames, schemas):
+        casts = [
+            pl.col(name).cast(pl.Categorical)
+            for name in categorical
+            if name in schema and schema[name] == pl.String
+        ]
+        harmonized.append(frame.with_columns(casts) if casts else frame)
+    
+    combined = pl.concat(harmonized)
+    return combined.collect() if isinstance(combined, pl.LazyFrame) else combined
+
+
+def sort_by_time(df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Sort a loaded frame by ts_event (nulls last) unless it already is.
+    
+    Loaded frames are kept sorted so slice_time_window can find a window by
+    binary search instead of filtering the whole day.
+    
+    Args:
+        df: Loaded trades or NBBO
+        
+    Returns:
+        DataFrame with ts_event flagged as sorted
+    """
+    if "ts_event" not in df.columns or df["ts_event"].flags["SORTED_ASC"]:
+        return df
+    if df["ts_event"].is_sorted():
+        return df.with_columns(pl.col("ts_event").set_sorted())
+    return df.sort("ts_event", nulls_last=True, maintain_order=True)
+
+
+def _search_sorted(ts: pl.Series, when: datetime, side: str) -> int:
+    """Index of a datetime in a sorted ts_event column (same epoch-microsecond semantics as the filters)."""
+    value = pl.Series([int(when.timestamp() * 1_000_000)]).cast(pl.Datetime("us"))
+    if ts.dtype.time_zone is not None:
+        value = value.dt.replace_time_zone("UTC").dt.convert_time_zone(ts.dtype.time_zone)
+    index = ts.search_sorted(value.cast(ts.dtype), side=side)
+    return int(index[0]) if isinstance(index, pl.Series) else int(index)
+
+
+def slice_time_window(df: pl.DataFrame, start_time: datetime, end_time: datetime) -> pl.DataFrame:
+    """
+    Rows with start_time <= ts_event <= end_time.
+    
+    On a frame sorted by ts_event (see sort_by_time) the bounds are found by
+    binary search and the result is a zero-copy slice, so the cost depends on
+    the window, not the day. Unsorted frames are filtered.
+    
+    Args:
+        df: Trades or NBBO with a ts_event column
+        start_time: Window start (inclusive)
+        end_time: Window end (inclusive)
+        
+    Returns:
+        DataFrame of the window
+    """
+    ts = df["ts_event"]
+    if not ts.flags["SORTED_ASC"]:
+        start_ts = int(start_time.timestamp() * 1_000_000)
+        end_ts = int(end_time.timestamp() * 1_000_000)
+        return df.filter(
+            (pl.col("ts_event").dt.timestamp("us") >= start_ts) &
+            (pl.col("ts_event").dt.timestamp("us") <= end_ts)
+        )
+    lo = _search_sorted(ts, start_time, "left")
+    hi = _search_sorted(ts, end_time, "right")
+    return df.slice(lo, max(0, hi - lo))
+
+
+def partition_files(
+    data_root: Path,
+    data_source: str,
+    data_type: str,
+    trade_date: date,
+    symbol: Optional[str | list[str]] = None,
+) -> Optional[list[Path]]:
+    """
+    Parquet files of a (date, symbol) partition on the data root.
+    
+    Args:
+        data_root: Root data directory
+        data_source: Data source name
+        data_type: Data type (trades, nbbo)
+        trade_date: Trade date
+        symbol: Optional symbol (str) or list of symbols (list[str]); None = all symbols
+        
+    Returns:
+        List of parquet files, or None if the date directory does not exist
+    """
+    date_dir = date_partition_dir(data_root / data_source / "parquet_raw", data_type, trade_date)
+    if not date_dir.exists():
+        return None
+    
+    if not symbol:
+        # All symbols
+        return list(date_dir.glob("**/*.parquet"))
+    
+    # Symbol directories are always symbol=SYM, so build the paths directly
+    parquet_files = []
+    for sym in symbol if isinstance(symbol, list) else [symbol]:
+        sym_dir = date_dir / symbol_dir_name(sym)
+        parquet_files.extend(list(sym_dir.glob("*.parquet")) or list(sym_dir.glob("**/*.parquet")))
+    return parquet_files
+
 
 def load_trades(
     data_root: Path,
@@ -32,42 +169,20 @@ def load_trades(
     Returns:
         Polars DataFrame with trades, or None if not found
     """
-    parquet_root = data_root / data_source / "parquet_raw"
-    date_str = trade_date.isoformat()
-    date_dir = parquet_root / "trades" / f"trade_date={date_str}"
-    
-    if not date_dir.exists():
-        logger.warning(f"Trades directory not found: {date_dir}")
+    parquet_files = partition_files(data_root, data_source, "trades", trade_date, symbol)
+    if parquet_files is None:
+        logger.warning(f"Trades directory not found for {data_source} {trade_date}")
         return None
     
-    parquet_files = []
-    
-    if symbol:
-        # Handle both single symbol (str) and multiple symbols (list)
-        symbols_to_load = symbol if isinstance(symbol, list) else [symbol]
-        
-        # Find symbol directories
-        symbol_dirs = list(date_dir.glob("symbol=*"))
-        for sym_dir in symbol_dirs:
-            sym_name = sym_dir.name.replace("symbol=", "")
-            if sym_name.startswith("('") and sym_name.endswith("',)"):
-                extracted_symbol = sym_name[2:-3]
-            elif sym_name.startswith('("') and sym_name.endswith('",)'):
-                extracted_symbol = sym_name[2:-3]
-            else:
-                extracted_symbol = sym_name
-            
-            if extracted_symbol in symbols_to_load:
-                files = list(sym_dir.glob("*.parquet")) or list(sym_dir.glob("**/*.parquet"))
-                parquet_files.extend(files)
-    else:
-        # Load all symbols
-        parquet_files = list(date_dir.glob("**/*.parquet"))
-    
     if not parquet_files:
         logger.warning(f"No parquet files found for {trade_date}, symbol={symbol}")
         return None
     
+    # Read local copies when the read cache is configured
+    cache = get_read_cache()
+    if cache is not None:
+        parquet_files = cache.fetch_all(parquet_files)
+    
     logger.info(f"Loading {len(parquet_files)} parquet files...")
     
     # Use lazy evaluation for better performance with many files
@@ -87,14 +202,14 @@ def load_trades(
                 lazy_frames.append(lf)
             
             # Concatenate lazy frames and collect
-            trades = pl.concat(lazy_frames).collect()
+            trades = _concat_frames(lazy_frames)
         except Exception as e:
             logger.warning(f"Error using lazy loading, falling back to eager: {e}")
             # Fallback to eager loading
             dfs = []
             for pf in parquet_files:
                 try:
-                    df = pl.read_parquet(pf)
+                    df = pl.read_parquet(pf, memory_map=True)
                     if "trade_date" in df.columns:
                         if df["trade_date"].dtype == pl.String:
                             df = df.with_columns(
@@ -107,13 +222,13 @@ def load_trades(
             
             if not dfs:
                 return None
-            trades = pl.concat(dfs)
+            trades = _concat_frames(dfs)
     else:
         # For few files, use eager loading
         dfs = []
         for pf in parquet_files:
             try:
-                df = pl.read_parquet(pf)
+                df = pl.read_parquet(pf, memory_map=True)
                 # Normalize trade_date if needed
                 if "trade_date" in df.columns:
                     if df["trade_date"].dtype == pl.String:
@@ -128,7 +243,7 @@ def load_trades(
         if not dfs:
             return None
         
-        trades = pl.concat(dfs)
+        trades = _concat_frames(dfs)
     
     # Convert timestamps to specified timezone if ts_event exists
     if "ts_event" in trades.columns:
@@ -138,6 +253,9 @@ def load_trades(
                 pl.col("ts_event").dt.convert_time_zone(timezone)
             ])
     
+    # Sorted once here so time windows are sliced, not filtered
+    trades = sort_by_time(trades)
+    
     logger.info(f"Loaded {len(trades):,} trades")
     return trades
 
@@ -162,42 +280,20 @@ def load_nbbo(
     Returns:
         Polars DataFrame with NBBO, or None if not found
     """
-    parquet_root = data_root / data_source / "parquet_raw"
-    date_str = trade_date.isoformat()
-    date_dir = parquet_root / "nbbo" / f"trade_date={date_str}"
-    
-    if not date_dir.exists():
-        logger.warning(f"NBBO directory not found: {date_dir}")
+    parquet_files = partition_files(data_root, data_source, "nbbo", trade_date, symbol)
+    if parquet_files is None:
+        logger.warning(f"NBBO directory not found for {data_source} {trade_date}")
         return None
     
-    parquet_files = []
-    
-    if symbol:
-        # Handle both single symbol (str) and multiple symbols (list)
-        symbols_to_load = symbol if isinstance(symbol, list) else [symbol]
-        
-        # Find symbol directories
-        symbol_dirs = list(date_dir.glob("symbol=*"))
-        for sym_dir in symbol_dirs:
-            sym_name = sym_dir.name.replace("symbol=", "")
-            if sym_name.startswith("('") and sym_name.endswith("',)"):
-                extracted_symbol = sym_name[2:-3]
-            elif sym_name.startswith('("') and sym_name.endswith('",)'):
-                extracted_symbol = sym_name[2:-3]
-            else:
-                extracted_symbol = sym_name
-            
-            if extracted_symbol in symbols_to_load:
-                files = list(sym_dir.glob("*.parquet")) or list(sym_dir.glob("**/*.parquet"))
-                parquet_files.extend(files)
-    else:
-        # Load all symbols
-        parquet_files = list(date_dir.glob("**/*.parquet"))
-    
     if not parquet_files:
         logger.warning(f"No parquet files found for {trade_date}, symbol={symbol}")
         return None
     
+    # Read local copies when the read cache is configured
+    cache = get_read_cache()
+    if cache is not None:
+        parquet_files = cache.fetch_all(parquet_files)
+    
     logger.info(f"Loading {len(parquet_files)} parquet files...")
     
     # Use lazy evaluation for better performance with many files
@@ -216,14 +312,14 @@ def load_nbbo(
                 lazy_frames.append(lf)
             
             # Concatenate lazy frames and collect
-            nbbo = pl.concat(lazy_frames).collect()
+            nbbo = _concat_frames(lazy_frames)
         except Exception as e:
             logger.warning(f"Error using lazy loading, falling back to eager: {e}")
             # Fallback to eager loading
             dfs = []
             for pf in parquet_files:
                 try:
-                    df = pl.read_parquet(pf)
+                    df = pl.read_parquet(pf, memory_map=True)
                     if "trade_date" in df.columns:
                         if df["trade_date"].dtype == pl.String:
                             df = df.with_columns(
@@ -236,13 +332,13 @@ def load_nbbo(
             
             if not dfs:
                 return None
-            nbbo = pl.concat(dfs)
+            nbbo = _concat_frames(dfs)
     else:
         # For few files, use eager loading
         dfs = []
         for pf in parquet_files:
             try:
-                df = pl.read_parquet(pf)
+                df = pl.read_parquet(pf, memory_map=True)
                 # Normalize trade_date if needed
                 if "trade_date" in df.columns:
                     if df["trade_date"].dtype == pl.String:
@@ -257,7 +353,7 @@ def load_nbbo(
         if not dfs:
             return None
         
-        nbbo = pl.concat(dfs)
+        nbbo = _concat_frames(dfs)
     
     # Convert timestamps to specified timezone if ts_event exists
     if "ts_event" in nbbo.columns:
@@ -273,6 +369,117 @@ def load_nbbo(
             (pl.col("best_ask") - pl.col("best_bid")).alias("spread"),
         ])
     
+    # Sorted once here so time windows are sliced, not filtered
+    nbbo = sort_by_time(nbbo)
+    
     logger.info(f"Loaded {len(nbbo):,} NBBO records")
     return nbbo
 
+
+def load_partition_stats(
+    data_root: Path,
+    data_source: str,
+    data_type: str,
+    trade_date: date,
+    symbols: list[str],
+) -> Optional[PartitionStats]:
+    """
+    Combined statistics sidecars of (date, symbol) partitions, without reading tick data.
+    
+    Args:
+        data_root: Root data directory
+        data_source: Data source name
+        data_type: Data type (trades, nbbo)
+        trade_date: Trade date
+        symbols: Symbols to combine
+        
+    Returns:
+        Merged PartitionStats, or None if any symbol has no sidecar (e.g. written
+        before sidecars existed), in which case callers fall back to the data
+    """
+    date_dir = date_partition_dir(data_root / data_source / "parquet_raw", data_type, trade_date)
+    combined = PartitionStats()
+    for sym in set(symbols):
+        stats = read_partition_stats(date_dir / symbol_dir_name(sym))
+        if stats is None:
+            return None
+        combined = combined.merge(stats)
+    return combined
+
+
+@dataclasses.dataclass(frozen=True)
+class LoadRequest:
+    """One load_trades/load_nbbo call."""
+
+    source: str
+    trade_date: date
+    data_type: str  # trades or nbbo
+    symbol: str | tuple[str, ...]
+
+
+@dataclasses.dataclass
+class LoadTiming:
+    """Wall time and row count of one load."""
+
+    request: LoadRequest
+    seconds: float
+    rows: int
+    cached: bool = False
+
+
+def load_many(
+    data_root: Path,
+    requests: list[LoadRequest],
+    timezone: str = "America/New_York",
+    max_workers: int = DEFAULT_LOAD_WORKERS,
+    cache: Optional[dict[LoadRequest, Optional[pl.DataFrame]]] = None,
+) -> tuple[dict[LoadRequest, Optional[pl.DataFrame]], list[LoadTiming], float]:
+    """
+    Run several trades/NBBO loads in parallel on a thread pool.
+    
+    Args:
+        data_root: Root data directory
+        requests: Loads to run
+        timezone: Timezone to convert timestamps to
+        max_workers: Maximum concurrent loads
+        cache: Results of earlier calls (e.g. kept in session state); requests
+            found there are not loaded again
+        
+    Returns:
+        Tuple of (request -> DataFrame or None, per-load timings in request
+        order, total wall seconds)
+    """
+    loaders = {"trades": load_trades, "nbbo": load_nbbo}
+    
+    def run(request: LoadRequest) -> tuple[Optional[pl.DataFrame], LoadTiming]:
+        start = time.perf_counter()
+        symbol = list(request.symbol) if isinstance(request.symbol, tuple) else request.symbol
+        try:
+            df = loaders[request.data_type](
+                data_root, request.source, request.trade_date, symbol=symbol, timezone=timezone
+            )
+        except Exception as e:
+            logger.warning(f"Error loading {request.source} {request.data_type} {request.trade_date}: {e}")
+            df = None
+        seconds = time.perf_counter() - start
+        return df, LoadTiming(request, seconds, len(df) if df is not None else 0)
+    
+    start = time.perf_counter()
+    cache = cache or {}
+    to_load = [request for request in requests if request not in cache]
+    loaded: dict[LoadRequest, tuple[Optional[pl.DataFrame], LoadTiming]] = {}
+    if to_load:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(to_load)))) as pool:
+            loaded = dict(zip(to_load, pool.map(run, to_load)))
+    
+    results: dict[LoadRequest, Optional[pl.DataFrame]] = {}
+    timings: list[LoadTiming] = []
+    for request in requests:
+        if request in loaded:
+            results[request], timing = loaded[request]
+        else:
+            results[request] = cache[request]
+            rows = len(results[request]) if results[request] is not None else 0
+            timing = LoadTiming(request, 0.0, rows, cached=True)
+        timings.append(timing)
+    return results, timings, time.perf_counter() - start
@@ -0,0 +1,152 @@
+"""Background prefetch of the partitions a user is likely to open next.
+
+After the app loads a symbol, the previous/next trading days and the other
+sources for the same symbol are copied into the read cache on a small thread
+pool, so stepping to them reads local files. A new selection cancels what is
+still queued from the previous one.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Iterable, Optional
+
+from streamlit_app.data_loader import partition_files
+from streamlit_app.read_cache import get_read_cache
+
+logger = logging.getLogger(__name__)
+
+# Prefetch is NAS I/O bound; a few concurrent copies are enough and leave
+# bandwidth for foreground loads
+DEFAULT_PREFETCH_WORKERS = 2
+
+# Shared by every session of the process
+_EXECUTOR = ThreadPoolExecutor(max_workers=DEFAULT_PREFETCH_WORKERS, thread_name_prefix="prefetch")
+
+PrefetchTarget = tuple[str, date, str]  # (source, trade_date, data_type)
+
+
+def plan_prefetch(
+    selected_dates: list[date],
+    available_dates: Iterable[date],
+    selected_sources: list[str],
+    other_sources: list[str],
+    days: int = 1,
+) -> list[PrefetchTarget]:
+    """
+    Partitions to warm after a load, most likely next first.
+
+    Args:
+        selected_dates: Dates just loaded
+        available_dates: Dates with data in any source
+        selected_sources: Sources just loaded
+        other_sources: Other sources with data for the symbol
+        days: Trading days to prefetch on each side of the selection
+
+    Returns:
+        List of (source, trade_date, data_type)
+    """
+    if not selected_dates:
+        return []
+    dates = sorted(set(available_dates))
+    first, last = min(selected_dates), max(selected_dates)
+    following = [d for d in dates if d > last][:days]
+    preceding = [d for d in dates if d < first][-days:][::-1]
+
+    targets: list[PrefetchTarget] = []
+    for trade_date in following + preceding:
+        for source in selected_sources:
+            targets.extend((source, trade_date, data_type) for data_type in ("trades", "nbbo"))
+    for source in other_sources:
+        for trade_date in selected_dates:
+            targets.extend((source, trade_date, data_type) for data_type in ("trades", "nbbo"))
+    return targets
+
+
+class Prefetcher:
+    """
+    Warms the read cache for one session; schedule() cancels the previous plan.
+
+    Example:
+        >>> prefetcher = Prefetcher()
+        >>> prefetcher.schedule(data_root, "SPY", plan_prefetch(...))
+        >>> prefetcher.cancel()  # e.g. before a foreground load
+    """
+
+    def __init__(self):
+        self._futures: list[Future] = []
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """Drop queued partitions and stop running ones after their current file."""
+        self._cancelled.set()
+        for future in self._futures:
+            future.cancel()
+        self._futures = []
+
+    def schedule(self, data_root: Path, symbol: str, targets: list[PrefetchTarget]) -> int:
+        """
+        Replace the pending prefetch with targets.
+
+        Does nothing when no read cache is configured (there is nowhere to warm).
+
+        Args:
+            data_root: Root data directory
+            symbol: Symbol to prefetch
+            targets: (source, trade_date, data_type) partitions, in priority order
+
+        Returns:
+            Number of partitions queued
+        """
+        self.cancel()
+        if get_read_cache() is None or not targets:
+            return 0
+        self._cancelled = threading.Event()
+        self._futures = [
+            _EXECUTOR.submit(_warm, data_root, source, data_type, trade_date, symbol, self._cancelled)
+            for source, trade_date, data_type in targets
+        ]
+        logger.debug(f"Prefetching {len(targets)} partitions of {symbol}")
+        return len(targets)
+
+    @property
+    def pending(self) -> int:
+        """Partitions queued or in progress."""
+        return sum(1 for future in self._futures if not future.done())
+
+
+def _warm(
+    data_root: Path,
+    source: str,
+    data_type: str,
+    trade_date: date,
+    symbol: str,
+    cancelled: threading.Event,
+) -> int:
+    """Copy one partition's files into the read cache; returns files fetched."""
+    cache = get_read_cache()
+    if cache is None or cancelled.is_set():
+        return 0
+    fetched = 0
+    try:
+        for path in partition_files(data_root, source, data_type, trade_date, symbol) or []:
+            if cancelled.is_set():
+                break
+            cache.fetch(path)
+            fetched += 1
+    except OSError as e:
+        logger.debug(f"Prefetch of {source} {data_type} {trade_date} {symbol} failed: {e}")
+    return fetched
+
+
+def get_prefetcher(session_state) -> Optional[Prefetcher]:
+    """The session's prefetcher (created on first use), or None without a read cache."""
+    if get_read_cache() is None:
+        return None
+    if "prefetcher" not in session_state:
+        session_state["prefetcher"] = Prefetcher()
+    return session_state["prefetcher"]
@@ -0,0 +1,206 @@
+"""Local read-through cache for partition files on the NAS.
+
+The first load of a partition copies its parquet files to a local directory
+(e.g. on the SSD); later loads read the local copies, which Polars
+memory-maps, instead of going over the network.
+
+Entries are keyed by source path, size and mtime, so a rewritten partition is
+fetched again and never served stale. The cache is bounded in bytes with LRU
+eviction: a hit bumps the entry's mtime and eviction removes the oldest
+entries first. Copies are written to a temp file and renamed into place, and
+eviction holds an exclusive lock on the cache directory, so several Streamlit
+workers can share one cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: eviction is only serialized within the process
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 20 * 1024**3
+
+_LOCK_FILE = ".lock"
+_TMP_PREFIX = ".tmp-"
+
+
+class ReadCache:
+    """
+    Size-bounded LRU cache of parquet files in a local directory.
+
+    Example:
+        >>> cache = ReadCache(Path("~/.cache/market-data").expanduser(), max_bytes=50 * 1024**3)
+        >>> local = cache.fetch(Path("/Volumes/Data/taq/parquet_raw/nbbo/.../part.parquet"))
+        >>> pl.read_parquet(local, memory_map=True)
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: Local cache directory (created if missing)
+            max_bytes: Size the cache is trimmed to when inserts grow it past that
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Size estimate (this process's inserts since the last scan); the
+        # directory is only scanned when it exceeds max_bytes
+        self._approx_bytes: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, source: Path, st: os.stat_result) -> Path:
+        key = hashlib.sha1(f"{source}|{st.st_size}|{st.st_mtime_ns}".encode()).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}{source.suffix}"
+
+    def fetch(self, source: Path) -> Path:
+        """
+        Local copy of a file, copying it on a miss.
+
+        Args:
+            source: File on the NAS
+
+        Returns:
+            Path of the cached copy
+        """
+        source = Path(source)
+        st = os.stat(source)
+        entry = self._entry_path(source, st)
+        try:
+            # Bump recency for LRU eviction
+            os.utime(entry)
+            with self._lock:
+                self.hits += 1
+            return entry
+        except FileNotFoundError:
+            pass
+
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = entry.with_name(f"{_TMP_PREFIX}{uuid.uuid4().hex}")
+        try:
+            shutil.copyfile(source, tmp_path)
+            # Another worker may have copied the same entry meanwhile; contents are identical
+            os.replace(tmp_path, entry)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        with self._lock:
+            self.misses += 1
+            if self._approx_bytes is None:
+                self._approx_bytes = self.size_bytes()
+            else:
+                self._approx_bytes += st.st_size
+            over = self._approx_bytes > self.max_bytes
+        if over:
+            self.evict()
+        return entry
+
+    def fetch_all(self, sources: list[Path]) -> list[Path]:
+        """
+        Local copies of several files; a file that cannot be cached is read from its source.
+
+        Args:
+            sources: Files on the NAS
+
+        Returns:
+            Paths to read, in the same order
+        """
+        paths = []
+        for source in sources:
+            try:
+                paths.append(self.fetch(source))
+            except OSError as e:
+                logger.warning(f"Read cache unavailable for {source}: {e}")
+                paths.append(Path(source))
+        return paths
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        """(mtime, size, path) of every cached file."""
+        entries = []
+        with os.scandir(self.cache_dir) as buckets:
+            for bucket in buckets:
+                if not bucket.is_dir():
+                    continue
+                with os.scandir(bucket.path) as files:
+                    for f in files:
+                        if f.name.startswith(_TMP_PREFIX):
+                            continue
+                        try:
+                            st = f.stat()
+                        except FileNotFoundError:
+                            continue
+                        entries.append((st.st_mtime, st.st_size, f.path))
+        return entries
+
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until the cache fits in max_bytes.
+
+        Files still memory-mapped by a reader stay readable until unmapped.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock, open(self.cache_dir / _LOCK_FILE, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                removed += 1
+            self._approx_bytes = total
+        if removed:
+            logger.debug(f"Read cache: evicted {removed} files, {total / 1e9:.1f} GB remain")
+        return removed
+
+    def size_bytes(self) -> int:
+        """Total size of the cached files."""
+        return sum(size for _, size, _ in self._entries())
+
+
+_read_cache: Optional[ReadCache] = None
+
+
+def configure_read_cache(cache_dir: Optional[Path], max_bytes: int = DEFAULT_MAX_BYTES) -> Optional[ReadCache]:
+    """
+    Set (or with cache_dir=None, disable) the process-wide read cache used by the data loaders.
+
+    Args:
+        cache_dir: Local cache directory
+        max_bytes: Size bound
+
+    Returns:
+        The active ReadCache, or None
+    """
+    global _read_cache
+    if cache_dir is None:
+        _read_cache = None
+    elif _read_cache is None or _read_cache.cache_dir != Path(cache_dir) or _read_cache.max_bytes != max_bytes:
+        _read_cache = ReadCache(Path(cache_dir), max_bytes)
+    return _read_cache
+
+
+def get_read_cache() -> Optional[ReadCache]:
+    """The process-wide read cache, if configured."""
+    return _read_cache